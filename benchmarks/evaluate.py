@@ -0,0 +1,97 @@
+"""
+Extraction quality-vs-cost evaluation.
+
+Runs the generation pipeline over a directory of golden transcripts (each with a
+`<name>.expected.json` annotation) for every combination of prompt type, model
+and chunk size, and prints recall/precision against latency, tokens and GPU
+time, marking the Pareto-optimal configurations. Run from the repository root:
+
+    python benchmarks/evaluate.py data/golden --models llama3.2:3b llama3:latest --record data/golden/responses.jsonl.gz
+    python benchmarks/evaluate.py data/golden --models llama3.2:3b llama3:latest --replay data/golden/responses.jsonl.gz --min-recall 0.8
+
+With --replay no model is called, so the same sweep can run in CI and fail when
+recall or precision drops below the given floor.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clarity.agents.replay import RecordingAgent, ReplayAgent  # noqa: E402
+from clarity.cassette import Cassette  # noqa: E402
+from clarity.config import Config  # noqa: E402
+from clarity.evaluation import SCORERS, Evaluator, format_table  # noqa: E402
+from clarity.prompt import PromptType  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("directory", help="Directory of golden transcripts.")
+    parser.add_argument(
+        "--prompts", nargs="+", default=["B"], choices=[p.value for p in PromptType]
+    )
+    parser.add_argument("--models", nargs="+", help="Defaults to MODEL_NAME.")
+    parser.add_argument(
+        "--chunks",
+        nargs="+",
+        type=int,
+        default=[0],
+        help="TRANSCRIPT_CHUNK_CHARS values (0 = whole transcript).",
+    )
+    parser.add_argument("--scorer", choices=sorted(SCORERS), default="fuzzy")
+    parser.add_argument("--threshold", type=float, help="Minimum match score.")
+    recording = parser.add_mutually_exclusive_group()
+    recording.add_argument(
+        "--record", metavar="CASSETTE", help="Record live responses to a cassette."
+    )
+    recording.add_argument(
+        "--replay", metavar="CASSETTE", help="Serve responses from a cassette."
+    )
+    parser.add_argument("--json", metavar="PATH", help="Also write results as JSON.")
+    parser.add_argument("--min-recall", type=float, default=0.0)
+    parser.add_argument("--min-precision", type=float, default=0.0)
+    args = parser.parse_args()
+
+    config = Config()
+    models = args.models or [config.MODEL_NAME]
+
+    if args.replay:
+        cassette = Cassette(args.replay)
+        agent_factory = lambda model: ReplayAgent(cassette, model)
+    else:
+        from clarity.agents.ollama import OllamaAgent
+
+        cassette = Cassette(args.record) if args.record else None
+        agent_factory = lambda model: (
+            RecordingAgent(OllamaAgent(config, model_name=model), cassette)
+            if cassette is not None
+            else OllamaAgent(config, model_name=model)
+        )
+
+    evaluator = Evaluator(
+        config, args.directory, agent_factory, args.scorer, args.threshold
+    )
+    results = evaluator.run([PromptType(p) for p in args.prompts], models, args.chunks)
+
+    print()
+    print(format_table(results))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump([r.to_dict() for r in results], f, indent=2)
+
+    regressions = [
+        r
+        for r in results
+        if r.recall < args.min_recall or r.precision < args.min_precision
+    ]
+    if regressions:
+        print(f"\n{len(regressions)} configurations below the quality floor.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
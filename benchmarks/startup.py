@@ -0,0 +1,100 @@
+"""
+Startup-time benchmark.
+
+Measures how long each clarity module takes to import in a fresh interpreter,
+which is what a short CLI invocation or a watch-mode restart pays before doing
+any work. Run from the repository root:
+
+    python benchmarks/startup.py
+    python benchmarks/startup.py --runs 10 --modules clarity.manager clarity.clients.plane
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import List
+
+DEFAULT_MODULES = [
+    "clarity.config",
+    "clarity.log",
+    "clarity.work_item",
+    "clarity.parse",
+    "clarity.storage",
+    "clarity.jobs",
+    "clarity.manager",
+    "clarity.service",
+    "clarity.agents.ollama",
+    "clarity.clients.plane",
+    "clarity.clients.azure",
+]
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TIMER = (
+    "import time; start = time.perf_counter(); import {module}; "
+    "print(time.perf_counter() - start)"
+)
+
+
+def time_import(module: str, runs: int) -> List[float]:
+    """Imports `module` in `runs` fresh interpreters and returns the timings (seconds)."""
+    timings = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", TIMER.format(module=module)],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Importing {module} failed:\n{result.stderr.strip()}")
+        timings.append(float(result.stdout.strip()))
+    return timings
+
+
+def heaviest_imports(module: str, top: int) -> List[str]:
+    """Returns the `top` slowest transitive imports of `module` by cumulative time."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, self_us, cumulative_us, name = [part.strip() for part in line.split("|")]
+        rows.append((int(cumulative_us), name.strip()))
+
+    rows.sort(reverse=True)
+    return [f"{cumulative / 1000:8.1f} ms  {name}" for cumulative, name in rows[:top]]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--modules", nargs="+", default=DEFAULT_MODULES)
+    parser.add_argument(
+        "--top", type=int, default=0, help="Also list the N heaviest imports."
+    )
+    args = parser.parse_args()
+
+    print(f"{'module':<28} {'median':>10} {'min':>10} {'max':>10}")
+    for module in args.modules:
+        timings = time_import(module, args.runs)
+        print(
+            f"{module:<28} "
+            f"{statistics.median(timings) * 1000:>8.1f}ms "
+            f"{min(timings) * 1000:>8.1f}ms "
+            f"{max(timings) * 1000:>8.1f}ms"
+        )
+        if args.top:
+            for line in heaviest_imports(module, args.top):
+                print(f"    {line}")
+
+
+if __name__ == "__main__":
+    main()
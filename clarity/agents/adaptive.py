@@ -0,0 +1,178 @@
+import threading
+import time
+from typing import Dict, Optional
+
+from clarity.agents.interface import GenerationStats, IAgent
+from clarity.config import Config
+from clarity.log import logger
+from clarity.prompt import PromptType
+
+
+class AdaptiveLimiter:
+    """
+    An AIMD concurrency limit for one model host.
+
+    Each completed request is compared against the best latency seen so far for
+    its model (per output token when the backend reports token counts, so long
+    and short answers are comparable). While latency stays within `tolerance` times that
+    baseline the limit grows by roughly one per window of requests; when
+    latency degrades, or a request fails, the limit is cut multiplicatively.
+    The limit therefore settles near the point where extra concurrency stops
+    adding throughput and starts adding queueing.
+    """
+
+    _instances: Dict[str, "AdaptiveLimiter"] = {}
+    _instances_lock = threading.Lock()
+
+    # Let the baseline creep upwards slowly so it recovers from a lucky outlier
+    # or a model change that makes every request slower
+    BASELINE_DRIFT = 0.05
+
+    def __init__(
+        self,
+        host: str,
+        initial: int = 2,
+        minimum: int = 1,
+        maximum: int = 8,
+        tolerance: float = 2.0,
+        backoff: float = 0.75,
+    ):
+        self.host = host
+        self.minimum = minimum
+        self.maximum = maximum
+        self.tolerance = tolerance
+        self.backoff = backoff
+
+        self.limit = float(max(minimum, min(initial, maximum)))
+        self.in_flight = 0
+        # Best latency per model, since models sharing a host differ in speed
+        self.baselines: Dict[str, float] = {}
+        self.last_latency = 0.0
+        self.tokens_per_second = 0.0
+
+        self._cond = threading.Condition()
+
+    @classmethod
+    def for_host(cls, host: str, config: Config) -> "AdaptiveLimiter":
+        """Returns the shared limiter for `host`, creating it on first use."""
+        with cls._instances_lock:
+            instance = cls._instances.get(host)
+            if instance is None:
+                instance = cls(
+                    host,
+                    initial=config.OLLAMA_INITIAL_CONCURRENCY,
+                    minimum=config.OLLAMA_MIN_CONCURRENCY,
+                    maximum=config.OLLAMA_MAX_CONCURRENCY,
+                    tolerance=config.OLLAMA_LATENCY_TOLERANCE,
+                )
+                cls._instances[host] = instance
+            return instance
+
+    @classmethod
+    def all_metrics(cls) -> Dict[str, dict]:
+        with cls._instances_lock:
+            limiters = list(cls._instances.values())
+        return {limiter.host: limiter.metrics() for limiter in limiters}
+
+    def acquire(self) -> None:
+        """Blocks until a request slot is free under the current limit."""
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(
+        self,
+        latency: float,
+        ok: bool,
+        stats: Optional[GenerationStats] = None,
+        model: str = "",
+    ) -> None:
+        """
+        Frees a slot and adjusts the limit from the request's outcome. The latency
+        is compared with the baseline of `stats.model`, or `model` without stats.
+        """
+        with self._cond:
+            self.in_flight -= 1
+            self.last_latency = latency
+
+            if not ok:
+                self._decrease("request failed")
+            else:
+                sample = latency
+                if stats is not None and stats.output_tokens > 0:
+                    sample = latency / stats.output_tokens
+                    if stats.tokens_per_second:
+                        self.tokens_per_second = stats.tokens_per_second
+
+                key = stats.model if stats is not None else model
+                baseline = self.baselines.get(key)
+                if baseline is None or sample < baseline:
+                    baseline = sample
+                else:
+                    baseline += (sample - baseline) * self.BASELINE_DRIFT
+                self.baselines[key] = baseline
+
+                if sample > baseline * self.tolerance:
+                    self._decrease(f"latency {latency:.1f}s above baseline")
+                else:
+                    self.limit = min(self.maximum, self.limit + 1 / self.limit)
+
+            self._cond.notify_all()
+
+    def metrics(self) -> dict:
+        with self._cond:
+            return {
+                "limit": int(self.limit),
+                "in_flight": self.in_flight,
+                "baselines": dict(self.baselines),
+                "last_latency": self.last_latency,
+                "tokens_per_second": self.tokens_per_second,
+            }
+
+    def _decrease(self, reason: str) -> None:
+        previous = int(self.limit)
+        self.limit = max(self.minimum, self.limit * self.backoff)
+        if int(self.limit) < previous:
+            logger.info(
+                f"Concurrency limit for {self.host} lowered to {int(self.limit)} ({reason})."
+            )
+
+
+class AdaptiveAgent(IAgent):
+    """
+    Wraps an agent so the number of in-flight generations against its host is
+    governed by an AdaptiveLimiter rather than a fixed setting.
+    """
+
+    def __init__(self, agent: IAgent, config: Config) -> None:
+        self.agent = agent
+        self.model_name: str = agent.model_name
+
+        self.host = getattr(agent, "host", agent.model_name)
+        self.limiter = AdaptiveLimiter.for_host(self.host, config)
+
+    def generate_work_items(
+        self,
+        prompt: str,
+        transcript: str,
+        prompt_type: Optional[PromptType] = None,
+    ) -> str:
+        self.limiter.acquire()
+        start = time.monotonic()
+        response = ""
+
+        try:
+            response = self.agent.generate_work_items(prompt, transcript, prompt_type)
+            return response
+        finally:
+            # The agent returns an empty string when the backend call failed
+            self.limiter.release(
+                time.monotonic() - start,
+                ok=bool(response),
+                stats=self.agent.last_stats(),
+                model=self.model_name,
+            )
+
+    def last_stats(self) -> Optional[GenerationStats]:
+        return self.agent.last_stats()
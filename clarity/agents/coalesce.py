@@ -0,0 +1,129 @@
+import hashlib
+import threading
+from typing import Callable, Dict, Generic, Optional, Tuple, TypeVar
+
+from clarity.agents.interface import GenerationStats, IAgent
+from clarity.log import logger
+from clarity.prompt import PromptType
+from clarity.scheduler import SharedPriority, current_request_class, shared_priority
+
+T = TypeVar("T")
+
+
+def request_key(*parts: str) -> str:
+    """
+    The content hash identifying a request by its parts, e.g. model, prompt and
+    transcript. Two generation requests with the same key would produce the same
+    response, so they can share one generation or one recorded response.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class _Call(Generic[T]):
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: T
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight(Generic[T]):
+    """
+    Deduplicates concurrent calls by key: the first caller runs the function and
+    every caller that arrives while it is in flight waits for and shares its result
+    (or exception). Nothing is cached once the call completes.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[str, _Call[T]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], T]) -> Tuple[T, bool]:
+        """Returns the result and whether it was shared with an in-flight call."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result, False
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+
+class CoalescingAgent(IAgent):
+    """
+    Wraps an agent so identical concurrent requests (same model, prompt and
+    transcript) share one in-flight generation instead of each using the GPU.
+
+    Coalescing sits outside the scheduler, so waiting callers hold no slot. The
+    shared generation is scheduled at the highest priority class among its
+    callers, and is promoted if a more urgent caller joins while it queues.
+    """
+
+    def __init__(self, agent: IAgent) -> None:
+        self.agent = agent
+        self.model_name: str = agent.model_name
+        self.flight: SingleFlight[str] = SingleFlight()
+
+        self._priorities: Dict[str, SharedPriority] = {}
+        self._priorities_lock = threading.Lock()
+
+    def generate_work_items(
+        self,
+        prompt: str,
+        transcript: str,
+        prompt_type: Optional[PromptType] = None,
+    ) -> str:
+        key = request_key(self.agent.model_name, prompt, transcript)
+        priority, _ = current_request_class()
+
+        with self._priorities_lock:
+            request_priority = self._priorities.setdefault(
+                key, SharedPriority(priority)
+            )
+        request_priority.raise_to(priority)
+
+        def generate() -> str:
+            try:
+                with shared_priority(request_priority):
+                    return self.agent.generate_work_items(
+                        prompt, transcript, prompt_type
+                    )
+            finally:
+                with self._priorities_lock:
+                    if self._priorities.get(key) is request_priority:
+                        del self._priorities[key]
+
+        response, shared = self.flight.do(key, generate)
+
+        if shared:
+            logger.info(
+                f"Reused in-flight generation for identical request {key[:12]}."
+            )
+        return response
+
+    def last_stats(self) -> Optional[GenerationStats]:
+        return self.agent.last_stats()
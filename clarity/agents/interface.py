@@ -1,7 +1,58 @@
 from abc import ABC, abstractmethod
+from typing import Optional
+
+from clarity.prompt import PromptType
+
+
+class GenerationStats:
+    """Token counts and timings reported by the backend for one generation."""
+
+    def __init__(
+        self,
+        model: str,
+        prompt_tokens: int = 0,
+        output_tokens: int = 0,
+        prompt_seconds: float = 0.0,
+        output_seconds: float = 0.0,
+        total_seconds: float = 0.0,
+    ):
+        self.model = model
+        self.prompt_tokens = prompt_tokens
+        self.output_tokens = output_tokens
+        self.prompt_seconds = prompt_seconds
+        self.output_seconds = output_seconds
+        self.total_seconds = total_seconds
+
+    @property
+    def gpu_seconds(self) -> float:
+        """Time the model spent evaluating the prompt and generating output."""
+        return self.prompt_seconds + self.output_seconds
+
+    @property
+    def tokens_per_second(self) -> float:
+        if self.output_seconds <= 0:
+            return 0.0
+        return self.output_tokens / self.output_seconds
 
 
 class IAgent(ABC):
+    model_name: str
+
     @abstractmethod
-    def generate_work_items(self, prompt: str, transcript: str) -> str:
-        """Sends the transcript and prompt to the local Ollama API using the OllamaAgent."""
+    def generate_work_items(
+        self,
+        prompt: str,
+        transcript: str,
+        prompt_type: Optional[PromptType] = None,
+    ) -> str:
+        """
+        Sends the transcript and prompt to the local Ollama API using the OllamaAgent.
+        `prompt_type` identifies the prompt for agents that route on it.
+        """
+
+    def last_stats(self) -> Optional[GenerationStats]:
+        """
+        Returns the stats of the most recent generation made by the calling thread,
+        or None if the backend does not report them.
+        """
+        return None
@@ -1,25 +1,39 @@
+import threading
+from typing import Optional
+
 import ollama
 from ollama import Client
 
-from clarity.agents.interface import IAgent
+from clarity.agents.interface import GenerationStats, IAgent
 from clarity.config import Config
-from clarity.work_item import WorkItemList
+from clarity.work_item import WorkItemList, cached_json_schema
 from clarity.log import logger
+from clarity.prompt import PromptType
 
 
 class OllamaAgent(IAgent):
-    def __init__(self, config: Config) -> None:
-        self.model_name: str = config.MODEL_NAME
+    def __init__(self, config: Config, model_name: Optional[str] = None) -> None:
+        self.model_name: str = model_name or config.MODEL_NAME
 
         ollama_client = Client(host=config.OLLAMA_HOST_URL)
         self.client: Client = ollama_client
+        self.host: str = config.OLLAMA_HOST_URL
+
+        # Stats are kept per thread so concurrent callers each see their own
+        self._local = threading.local()
 
-    def generate_work_items(self, prompt: str, transcript: str) -> str:
+    def generate_work_items(
+        self,
+        prompt: str,
+        transcript: str,
+        prompt_type: Optional[PromptType] = None,
+    ) -> str:
         """Sends the transcript and prompt to the local Ollama API using the OllamaAgent."""
         # 3. Use the imported 'logger' directly
         logger.info(f"Sending transcript to {self.model_name} for analysis...")
 
         raw_json_string = ""
+        self._local.stats = None
 
         try:
             messages = [
@@ -30,13 +44,21 @@ class OllamaAgent(IAgent):
             response = self.client.chat(
                 model=self.model_name,
                 messages=messages,
-                format=WorkItemList.model_json_schema(),
+                format=cached_json_schema(WorkItemList),
                 options={
                     "temperature": 0,
                 },
             )
 
             raw_json_string = response["message"]["content"].strip()
+            self._local.stats = GenerationStats(
+                model=self.model_name,
+                prompt_tokens=response.get("prompt_eval_count") or 0,
+                output_tokens=response.get("eval_count") or 0,
+                prompt_seconds=(response.get("prompt_eval_duration") or 0) / 1e9,
+                output_seconds=(response.get("eval_duration") or 0) / 1e9,
+                total_seconds=(response.get("total_duration") or 0) / 1e9,
+            )
             # 4. Use logger.success
             logger.success("Ollama analysis completed successfully.")
 
@@ -51,3 +73,6 @@ class OllamaAgent(IAgent):
             )
 
         return raw_json_string
+
+    def last_stats(self) -> Optional[GenerationStats]:
+        return getattr(self._local, "stats", None)
@@ -0,0 +1,103 @@
+import threading
+import time
+from typing import Optional
+
+from clarity.agents.coalesce import request_key
+from clarity.agents.interface import GenerationStats, IAgent
+from clarity.cassette import Cassette, replay_delay
+from clarity.log import logger
+from clarity.prompt import PromptType
+
+
+class RecordingAgent(IAgent):
+    """
+    Wraps an agent and records every successful generation, with its latency and
+    backend stats, to a cassette keyed by model, prompt and transcript.
+    """
+
+    def __init__(self, agent: IAgent, cassette: Cassette) -> None:
+        self.agent = agent
+        self.cassette = cassette
+        self.model_name: str = agent.model_name
+        self.host = getattr(agent, "host", agent.model_name)
+        self.limiter = getattr(agent, "limiter", None)
+
+    def generate_work_items(
+        self,
+        prompt: str,
+        transcript: str,
+        prompt_type: Optional[PromptType] = None,
+    ) -> str:
+        start = time.monotonic()
+        response = self.agent.generate_work_items(prompt, transcript, prompt_type)
+        latency = time.monotonic() - start
+
+        if response:
+            stats = self.agent.last_stats()
+            self.cassette.record(
+                request_key(self.model_name, prompt, transcript),
+                {
+                    "kind": "agent",
+                    "model": self.model_name,
+                    "response": response,
+                    "latency": latency,
+                    "stats": vars(stats) if stats is not None else None,
+                },
+            )
+
+        return response
+
+    def last_stats(self) -> Optional[GenerationStats]:
+        return self.agent.last_stats()
+
+
+class ReplayAgent(IAgent):
+    """
+    Serves generations from a cassette instead of a model backend, reporting the
+    recorded latency and stats. A request that was never recorded fails the way a
+    backend error does, with an empty response.
+
+    `model_name` defaults to the first model in the cassette. With a `speed` above
+    0 each response is delayed by its recorded latency divided by `speed`.
+    """
+
+    def __init__(
+        self, cassette: Cassette, model_name: Optional[str] = None, speed: float = 0.0
+    ) -> None:
+        if model_name is None:
+            recorded = cassette.entries("agent")
+            model_name = recorded[0]["model"] if recorded else "replay"
+
+        self.cassette = cassette
+        self.model_name: str = model_name
+        self.speed = speed
+        self._local = threading.local()
+
+    def generate_work_items(
+        self,
+        prompt: str,
+        transcript: str,
+        prompt_type: Optional[PromptType] = None,
+    ) -> str:
+        key = request_key(self.model_name, prompt, transcript)
+        entry = self.cassette.get(key)
+        self._local.stats = None
+
+        if entry is None:
+            logger.error(
+                f"No recorded response for request {key[:12]} on {self.model_name}."
+            )
+            return ""
+
+        replay_delay(entry, self.speed)
+
+        if entry.get("stats"):
+            self._local.stats = GenerationStats(**entry["stats"])
+        else:
+            self._local.stats = GenerationStats(
+                self.model_name, total_seconds=entry["latency"]
+            )
+        return entry["response"]
+
+    def last_stats(self) -> Optional[GenerationStats]:
+        return getattr(self._local, "stats", None)
@@ -0,0 +1,203 @@
+import threading
+from typing import TYPE_CHECKING, Callable, Dict, FrozenSet, List, Optional
+
+from pydantic import ValidationError
+
+from clarity.agents.interface import GenerationStats, IAgent
+from clarity.config import Config
+from clarity.log import logger
+from clarity.prompt import PromptType
+from clarity.work_item import WorkItemList
+
+if TYPE_CHECKING:
+    from clarity.agents.adaptive import AdaptiveLimiter
+
+# Rough characters-per-token ratio for English text; close enough to bucket transcripts
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+class ModelRoute:
+    """One row of the routing table: a model and the requests it may serve."""
+
+    def __init__(
+        self,
+        model: str,
+        max_tokens: Optional[int],
+        prompt_types: Optional[FrozenSet[PromptType]] = None,
+    ):
+        self.model = model
+        self.max_tokens = max_tokens
+        self.prompt_types = prompt_types
+
+    def accepts(self, tokens: int, prompt_type: Optional[PromptType]) -> bool:
+        if self.max_tokens is not None and tokens > self.max_tokens:
+            return False
+        if self.prompt_types is not None and prompt_type not in self.prompt_types:
+            return False
+        return True
+
+    def __repr__(self) -> str:
+        return f"ModelRoute({self.model!r}, max_tokens={self.max_tokens})"
+
+
+def parse_routes(spec: str) -> List[ModelRoute]:
+    """
+    Parses a routing table such as
+
+        "A|B/2000=llama3.2:3b; 8000=llama3:latest; *=llama3:70b"
+
+    Entries are `[PROMPT_TYPES/]MAX_TOKENS=MODEL`, separated by semicolons and
+    ordered from smallest to largest model. `*` means no token limit, and the
+    optional `A|B/` prefix restricts an entry to those prompt types.
+    """
+    routes = []
+
+    for entry in spec.split(";"):
+        entry = entry.strip()
+        if not entry:
+            continue
+
+        condition, _, model = entry.partition("=")
+        if not model.strip():
+            raise ValueError(f"Invalid model route '{entry}': expected LIMIT=MODEL.")
+
+        prompt_types = None
+        if "/" in condition:
+            types, _, condition = condition.partition("/")
+            prompt_types = frozenset(PromptType(t.strip()) for t in types.split("|"))
+
+        condition = condition.strip()
+        max_tokens = None if condition == "*" else int(condition)
+        routes.append(ModelRoute(model.strip(), max_tokens, prompt_types))
+
+    return routes
+
+
+class RoutingAgent(IAgent):
+    """
+    Picks a model per request from a routing table, by estimated transcript token
+    count and prompt type, so short transcripts run on a small model and long
+    ones on a large one.
+
+    With escalation enabled, a response that fails validation or contains no
+    work items is retried on the next larger eligible model in the table.
+
+    `limiter` is the adaptive limiter the per-model agents acquire for each
+    attempt, if any, so wrappers can follow its limit.
+    """
+
+    def __init__(
+        self,
+        routes: List[ModelRoute],
+        agent_factory: Callable[[str], IAgent],
+        escalate: bool = True,
+        host: str = "",
+    ) -> None:
+        if not routes:
+            raise ValueError("RoutingAgent needs at least one model route.")
+
+        self.routes = routes
+        self.escalate = escalate
+        self.host = host
+        self.limiter: Optional["AdaptiveLimiter"] = None
+        self.model_name: str = "router(" + "|".join(r.model for r in routes) + ")"
+
+        self._agent_factory = agent_factory
+        self._agents: Dict[str, IAgent] = {}
+        self._agents_lock = threading.Lock()
+        self._local = threading.local()
+
+    @staticmethod
+    def from_config(config: Config) -> "RoutingAgent":
+        from clarity.agents.adaptive import AdaptiveAgent, AdaptiveLimiter
+        from clarity.agents.ollama import OllamaAgent
+
+        def agent_for(model: str) -> IAgent:
+            agent: IAgent = OllamaAgent(config, model_name=model)
+            # Limit each attempt on its own model, so every escalation is timed
+            # separately and against that model's latency baseline
+            if config.ADAPTIVE_CONCURRENCY:
+                agent = AdaptiveAgent(agent, config)
+            return agent
+
+        router = RoutingAgent(
+            parse_routes(config.MODEL_ROUTES),
+            agent_for,
+            escalate=config.MODEL_ESCALATE,
+            host=config.OLLAMA_HOST_URL,
+        )
+        if config.ADAPTIVE_CONCURRENCY:
+            router.limiter = AdaptiveLimiter.for_host(config.OLLAMA_HOST_URL, config)
+        return router
+
+    def generate_work_items(
+        self,
+        prompt: str,
+        transcript: str,
+        prompt_type: Optional[PromptType] = None,
+    ) -> str:
+        tokens = estimate_tokens(transcript)
+
+        candidates = self._candidates(tokens, prompt_type)
+        if not self.escalate:
+            candidates = candidates[:1]
+
+        response = ""
+        self._local.agent = None
+
+        for attempt, route in enumerate(candidates):
+            if attempt:
+                logger.warning(f"Escalating generation to larger model {route.model}.")
+            else:
+                logger.info(
+                    f"Routing ~{tokens} token request (prompt {prompt_type.value if prompt_type else '?'}) "
+                    f"to {route.model}."
+                )
+
+            agent = self._agent(route.model)
+            self._local.agent = agent
+            response = agent.generate_work_items(prompt, transcript, prompt_type)
+
+            if self._acceptable(response):
+                return response
+
+        return response
+
+    def last_stats(self) -> Optional[GenerationStats]:
+        agent = getattr(self._local, "agent", None)
+        return agent.last_stats() if agent is not None else None
+
+    def _candidates(
+        self, tokens: int, prompt_type: Optional[PromptType]
+    ) -> List[ModelRoute]:
+        for index, route in enumerate(self.routes):
+            if route.accepts(tokens, prompt_type):
+                # The chosen route plus every larger one that can still take the request
+                return [route] + [
+                    r
+                    for r in self.routes[index + 1 :]
+                    if r.accepts(tokens, prompt_type)
+                ]
+
+        # Nothing fits: fall back to the largest model rather than failing
+        logger.warning(f"No model route accepts ~{tokens} tokens; using largest model.")
+        return [self.routes[-1]]
+
+    def _agent(self, model: str) -> IAgent:
+        with self._agents_lock:
+            if model not in self._agents:
+                self._agents[model] = self._agent_factory(model)
+            return self._agents[model]
+
+    @staticmethod
+    def _acceptable(response: str) -> bool:
+        if not response:
+            return False
+        try:
+            return bool(WorkItemList.model_validate_json(response).work_items)
+        except (ValidationError, ValueError):
+            return False
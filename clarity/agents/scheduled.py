@@ -0,0 +1,39 @@
+from typing import Optional
+
+from clarity.agents.interface import GenerationStats, IAgent
+from clarity.config import Config
+from clarity.prompt import PromptType
+from clarity.scheduler import FairScheduler, current_request_class
+
+
+class ScheduledAgent(IAgent):
+    """
+    Wraps an agent so every generation waits for a FairScheduler slot on its
+    host, in the priority class and tenant set by `request_class` for the caller.
+
+    When the wrapped agent is governed by an adaptive limiter, the scheduler's
+    capacity follows the limiter's current limit so requests queue (and are
+    ordered) here rather than inside the limiter.
+    """
+
+    def __init__(self, agent: IAgent, config: Config) -> None:
+        self.agent = agent
+        self.model_name: str = agent.model_name
+        self.host = getattr(agent, "host", agent.model_name)
+
+        limiter = getattr(agent, "limiter", None)
+        capacity = (lambda: int(limiter.limit)) if limiter is not None else None
+        self.scheduler = FairScheduler.for_host(self.host, config, capacity)
+
+    def generate_work_items(
+        self,
+        prompt: str,
+        transcript: str,
+        prompt_type: Optional[PromptType] = None,
+    ) -> str:
+        priority, tenant = current_request_class()
+        with self.scheduler.slot(priority, tenant):
+            return self.agent.generate_work_items(prompt, transcript, prompt_type)
+
+    def last_stats(self) -> Optional[GenerationStats]:
+        return self.agent.last_stats()
@@ -0,0 +1,27 @@
+from typing import Optional
+
+from clarity.agents.interface import IAgent
+from clarity.log import logger
+from clarity.prompt import PromptType
+from clarity.work_item import WorkItem, WorkItemList
+
+
+class StubAgent(IAgent):
+    """
+    An offline agent that returns a fixed set of dummy work items.
+    Used to exercise the pipeline without a running Ollama server.
+    """
+
+    def __init__(self, item_count: int = 3) -> None:
+        self.model_name: str = "stub"
+        self.item_count = item_count
+
+    def generate_work_items(
+        self,
+        prompt: str,
+        transcript: str,
+        prompt_type: Optional[PromptType] = None,
+    ) -> str:
+        logger.info(f"Stub agent generating {self.item_count} work items.")
+        work_items = [WorkItem.create_dummy_item() for _ in range(self.item_count)]
+        return WorkItemList(work_items=work_items).model_dump_json()
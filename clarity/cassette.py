@@ -0,0 +1,139 @@
+import atexit
+import gzip
+import json
+import os
+import threading
+import time
+from typing import IO, Dict, List, Optional
+
+
+def replay_delay(entry: dict, speed: float) -> None:
+    """
+    Sleeps for the entry's recorded latency divided by `speed`: 1.0 replays at the
+    original timing, 10.0 ten times faster, and 0 without any delay.
+    """
+    if speed > 0:
+        time.sleep(entry.get("latency", 0.0) / speed)
+
+
+class Cassette:
+    """
+    Recorded agent and client requests with their responses and latencies, kept
+    as JSON lines (gzip-compressed when the path ends in `.gz`) and looked up by a
+    content hash of the request.
+
+    Entries are appended to one open stream and flushed as they are recorded, so
+    an interrupted recording keeps everything captured up to that point. A
+    compressed cassette stays a single gzip stream: a later session recording
+    into it rewrites the existing entries into its new stream.
+
+    A key recorded more than once (the same request made repeatedly) replays its
+    entries in recording order, repeating the last one once they are used up.
+    """
+
+    _instances: Dict[str, "Cassette"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: str):
+        self.path = path
+        self._log: List[dict] = []
+        self._entries: Dict[str, List[dict]] = {}
+        self._played: Dict[str, int] = {}
+        self._writer: Optional[IO[str]] = None
+        self._truncated = False
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+        if os.path.exists(path):
+            with self._open("rt") as f:
+                try:
+                    for line in f:
+                        if line.strip():
+                            self._add(json.loads(line))
+                except EOFError:
+                    # A recording that was never closed lacks the gzip trailer;
+                    # every flushed entry before it is still intact
+                    self._truncated = True
+
+    @classmethod
+    def for_path(cls, path: str) -> "Cassette":
+        """Returns the shared cassette for `path`, creating it on first use."""
+        path = os.path.abspath(path)
+        with cls._instances_lock:
+            instance = cls._instances.get(path)
+            if instance is None:
+                instance = cls(path)
+                cls._instances[path] = instance
+            return instance
+
+    def get(self, key: str) -> Optional[dict]:
+        """Returns the next recorded entry for `key`, or None if it was not recorded."""
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                return None
+
+            played = self._played.get(key, 0)
+            self._played[key] = played + 1
+            return entries[min(played, len(entries) - 1)]
+
+    def record(self, key: str, entry: dict) -> None:
+        entry = {"key": key, **entry}
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+
+        with self._lock:
+            if self._writer is None:
+                self._writer = self._open_writer()
+
+            self._add(entry)
+            self._writer.write(line)
+            # For .gz files this is a sync flush: the entry reaches the disk
+            # without ending the compressed stream
+            self._writer.flush()
+
+    def close(self) -> None:
+        """Finishes the recording stream. Later records reopen it."""
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+    def entries(self, kind: Optional[str] = None) -> List[dict]:
+        """Recorded entries in recording order, optionally only those of one kind."""
+        with self._lock:
+            return [
+                entry
+                for entry in self._log
+                if kind is None or entry.get("kind") == kind
+            ]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._log)
+
+    def _add(self, entry: dict) -> None:
+        self._log.append(entry)
+        self._entries.setdefault(entry["key"], []).append(entry)
+
+    def _open_writer(self) -> IO[str]:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        compressed = self.path.endswith(".gz") and os.path.exists(self.path)
+        if not (self._truncated or compressed):
+            return self._open("at")
+
+        # Appending to a gzip file would start a new member (or, after an
+        # unterminated stream, corrupt it), so the entries loaded from it are
+        # rewritten as one fresh stream first
+        writer = self._open("wt")
+        for entry in self._log:
+            writer.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._truncated = False
+        return writer
+
+    def _open(self, mode: str) -> IO[str]:
+        if self.path.endswith(".gz"):
+            return gzip.open(self.path, mode, encoding="utf-8")
+        return open(self.path, mode, encoding="utf-8")
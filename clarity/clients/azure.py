@@ -1,13 +1,29 @@
+import re
+import threading
 import requests
-from typing import List
+from typing import Any, Dict, List, Optional
 
 from clarity.config import Config
 from clarity.work_item import WorkItem
 from clarity.log import logger
 from clarity.clients.interface import ClientEnum, IClient
+from clarity.clients.resilience import (
+    RETRYABLE_STATUS_CODES,
+    UNPROCESSED_STATUS_CODES,
+    CircuitOpenError,
+    Resilience,
+    RetryableError,
+    is_connection_refused,
+    parse_retry_after,
+)
 
 import os
 from azure.devops.connection import Connection
+from azure.devops.exceptions import (
+    AzureDevOpsAuthenticationError,
+    AzureDevOpsClientRequestError,
+)
+from msrest.exceptions import ClientRequestError
 from msrest.authentication import BasicAuthentication
 from azure.devops.v7_1.work_item_tracking.models import Wiql, JsonPatchOperation
 
@@ -16,6 +32,11 @@ class AzureClient(IClient):
     def __init__(self, config: Config):
         self.host_url: str = config.AZURE_HOST_URL
         self.pat: str = config.AZURE_PAT
+        self.resilience: Resilience = Resilience.for_host(self.host_url, config)
+        self.timeout: float = config.CLIENT_TIMEOUT
+        self._wit_clients: Dict[str, object] = {}
+        # Status and Retry-After of the last SDK response on each thread
+        self._last_response = threading.local()
 
         self.headers: dict = {
             "Content-Type": "application/json",
@@ -62,34 +83,92 @@ class AzureClient(IClient):
 
     def create_work_item(
         self, workspace: str, project: str, work_item: WorkItem, iteration: str
-    ) -> bool:
-        wit_client = self._get_wit_client(workspace)
-
+    ) -> Optional[str]:
         # 1. Generate the JSON Patch payload from the WorkItem model
         iteration = f"{project}\\{iteration}"
         patch_document: List[JsonPatchOperation] = work_item.to_azure_json_payload(
             iteration
         )
-        item_title = work_item.title
+        return self._create_from_patch(
+            workspace, project, patch_document, work_item.title
+        )
+
+    def _create_from_patch(
+        self,
+        workspace: str,
+        project: str,
+        patch_document: List[JsonPatchOperation],
+        item_title: str,
+    ) -> Optional[str]:
+        wit_client = self._get_wit_client(workspace)
 
         work_item_type = "Task"
 
         try:
             # 2. Call the create_work_item API
             # This method internally handles the JSON Patch payload and the correct API URL.
-            new_item = wit_client.create_work_item(
-                document=patch_document, project=project, type=work_item_type
+            # Creation is not idempotent: a resent request could duplicate the item
+            new_item = self.resilience.call(
+                self._call_sdk,
+                wit_client.create_work_item,
+                idempotent=False,
+                document=patch_document,
+                project=project,
+                type=work_item_type,
             )
 
             logger.success(
                 f"Created Azure DevOps {work_item_type} [{new_item.id}]: {new_item.fields['System.Title']}"
             )
-            return new_item
+            return str(new_item.id)
+
+        except CircuitOpenError as e:
+            logger.error(f"Skipped item '{item_title}': {e}")
+            return None
 
         except Exception as e:
             logger.error(
                 f"Failed to create item '{item_title}' as {work_item_type}. Error: {e}"
             )
+            return None
+
+    def sync_fields(
+        self, workspace: str, project: str, work_item: WorkItem, iteration: str
+    ) -> Dict[str, Any]:
+        patch_document = work_item.to_azure_json_payload(f"{project}\\{iteration}")
+        return {operation.path: operation.value for operation in patch_document}
+
+    def update_work_item(
+        self, workspace: str, project: str, remote_id: str, changes: Dict[str, Any]
+    ) -> bool:
+        """Sends a JSON Patch that replaces only the changed fields of an existing work item."""
+        wit_client = self._get_wit_client(workspace)
+
+        patch_document = [
+            JsonPatchOperation(op="replace", path=path, value=value)
+            for path, value in changes.items()
+        ]
+
+        try:
+            self.resilience.call(
+                self._call_sdk,
+                wit_client.update_work_item,
+                document=patch_document,
+                id=int(remote_id),
+                project=project,
+            )
+
+            logger.success(
+                f"Updated Azure DevOps item [{remote_id}]: {sorted(changes)}"
+            )
+            return True
+
+        except CircuitOpenError as e:
+            logger.error(f"Skipped update of [{remote_id}]: {e}")
+            return False
+
+        except Exception as e:
+            logger.error(f"Failed to update item [{remote_id}]. Error: {e}")
             return False
 
     def list_work_items(self, workspace: str, project: str):
@@ -169,8 +248,71 @@ class AzureClient(IClient):
             # In a real application, you might use logging.error(e) here.
 
     def _get_wit_client(self, workspace):
+        # Reuse one connection per organization instead of reconnecting per item
+        if workspace in self._wit_clients:
+            return self._wit_clients[workspace]
+
         credentials = BasicAuthentication("", self.pat)
 
         organization_url = f"{self.host_url}/{workspace}"
         connection = Connection(base_url=organization_url, creds=credentials)
-        return connection.clients.get_work_item_tracking_client()
+        wit_client = connection.clients.get_work_item_tracking_client()
+
+        self._configure_sdk_client(wit_client)
+        self._wit_clients[workspace] = wit_client
+        return wit_client
+
+    def _configure_sdk_client(self, sdk_client) -> None:
+        # Retries belong to the resilience layer, which sees the response status
+        # through the hook; the SDK's own policy would multiply its attempts and
+        # resend creates after any 5xx
+        retry_policy = sdk_client.config.retry_policy
+        retry_policy.retries = 0
+        retry_policy.policy.status_forcelist = []
+        sdk_client.config.hooks.append(self._remember_response)
+        if self.timeout > 0:
+            sdk_client.config.connection.timeout = self.timeout
+
+    def _remember_response(self, response: requests.Response, *args, **kwargs) -> None:
+        self._last_response.status = response.status_code
+        self._last_response.retry_after = parse_retry_after(
+            response.headers.get("Retry-After")
+        )
+
+    def _call_sdk(self, fn, *args, **kwargs):
+        """
+        Calls an Azure DevOps SDK method, translating transient failures into
+        RetryableError so the resilience layer can retry them.
+
+        The SDK raises the same exception types for every error status (a service
+        error whenever the body is a JSON WrappedException), so errors are classified
+        by the status and Retry-After of the response recorded by the hook.
+        """
+        self._last_response.status = None
+        self._last_response.retry_after = None
+
+        try:
+            return fn(*args, **kwargs)
+        except AzureDevOpsAuthenticationError:
+            # Auth failures will not succeed on retry
+            raise
+        except AzureDevOpsClientRequestError as e:
+            # Includes AzureDevOpsServiceError, e.g. for validation errors or throttling
+            status = self._last_response.status
+            if status is None:
+                match = re.search(r"returned a (\d{3}) status code", str(e))
+                status = int(match.group(1)) if match else None
+            if status in RETRYABLE_STATUS_CODES:
+                raise RetryableError(
+                    f"HTTP {status}: {e}",
+                    retry_after=self._last_response.retry_after,
+                    unprocessed=status in UNPROCESSED_STATUS_CODES,
+                )
+            raise
+        except (ClientRequestError, requests.exceptions.RequestException) as e:
+            # Connection-level failures (DNS, reset, timeout)
+            cause = getattr(e, "inner_exception", None) or e
+            raise RetryableError(
+                f"{e.__class__.__name__}: {e}",
+                unprocessed=is_connection_refused(cause),
+            )
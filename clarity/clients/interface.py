@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import List
+from typing import Any, Dict, List, Optional
 
 from clarity.work_item import WorkItem
 
@@ -8,6 +8,7 @@ from clarity.work_item import WorkItem
 class ClientEnum(Enum):
     AZURE = "Azure"
     PLANE = "Plane"
+    STUB = "Stub"
 
 
 class IClient(ABC):
@@ -25,3 +26,37 @@ class IClient(ABC):
         Returns: True if all items were created successfully, False otherwise.
         """
         pass
+
+    @abstractmethod
+    def create_work_item(
+        self, workspace: str, project: str, work_item: WorkItem, iteration: str
+    ) -> Optional[str]:
+        """
+        Posts a single WorkItem to the Project Management Board API.
+
+        Returns: The remote ID of the created item, or None on failure.
+        """
+        pass
+
+    @abstractmethod
+    def sync_fields(
+        self, workspace: str, project: str, work_item: WorkItem, iteration: str
+    ) -> Dict[str, Any]:
+        """
+        Renders the remote fields this client would send for a WorkItem, keyed by the
+        name used when patching them. Used to diff regenerated items against the
+        fields last sent.
+        """
+        pass
+
+    @abstractmethod
+    def update_work_item(
+        self, workspace: str, project: str, remote_id: str, changes: Dict[str, Any]
+    ) -> bool:
+        """
+        Updates only the given fields (as returned by `sync_fields`) of an existing
+        remote item.
+
+        Returns: True if the update succeeded, False otherwise.
+        """
+        pass
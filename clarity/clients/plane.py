@@ -1,16 +1,19 @@
 import requests
-from typing import List, Any
+from typing import Dict, List, Any, Optional
 
 from clarity.config import Config
 from clarity.work_item import WorkItem
 from clarity.log import logger
 from clarity.clients.interface import ClientEnum, IClient
+from clarity.clients.plane_resolver import PlaneResolver
+from clarity.clients.resilience import CircuitOpenError, Resilience
 
 
 class PlaneClient(IClient):
     def __init__(self, config: Config):
         self.host_url: str = config.PLANE_HOST_URL.rstrip("/")
         self.api_token: str = config.PLANE_API_TOKEN
+        self.resilience: Resilience = Resilience.for_host(self.host_url, config)
 
         # Standard headers for Plane API requests
         self.headers: dict = {
@@ -18,6 +21,10 @@ class PlaneClient(IClient):
             "Content-Type": "application/json",
         }
 
+        self.resolver: Optional[PlaneResolver] = (
+            PlaneResolver(self, config) if config.PLANE_RESOLVE_FIELDS else None
+        )
+
     def name(self) -> ClientEnum:
         return ClientEnum.PLANE
 
@@ -55,10 +62,34 @@ class PlaneClient(IClient):
             return False
 
     def create_work_item(
-        self, workspace: str, project: str, work_item: WorkItem
-    ) -> bool:
+        self, workspace: str, project: str, work_item: WorkItem, _iteration: str = ""
+    ) -> Optional[str]:
+        payload = self._resolve_fields(
+            workspace, project, work_item.to_plane_json_payload(), work_item
+        )
+        return self._post_payload(workspace, project, payload)
+
+    def _resolve_fields(
+        self, workspace: str, project: str, payload: dict, work_item: WorkItem
+    ) -> dict:
+        """
+        Fills in resolved Plane fields. If resolution fails the payload is used
+        as is, like a field whose name cannot be resolved.
+        """
+        if self.resolver is None:
+            return payload
+
+        try:
+            return self.resolver.enrich(workspace, project, payload, work_item)
+        except Exception as e:
+            logger.warning(
+                f"Could not resolve Plane fields for '{work_item.title}': {e}"
+            )
+            return payload
 
-        payload = work_item.to_plane_json_payload()
+    def _post_payload(
+        self, workspace: str, project: str, payload: dict
+    ) -> Optional[str]:
         item_name = payload.get(
             "name", "Unknown Work Item"
         )  # Safer way to get name for logs
@@ -69,7 +100,9 @@ class PlaneClient(IClient):
         headers = self.headers
 
         try:
-            response = requests.post(url, headers=headers, json=payload)
+            response = self.resilience.request(
+                "POST", url, headers=headers, json=payload
+            )
 
             # The API returns the key/ID in 'name' or 'issue_key' depending on the version
             # Use 'name' for the log, or fall back to the provided title if response fails
@@ -77,8 +110,17 @@ class PlaneClient(IClient):
             work_item_name = response_data.get("name", item_name)
 
             if response.status_code == 201:
+                remote_id = response_data.get("id")
+                if not remote_id:
+                    # Without an ID the item cannot be checkpointed or updated later
+                    logger.error(
+                        f"Plane created '{work_item_name}' but returned no ID. "
+                        f"Response: {response.text[:200]}"
+                    )
+                    return None
+
                 logger.success(f"Created Plane work item: {work_item_name}")
-                return True
+                return str(remote_id)
             else:
                 # Log API-specific error details
                 logger.error(
@@ -86,14 +128,57 @@ class PlaneClient(IClient):
                     f"Status: {response.status_code}. "
                     f"Response: {response.text[:200]}"
                 )
-                return False
+                return None
+
+        except CircuitOpenError as e:
+            logger.error(f"Skipped issue '{item_name}': {e}")
+            return None
 
         except requests.exceptions.RequestException as e:
             # Log network/connection errors
             logger.error(f"Network error while posting issue '{item_name}': {e}")
-            return False
+            return None
 
         except Exception as e:
             # Log any unexpected errors (e.g., in payload generation)
             logger.error(f"Unexpected error for issue '{item_name}': {e}")
+            return None
+
+    def sync_fields(
+        self, workspace: str, project: str, work_item: WorkItem, iteration: str
+    ) -> Dict[str, Any]:
+        return self._resolve_fields(
+            workspace, project, work_item.to_plane_json_payload(), work_item
+        )
+
+    def update_work_item(
+        self, workspace: str, project: str, remote_id: str, changes: Dict[str, Any]
+    ) -> bool:
+        """Sends a PATCH containing only the changed fields of an existing work item."""
+        url = f"{self.host_url}/api/v1/workspaces/{workspace}/projects/{project}/work-items/{remote_id}/"
+
+        try:
+            response = self.resilience.request(
+                "PATCH", url, headers=self.headers, json=changes
+            )
+
+            if response.status_code == 200:
+                logger.success(
+                    f"Updated Plane work item [{remote_id}]: {sorted(changes)}"
+                )
+                return True
+
+            logger.error(
+                f"Failed to update item [{remote_id}]. "
+                f"Status: {response.status_code}. "
+                f"Response: {response.text[:200]}"
+            )
+            return False
+
+        except CircuitOpenError as e:
+            logger.error(f"Skipped update of [{remote_id}]: {e}")
+            return False
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Network error while updating [{remote_id}]: {e}")
             return False
@@ -0,0 +1,257 @@
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+import requests
+
+from clarity.clients.resilience import CircuitOpenError
+from clarity.config import Config
+from clarity.log import logger
+from clarity.work_item import WorkItem
+
+if TYPE_CHECKING:
+    from clarity.clients.plane import PlaneClient
+
+
+# Catalog attribute -> (Plane resource, entry fields holding a name)
+_RESOURCES = {
+    "states": ("states", ["name"]),
+    "labels": ("labels", ["name"]),
+    "modules": ("modules", ["name"]),
+    "types": ("issue-types", ["name"]),
+    "members": ("members", ["display_name", "email", "first_name"]),
+}
+
+
+class _ProjectCatalog:
+    """Lower-cased name -> UUID maps for one Plane project, fetched together."""
+
+    def __init__(self) -> None:
+        self.states: Dict[str, str] = {}
+        self.labels: Dict[str, str] = {}
+        self.modules: Dict[str, str] = {}
+        self.members: Dict[str, str] = {}
+        self.types: Dict[str, str] = {}
+        # Attribute -> monotonic time its map must be refetched
+        self.expires: Dict[str, float] = {}
+
+        # Serializes refreshes and label creation for this project
+        self.lock = threading.Lock()
+
+    def stale(self, now: float) -> List[str]:
+        return [
+            attribute
+            for attribute in _RESOURCES
+            if now >= self.expires.get(attribute, 0.0)
+        ]
+
+
+class PlaneResolver:
+    """
+    Resolves state, label, module, member and work item type names to the
+    project-specific UUIDs the Plane API expects.
+
+    Each project's catalog is fetched once and cached for PLANE_RESOLVER_TTL
+    seconds, so enriching a payload costs no requests in the common case. A list
+    that cannot be fetched (e.g. work item types on editions without them) is
+    treated as empty and retried after at most FAILED_FETCH_TTL seconds. Missing
+    labels are created on demand, exactly once even under concurrent uploads.
+    """
+
+    FAILED_FETCH_TTL = 60.0
+
+    def __init__(self, client: "PlaneClient", config: Config):
+        self.client = client
+        self.ttl = config.PLANE_RESOLVER_TTL
+
+        self.default_state = config.PLANE_DEFAULT_STATE
+        self.default_priority = config.PLANE_DEFAULT_PRIORITY
+        self.default_module = config.PLANE_DEFAULT_MODULE
+        self.default_assignees = [
+            name.strip()
+            for name in config.PLANE_DEFAULT_ASSIGNEES.split(",")
+            if name.strip()
+        ]
+
+        self._catalogs: Dict[str, _ProjectCatalog] = {}
+        self._catalogs_lock = threading.Lock()
+
+    def enrich(
+        self, workspace: str, project: str, payload: dict, work_item: WorkItem
+    ) -> dict:
+        """
+        Returns a copy of `payload` with state, labels, priority, assignees, module
+        and type filled in. Fields whose names cannot be resolved are left out.
+        """
+        catalog = self._catalog(workspace, project)
+        enriched = dict(payload)
+
+        if self.default_priority:
+            enriched["priority"] = self.default_priority.lower()
+
+        state_id = catalog.states.get(self.default_state.lower())
+        if state_id:
+            enriched["state"] = state_id
+
+        if work_item.component:
+            label_id = self._label_id(catalog, workspace, project, work_item.component)
+            if label_id:
+                enriched["labels"] = [label_id]
+
+        assignees = [
+            catalog.members[name.lower()]
+            for name in self.default_assignees
+            if name.lower() in catalog.members
+        ]
+        if assignees:
+            enriched["assignees"] = assignees
+
+        module_id = catalog.modules.get(self.default_module.lower())
+        if module_id:
+            enriched["module"] = module_id
+
+        type_id = catalog.types.get(work_item.plane_type().lower())
+        if type_id:
+            enriched["type"] = type_id
+
+        return enriched
+
+    def label_id(self, workspace: str, project: str, name: str) -> Optional[str]:
+        """Returns the UUID of label `name`, creating the label if it does not exist."""
+        return self._label_id(
+            self._catalog(workspace, project), workspace, project, name
+        )
+
+    def _label_id(
+        self, catalog: _ProjectCatalog, workspace: str, project: str, name: str
+    ) -> Optional[str]:
+        key = name.lower()
+
+        if key in catalog.labels:
+            return catalog.labels[key]
+
+        with catalog.lock:
+            # Another thread may have created it while we waited for the lock
+            if key in catalog.labels:
+                return catalog.labels[key]
+
+            url = self._project_url(workspace, project, "labels")
+            try:
+                response = self.client.resilience.request(
+                    "POST", url, headers=self.client.headers, json={"name": name}
+                )
+            except (CircuitOpenError, requests.exceptions.RequestException) as e:
+                logger.error(f"Could not create Plane label '{name}': {e}")
+                return None
+
+            if response.status_code not in (200, 201):
+                logger.error(
+                    f"Failed to create Plane label '{name}'. "
+                    f"Status: {response.status_code}. Response: {response.text[:200]}"
+                )
+                return None
+
+            try:
+                label_id = str(response.json()["id"])
+            except (ValueError, KeyError, TypeError) as e:
+                logger.error(f"Unexpected response creating Plane label '{name}': {e}")
+                return None
+
+            catalog.labels[key] = label_id
+            logger.info(f"Created Plane label '{name}' [{label_id}].")
+            return label_id
+
+    def invalidate(self, workspace: str, project: str) -> None:
+        """Forces the next lookup for the project to refetch its catalog."""
+        with self._catalogs_lock:
+            self._catalogs.pop(f"{workspace}/{project}", None)
+
+    def _catalog(self, workspace: str, project: str) -> _ProjectCatalog:
+        with self._catalogs_lock:
+            catalog = self._catalogs.setdefault(
+                f"{workspace}/{project}", _ProjectCatalog()
+            )
+
+        if not catalog.stale(time.monotonic()):
+            return catalog
+
+        with catalog.lock:
+            # Only one thread refreshes; the others reuse its result
+            for attribute in catalog.stale(time.monotonic()):
+                resource, name_fields = _RESOURCES[attribute]
+                mapping = self._name_map(workspace, project, resource, name_fields)
+
+                # A failed fetch keeps the previous map (empty at first) and is
+                # retried sooner, instead of on every lookup
+                ttl = self.ttl
+                if mapping is None:
+                    ttl = min(self.ttl, self.FAILED_FETCH_TTL)
+                else:
+                    setattr(catalog, attribute, mapping)
+                catalog.expires[attribute] = time.monotonic() + ttl
+
+        return catalog
+
+    def _name_map(
+        self, workspace: str, project: str, resource: str, name_fields: List[str]
+    ) -> Optional[Dict[str, str]]:
+        entries = self._list(workspace, project, resource)
+        if entries is None:
+            return None
+
+        mapping: Dict[str, str] = {}
+        for entry in entries:
+            # Project members may be wrapped as {"member": {...}} depending on version
+            entry = entry.get("member", entry) if isinstance(entry, dict) else {}
+            for field in name_fields:
+                value = entry.get(field)
+                if value and "id" in entry:
+                    mapping.setdefault(str(value).lower(), str(entry["id"]))
+        return mapping
+
+    def _list(
+        self, workspace: str, project: str, resource: str
+    ) -> Optional[List[dict]]:
+        """Fetches every page of a project resource. Returns None if it is unavailable."""
+        url = self._project_url(workspace, project, resource)
+        results: List[dict] = []
+        cursor = None
+
+        while True:
+            params = {"per_page": 100}
+            if cursor:
+                params["cursor"] = cursor
+
+            try:
+                response = self.client.resilience.request(
+                    "GET", url, headers=self.client.headers, params=params
+                )
+            except (CircuitOpenError, requests.exceptions.RequestException) as e:
+                logger.warning(f"Could not list Plane {resource}: {e}")
+                return None
+
+            if response.status_code != 200:
+                logger.warning(
+                    f"Could not list Plane {resource}. Status: {response.status_code}."
+                )
+                return None
+
+            try:
+                data = response.json()
+            except ValueError as e:
+                logger.warning(f"Could not list Plane {resource}: invalid JSON ({e}).")
+                return None
+
+            if isinstance(data, list):
+                return results + data
+            if not isinstance(data, dict):
+                logger.warning(f"Could not list Plane {resource}: unexpected response.")
+                return None
+
+            results.extend(data.get("results", []))
+            cursor = data.get("next_cursor")
+            if not data.get("next_page_results") or not cursor:
+                return results
+
+    def _project_url(self, workspace: str, project: str, resource: str) -> str:
+        return f"{self.client.host_url}/api/v1/workspaces/{workspace}/projects/{project}/{resource}/"
@@ -0,0 +1,170 @@
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from clarity.agents.coalesce import request_key
+from clarity.cassette import Cassette, replay_delay
+from clarity.clients.interface import ClientEnum, IClient
+from clarity.log import logger
+from clarity.work_item import WorkItem
+
+
+def _call_key(client: ClientEnum, method: str, *parts: str) -> str:
+    return request_key(client.value, method, *parts)
+
+
+def _items_json(work_items: List[WorkItem]) -> str:
+    return json.dumps([item.model_dump(mode="json") for item in work_items])
+
+
+def _changes_json(changes: Dict[str, Any]) -> str:
+    return json.dumps(changes, sort_keys=True, default=str)
+
+
+class RecordingClient(IClient):
+    """
+    Wraps a client and records every call, with its result and latency, to a
+    cassette keyed by client, method and arguments.
+    """
+
+    def __init__(self, client: IClient, cassette: Cassette) -> None:
+        self.client = client
+        self.cassette = cassette
+
+    def name(self) -> ClientEnum:
+        return self.client.name()
+
+    def create_work_items(
+        self, workspace: str, project: str, work_items: List[WorkItem], iteration: str
+    ) -> bool:
+        return self._record(
+            "create_work_items",
+            (workspace, project, _items_json(work_items), iteration),
+            lambda: self.client.create_work_items(
+                workspace, project, work_items, iteration
+            ),
+        )
+
+    def create_work_item(
+        self, workspace: str, project: str, work_item: WorkItem, iteration: str
+    ) -> Optional[str]:
+        return self._record(
+            "create_work_item",
+            (workspace, project, work_item.model_dump_json(), iteration),
+            lambda: self.client.create_work_item(
+                workspace, project, work_item, iteration
+            ),
+        )
+
+    def sync_fields(
+        self, workspace: str, project: str, work_item: WorkItem, iteration: str
+    ) -> Dict[str, Any]:
+        return self._record(
+            "sync_fields",
+            (workspace, project, work_item.model_dump_json(), iteration),
+            lambda: self.client.sync_fields(workspace, project, work_item, iteration),
+        )
+
+    def update_work_item(
+        self, workspace: str, project: str, remote_id: str, changes: Dict[str, Any]
+    ) -> bool:
+        return self._record(
+            "update_work_item",
+            (workspace, project, remote_id, _changes_json(changes)),
+            lambda: self.client.update_work_item(
+                workspace, project, remote_id, changes
+            ),
+        )
+
+    def _record(self, method: str, parts: tuple, call: Callable[[], Any]) -> Any:
+        start = time.monotonic()
+        result = call()
+        latency = time.monotonic() - start
+
+        self.cassette.record(
+            _call_key(self.name(), method, *parts),
+            {
+                "kind": "client",
+                "client": self.name().value,
+                "method": method,
+                "response": result,
+                "latency": latency,
+            },
+        )
+        return result
+
+
+class ReplayClient(IClient):
+    """
+    Serves client calls from a cassette instead of a live board. A call that was
+    never recorded fails the way a rejected request does.
+
+    `client` defaults to the first client in the cassette. With a `speed` above 0
+    each call is delayed by its recorded latency divided by `speed`.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        client: Optional[ClientEnum] = None,
+        speed: float = 0.0,
+    ) -> None:
+        if client is None:
+            recorded = cassette.entries("client")
+            client = ClientEnum(recorded[0]["client"]) if recorded else ClientEnum.STUB
+
+        self.cassette = cassette
+        self.client = client
+        self.speed = speed
+
+    def name(self) -> ClientEnum:
+        return self.client
+
+    def create_work_items(
+        self, workspace: str, project: str, work_items: List[WorkItem], iteration: str
+    ) -> bool:
+        return self._replay(
+            "create_work_items",
+            (workspace, project, _items_json(work_items), iteration),
+            False,
+        )
+
+    def create_work_item(
+        self, workspace: str, project: str, work_item: WorkItem, iteration: str
+    ) -> Optional[str]:
+        return self._replay(
+            "create_work_item",
+            (workspace, project, work_item.model_dump_json(), iteration),
+            None,
+        )
+
+    def sync_fields(
+        self, workspace: str, project: str, work_item: WorkItem, iteration: str
+    ) -> Dict[str, Any]:
+        return self._replay(
+            "sync_fields",
+            (workspace, project, work_item.model_dump_json(), iteration),
+            {},
+        )
+
+    def update_work_item(
+        self, workspace: str, project: str, remote_id: str, changes: Dict[str, Any]
+    ) -> bool:
+        return self._replay(
+            "update_work_item",
+            (workspace, project, remote_id, _changes_json(changes)),
+            False,
+        )
+
+    def _replay(self, method: str, parts: tuple, failed: Any) -> Any:
+        key = _call_key(self.client, method, *parts)
+        entry = self.cassette.get(key)
+
+        if entry is None:
+            logger.error(
+                f"No recorded {self.client.value} response for {method} ({key[:12]})."
+            )
+            return failed
+
+        replay_delay(entry, self.speed)
+        return entry["response"]
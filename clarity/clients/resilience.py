@@ -0,0 +1,327 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+import requests
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+
+from clarity.config import Config
+from clarity.log import logger
+
+T = TypeVar("T")
+
+# Status codes that signal a transient backend condition worth retrying
+RETRYABLE_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+
+# Status codes that guarantee the server did not act on the request, so even a
+# non-idempotent request (e.g. a POST creating a ticket) can safely be resent
+UNPROCESSED_STATUS_CODES = {429, 503}
+
+
+class RetryableError(Exception):
+    """Raised by a wrapped call to signal a transient failure that may be retried."""
+
+    def __init__(
+        self,
+        message: str,
+        retry_after: Optional[float] = None,
+        unprocessed: bool = False,
+    ):
+        super().__init__(message)
+        self.retry_after = retry_after
+        # True when the request never reached the server or was refused unprocessed
+        self.unprocessed = unprocessed
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the host's circuit breaker is open."""
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket. `rate` tokens are added per second up to
+    `capacity`; each request consumes one token and blocks until one is available.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._updated
+                self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failures and rejects calls until
+    `reset_timeout` seconds have passed, then lets a single trial call through
+    (half-open). A success closes the circuit, a failure re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+
+            # Half-open: allow exactly one trial request through
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def release(self) -> None:
+        """
+        Ends a call without a verdict on the host's health (e.g. a rejected payload),
+        letting the next call through as the half-open trial.
+        """
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+class Resilience:
+    """
+    Shared rate limiting, retry and circuit breaking for one backend host.
+
+    Instances are shared per host via `Resilience.for_host`, so every client
+    talking to the same host draws from the same token bucket and trips the
+    same circuit breaker.
+    """
+
+    _instances: Dict[str, "Resilience"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(
+        self,
+        host: str,
+        rate: float = 5.0,
+        burst: float = 10.0,
+        max_retries: int = 4,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        timeout: float = 30.0,
+    ):
+        self.host = host
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self.bucket = TokenBucket(rate, burst)
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.session = requests.Session()
+
+    @classmethod
+    def for_host(cls, host: str, config: Config) -> "Resilience":
+        """Returns the shared resilience policy for `host`, creating it on first use."""
+        with cls._instances_lock:
+            instance = cls._instances.get(host)
+            if instance is None:
+                instance = cls(
+                    host,
+                    rate=config.CLIENT_RATE_LIMIT,
+                    burst=config.CLIENT_RATE_BURST,
+                    max_retries=config.CLIENT_MAX_RETRIES,
+                    backoff_base=config.CLIENT_BACKOFF_BASE,
+                    backoff_max=config.CLIENT_BACKOFF_MAX,
+                    failure_threshold=config.CLIENT_CIRCUIT_THRESHOLD,
+                    reset_timeout=config.CLIENT_CIRCUIT_RESET,
+                    timeout=config.CLIENT_TIMEOUT,
+                )
+                cls._instances[host] = instance
+            return instance
+
+    def call(
+        self, fn: Callable[..., T], *args: Any, idempotent: bool = True, **kwargs: Any
+    ) -> T:
+        """
+        Invokes `fn` under the host's rate limit and circuit breaker, retrying with
+        jittered exponential backoff whenever it raises `RetryableError`. A call that
+        is not `idempotent` is only retried when the error is `unprocessed`.
+
+        The breaker counts one failure per call once its retries are exhausted.
+        Raises CircuitOpenError when the breaker rejects the call, or re-raises the
+        last RetryableError once retries are exhausted.
+        """
+        if not self.breaker.allow():
+            raise CircuitOpenError(
+                f"Circuit open for {self.host}; failing fast without a request."
+            )
+
+        try:
+            result = self._attempt(fn, args, kwargs, idempotent)
+        except RetryableError:
+            self.breaker.record_failure()
+            raise
+        except BaseException:
+            self.breaker.release()
+            raise
+
+        self.breaker.record_success()
+        return result
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        idempotent: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """
+        Sends an HTTP request through `call`. Retryable status codes and connection
+        errors are retried; the final response is returned as-is once retries are
+        exhausted so callers keep their existing status handling.
+
+        POST requests are treated as non-idempotent unless `idempotent` says
+        otherwise, and are only resent after a 429, a 503 or a refused connection.
+        Requests time out after the host's `timeout` unless the caller sets one.
+        """
+        if idempotent is None:
+            idempotent = method.upper() != "POST"
+        if self.timeout > 0:
+            kwargs.setdefault("timeout", self.timeout)
+
+        last_response: Dict[str, requests.Response] = {}
+
+        def send() -> requests.Response:
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                raise RetryableError(
+                    f"{e.__class__.__name__}: {e}",
+                    unprocessed=is_connection_refused(e),
+                )
+
+            if response.status_code in RETRYABLE_STATUS_CODES:
+                last_response["value"] = response
+                raise RetryableError(
+                    f"HTTP {response.status_code}",
+                    retry_after=parse_retry_after(response.headers.get("Retry-After")),
+                    unprocessed=response.status_code in UNPROCESSED_STATUS_CODES,
+                )
+
+            return response
+
+        try:
+            return self.call(send, idempotent=idempotent)
+        except RetryableError:
+            if "value" in last_response:
+                return last_response["value"]
+            raise requests.ConnectionError(
+                f"Giving up on {method} {url} after {self.max_retries} retries."
+            )
+
+    def _attempt(
+        self,
+        fn: Callable[..., T],
+        args: tuple,
+        kwargs: Dict[str, Any],
+        idempotent: bool,
+    ) -> T:
+        attempt = 0
+
+        while True:
+            self.bucket.acquire()
+
+            try:
+                return fn(*args, **kwargs)
+            except RetryableError as e:
+                if attempt >= self.max_retries or not (idempotent or e.unprocessed):
+                    raise
+
+                delay = self._backoff(attempt, e.retry_after)
+                attempt += 1
+                logger.warning(
+                    f"Transient failure from {self.host} ({e}). "
+                    f"Retry {attempt}/{self.max_retries} in {delay:.2f}s."
+                )
+                time.sleep(delay)
+
+    def _backoff(self, attempt: int, retry_after: Optional[float]) -> float:
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+
+        # "Full jitter" exponential backoff
+        ceiling = min(self.backoff_max, self.backoff_base * (2**attempt))
+        return random.uniform(0, ceiling)
+
+
+def is_connection_refused(error: BaseException) -> bool:
+    """Whether a connection error happened before the request reached the server."""
+    if isinstance(error, (requests.ConnectTimeout, ConnectTimeoutError)):
+        return True
+
+    # requests wraps urllib3's errors: ConnectionError(MaxRetryError(reason=...))
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header given either as delta-seconds or an HTTP date."""
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,55 @@
+import itertools
+import threading
+from typing import Any, Dict, List, Optional
+
+from clarity.clients.interface import ClientEnum, IClient
+from clarity.log import logger
+from clarity.work_item import WorkItem
+
+
+class StubClient(IClient):
+    """
+    An in-memory client that accepts every work item and keeps it locally.
+    Used to exercise the pipeline without a Plane or Azure DevOps instance.
+    """
+
+    def __init__(self) -> None:
+        self.items: Dict[str, WorkItem] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def name(self) -> ClientEnum:
+        return ClientEnum.STUB
+
+    def create_work_items(
+        self, workspace: str, project: str, work_items: List[WorkItem], iteration: str
+    ) -> bool:
+        for item in work_items:
+            self.create_work_item(workspace, project, item, iteration)
+        return True
+
+    def create_work_item(
+        self, workspace: str, project: str, work_item: WorkItem, iteration: str
+    ) -> Optional[str]:
+        with self._lock:
+            remote_id = f"STUB-{next(self._ids)}"
+            self.items[remote_id] = work_item
+
+        logger.success(f"Created stub work item [{remote_id}]: {work_item.title}")
+        return remote_id
+
+    def sync_fields(
+        self, workspace: str, project: str, work_item: WorkItem, iteration: str
+    ) -> Dict[str, Any]:
+        return work_item.model_dump()
+
+    def update_work_item(
+        self, workspace: str, project: str, remote_id: str, changes: Dict[str, Any]
+    ) -> bool:
+        with self._lock:
+            if remote_id not in self.items:
+                return False
+            self.items[remote_id] = self.items[remote_id].model_copy(update=changes)
+
+        logger.success(f"Updated stub work item [{remote_id}]: {sorted(changes)}")
+        return True
@@ -1,7 +1,7 @@
 import os
 import sys
 from dotenv import dotenv_values
-from typing import Dict, Any
+from typing import Any, Dict, Optional
 
 try:
     entry_script_path = os.path.abspath(sys.argv[0])
@@ -14,46 +14,174 @@ except Exception:
 ABSOLUTE_BASE_PATH = os.path.abspath(base_directory)
 
 
+def _as_bool(value: Any) -> bool:
+    return str(value).strip().lower() in ("1", "true", "yes", "on")
+
+
 class Config:
-    _env_config: Dict[str, Any] = dotenv_values(
-        os.path.join(ABSOLUTE_BASE_PATH, ".env")
-    )
-
-    BASE_PATH = ABSOLUTE_BASE_PATH
-
-    # Ollama config
-    OLLAMA_HOST_URL = _env_config.get("OLLAMA_HOST_URL", "http://localhost:11434")
-    MODEL_NAME = _env_config.get("MODEL_NAME", "llama3:latest")
-
-    # Plane Config
-    PLANE_HOST_URL = _env_config.get("PLANE_HOST_URL", "http://localhost:80")
-    PLANE_API_TOKEN = _env_config.get(
-        "PLANE_API_TOKEN", "plane_api_1e1553d4385f4a1b98c52e0c406ad95a"
-    )
-    PLANE_WORKSPACE_SLUG = _env_config.get("PLANE_WORKSPACE_SLUG", "anyllm")
-    PLANE_PROJECT_ID = _env_config.get(
-        "PLANE_PROJECT_ID", "1e8bde5b-9e49-45a4-8b43-10341429f1e3"
-    )
-
-    # Azure Config
-    AZURE_HOST_URL = _env_config.get(
-        "AZURE_HOST_URL", "1e8bde5b-9e49-45a4-8b43-10341429f1e3"
-    )
-
-    AZURE_PAT = _env_config.get("AZURE_PAT", "1e8bde5b-9e49-45a4-8b43-10341429f1e3")
-    AZURE_PROJECT = _env_config.get(
-        "AZURE_PROJECT", "1e8bde5b-9e49-45a4-8b43-10341429f1e3"
-    )
-    AZURE_WORKSPACE = _env_config.get(
-        "AZURE_WORKSPACE", "1e8bde5b-9e49-45a4-8b43-10341429f1e3"
-    )
-
-    TRANSCRIPT_REL_PATH = "data/transcripts"
-    WORK_PACKAGE_REL_PATH = "data/work"
-
-    # Construct the final absolute paths using os.path.join
-    TRANSCRIPT_PATH = os.path.join(BASE_PATH, TRANSCRIPT_REL_PATH)
-    WORK_PACKAGE_PATH = os.path.join(BASE_PATH, WORK_PACKAGE_REL_PATH)
-
-    # Clean up the temporary config dict
-    del _env_config
+    """
+    Application settings, read from the `.env` file next to the entry script.
+
+    The file is read when a Config is constructed rather than at import time, so
+    importing clarity modules stays cheap and tests can point at another file.
+    """
+
+    def __init__(self, env_path: Optional[str] = None) -> None:
+        _env_config: Dict[str, Any] = dotenv_values(
+            env_path or os.path.join(ABSOLUTE_BASE_PATH, ".env")
+        )
+
+        self.BASE_PATH = ABSOLUTE_BASE_PATH
+
+        # Ollama config
+        self.OLLAMA_HOST_URL = _env_config.get(
+            "OLLAMA_HOST_URL", "http://localhost:11434"
+        )
+        self.MODEL_NAME = _env_config.get("MODEL_NAME", "llama3:latest")
+
+        # Optional per-request model routing, e.g.
+        # "2000=llama3.2:3b; 8000=llama3:latest; *=llama3:70b" (see agents/router.py)
+        self.MODEL_ROUTES = _env_config.get("MODEL_ROUTES", "")
+        # Retry on the next larger route when a response is invalid or empty
+        self.MODEL_ESCALATE = _as_bool(_env_config.get("MODEL_ESCALATE", True))
+
+        # Plane Config
+        self.PLANE_HOST_URL = _env_config.get("PLANE_HOST_URL", "http://localhost:80")
+        self.PLANE_API_TOKEN = _env_config.get(
+            "PLANE_API_TOKEN", "plane_api_1e1553d4385f4a1b98c52e0c406ad95a"
+        )
+        self.PLANE_WORKSPACE_SLUG = _env_config.get("PLANE_WORKSPACE_SLUG", "anyllm")
+        self.PLANE_PROJECT_ID = _env_config.get(
+            "PLANE_PROJECT_ID", "1e8bde5b-9e49-45a4-8b43-10341429f1e3"
+        )
+
+        # Plane field resolution: names are mapped to project UUIDs by PlaneResolver
+        self.PLANE_RESOLVE_FIELDS = _as_bool(
+            _env_config.get("PLANE_RESOLVE_FIELDS", True)
+        )
+        self.PLANE_RESOLVER_TTL = float(
+            _env_config.get("PLANE_RESOLVER_TTL", 300)
+        )  # seconds
+        self.PLANE_DEFAULT_STATE = _env_config.get("PLANE_DEFAULT_STATE", "Backlog")
+        self.PLANE_DEFAULT_PRIORITY = _env_config.get("PLANE_DEFAULT_PRIORITY", "none")
+        self.PLANE_DEFAULT_MODULE = _env_config.get("PLANE_DEFAULT_MODULE", "")
+        # Comma-separated display names or emails of project members
+        self.PLANE_DEFAULT_ASSIGNEES = _env_config.get("PLANE_DEFAULT_ASSIGNEES", "")
+
+        # Azure Config
+        self.AZURE_HOST_URL = _env_config.get(
+            "AZURE_HOST_URL", "1e8bde5b-9e49-45a4-8b43-10341429f1e3"
+        )
+
+        self.AZURE_PAT = _env_config.get(
+            "AZURE_PAT", "1e8bde5b-9e49-45a4-8b43-10341429f1e3"
+        )
+        self.AZURE_PROJECT = _env_config.get(
+            "AZURE_PROJECT", "1e8bde5b-9e49-45a4-8b43-10341429f1e3"
+        )
+        self.AZURE_WORKSPACE = _env_config.get(
+            "AZURE_WORKSPACE", "1e8bde5b-9e49-45a4-8b43-10341429f1e3"
+        )
+        # Azure iteration renames, e.g. "Iteration 1=Sprint 12; Iteration 2=Sprint 13"
+        self.AZURE_ITERATION_MAP = _env_config.get("AZURE_ITERATION_MAP", "")
+
+        # Extra boards every run is also published to, e.g. "plane" alongside Azure
+        self.MIRROR_CLIENTS = [
+            name.strip().lower()
+            for name in _env_config.get("MIRROR_CLIENTS", "").split(",")
+            if name.strip()
+        ]
+
+        # Client resilience (shared per backend host)
+        self.CLIENT_RATE_LIMIT = float(
+            _env_config.get("CLIENT_RATE_LIMIT", 5)
+        )  # requests/sec
+        self.CLIENT_RATE_BURST = float(_env_config.get("CLIENT_RATE_BURST", 10))
+        self.CLIENT_MAX_RETRIES = int(_env_config.get("CLIENT_MAX_RETRIES", 4))
+        self.CLIENT_BACKOFF_BASE = float(
+            _env_config.get("CLIENT_BACKOFF_BASE", 0.5)
+        )  # seconds
+        self.CLIENT_BACKOFF_MAX = float(
+            _env_config.get("CLIENT_BACKOFF_MAX", 30)
+        )  # seconds
+        self.CLIENT_CIRCUIT_THRESHOLD = int(
+            _env_config.get("CLIENT_CIRCUIT_THRESHOLD", 5)
+        )
+        self.CLIENT_CIRCUIT_RESET = float(
+            _env_config.get("CLIENT_CIRCUIT_RESET", 30)
+        )  # seconds
+        # Per-request timeout, so a hung host fails into retry and the breaker
+        self.CLIENT_TIMEOUT = float(_env_config.get("CLIENT_TIMEOUT", 30))  # seconds
+
+        # Service mode
+        self.SERVICE_HOST = _env_config.get("SERVICE_HOST", "127.0.0.1")
+        self.SERVICE_PORT = int(_env_config.get("SERVICE_PORT", 8080))
+        self.SERVICE_WORKERS = int(_env_config.get("SERVICE_WORKERS", 2))
+        self.SERVICE_QUEUE_SIZE = int(_env_config.get("SERVICE_QUEUE_SIZE", 32))
+
+        # Failed generations of a job before it is marked failed (0 = retry forever)
+        self.JOB_MAX_ATTEMPTS = int(_env_config.get("JOB_MAX_ATTEMPTS", 3))
+
+        # Adaptive concurrency for generation requests (per Ollama host)
+        self.ADAPTIVE_CONCURRENCY = _as_bool(
+            _env_config.get("ADAPTIVE_CONCURRENCY", True)
+        )
+        self.OLLAMA_INITIAL_CONCURRENCY = int(
+            _env_config.get("OLLAMA_INITIAL_CONCURRENCY", 2)
+        )
+        self.OLLAMA_MIN_CONCURRENCY = int(_env_config.get("OLLAMA_MIN_CONCURRENCY", 1))
+        self.OLLAMA_MAX_CONCURRENCY = int(_env_config.get("OLLAMA_MAX_CONCURRENCY", 8))
+        # Latency (per output token) above this multiple of the best seen backs off
+        self.OLLAMA_LATENCY_TOLERANCE = float(
+            _env_config.get("OLLAMA_LATENCY_TOLERANCE", 2.0)
+        )
+
+        # Share one in-flight generation between identical concurrent requests
+        self.COALESCE_REQUESTS = _as_bool(_env_config.get("COALESCE_REQUESTS", True))
+
+        # Order generations by priority class (interactive before bulk) and tenant
+        self.PRIORITY_SCHEDULING = _as_bool(
+            _env_config.get("PRIORITY_SCHEDULING", True)
+        )
+        # Concurrent generations per host; follows the adaptive limit when that is on
+        self.SCHEDULER_SLOTS = int(_env_config.get("SCHEDULER_SLOTS", 2))
+        # Bulk work waiting longer than this is served before interactive work
+        self.SCHEDULER_STARVATION_SECONDS = float(
+            _env_config.get("SCHEDULER_STARVATION_SECONDS", 300)
+        )
+
+        # Update tickets created by earlier runs of the same transcript instead of
+        # creating new ones, sending only changed fields
+        self.SYNC_MODE = _as_bool(_env_config.get("SYNC_MODE", False))
+
+        # Split transcripts into segments of at most this many characters and
+        # generate work items per segment (0 sends the whole transcript at once)
+        self.TRANSCRIPT_CHUNK_CHARS = int(_env_config.get("TRANSCRIPT_CHUNK_CHARS", 0))
+
+        # Logging: "text" or "json" (JSON lines), optionally on a background thread
+        self.LOG_FORMAT = _env_config.get("LOG_FORMAT", "text").lower()
+        self.LOG_QUEUED = _as_bool(_env_config.get("LOG_QUEUED", False))
+
+        # Record all agent and client traffic to this cassette (.jsonl or .jsonl.gz)
+        self.RECORD_CASSETTE = _env_config.get("RECORD_CASSETTE", "")
+        # Replay delay: 1.0 = recorded timing, 10.0 = ten times faster, 0 = none
+        self.REPLAY_SPEED = float(_env_config.get("REPLAY_SPEED", 0))
+
+        # Profile CPU and memory of each run stage (written to data/work/profiles/)
+        self.PROFILE = _as_bool(_env_config.get("PROFILE", False))
+        self.PROFILE_TOP = int(_env_config.get("PROFILE_TOP", 10))
+
+        self.TRANSCRIPT_REL_PATH = "data/transcripts"
+        self.WORK_PACKAGE_REL_PATH = "data/work"
+        self.JOB_DB_REL_PATH = "data/jobs.db"
+        self.WORK_ITEM_DB_REL_PATH = "data/work/work_items.db"
+
+        # Construct the final absolute paths using os.path.join
+        self.TRANSCRIPT_PATH = os.path.join(self.BASE_PATH, self.TRANSCRIPT_REL_PATH)
+        self.WORK_PACKAGE_PATH = os.path.join(
+            self.BASE_PATH, self.WORK_PACKAGE_REL_PATH
+        )
+        self.JOB_DB_PATH = os.path.join(self.BASE_PATH, self.JOB_DB_REL_PATH)
+        self.WORK_ITEM_DB_PATH = os.path.join(
+            self.BASE_PATH, self.WORK_ITEM_DB_REL_PATH
+        )
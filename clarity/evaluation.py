@@ -0,0 +1,352 @@
+import copy
+import itertools
+import json
+import os
+import re
+import tempfile
+import time
+from difflib import SequenceMatcher
+from typing import Callable, Dict, List, Optional, Sequence
+
+from clarity.agents.interface import GenerationStats, IAgent
+from clarity.clients.stub import StubClient
+from clarity.config import Config
+from clarity.log import logger
+from clarity.manager import WorkflowManager
+from clarity.prompt import PromptType
+from clarity.sync import normalize_title
+from clarity.work_item import WorkItem
+
+EXPECTED_SUFFIX = ".expected.json"
+
+
+class ExpectedItem:
+    """An annotated work item a transcript should produce."""
+
+    def __init__(self, title: str, description: str = ""):
+        self.title = title
+        self.description = description
+
+
+class GoldenCase:
+    """An annotated transcript and the work items expected from it."""
+
+    def __init__(self, name: str, transcript: str, expected: List[ExpectedItem]):
+        self.name = name
+        self.transcript = transcript
+        self.expected = expected
+
+
+def load_golden(directory: str) -> List[GoldenCase]:
+    """
+    Loads every `<name>.expected.json` in `directory`. Each file holds
+    `{"transcript": "<file>", "work_items": [{"title": ..., "description": ...}]}`;
+    the transcript defaults to `<name>.txt` in the same directory.
+    """
+    cases = []
+
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith(EXPECTED_SUFFIX):
+            continue
+
+        name = filename[: -len(EXPECTED_SUFFIX)]
+        with open(os.path.join(directory, filename), "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        expected = [
+            ExpectedItem(item["title"], item.get("description", ""))
+            for item in data["work_items"]
+        ]
+        cases.append(GoldenCase(name, data.get("transcript", f"{name}.txt"), expected))
+
+    logger.info(f"Loaded {len(cases)} golden transcripts from: {directory}")
+    return cases
+
+
+def title_similarity(generated: WorkItem, expected: ExpectedItem) -> float:
+    """Character-level similarity of the normalized titles."""
+    return SequenceMatcher(
+        None, normalize_title(generated.title), normalize_title(expected.title)
+    ).ratio()
+
+
+def _words(text: str) -> set:
+    return set(re.findall(r"\w{3,}", text.lower()))
+
+
+def content_similarity(generated: WorkItem, expected: ExpectedItem) -> float:
+    """
+    Word overlap of title and description, which tolerates rewording and reordering
+    better than title similarity (a Dice coefficient over words of 3+ letters).
+    """
+    a = _words(f"{generated.title} {generated.description}")
+    b = _words(f"{expected.title} {expected.description}")
+    if not a or not b:
+        return 0.0
+    return 2 * len(a & b) / (len(a) + len(b))
+
+
+Scorer = Callable[[WorkItem, ExpectedItem], float]
+
+SCORERS: Dict[str, Scorer] = {
+    "fuzzy": title_similarity,
+    "content": content_similarity,
+}
+
+DEFAULT_THRESHOLDS = {"fuzzy": 0.6, "content": 0.35}
+
+
+def match_items(
+    generated: List[WorkItem],
+    expected: List[ExpectedItem],
+    scorer: Scorer,
+    threshold: float,
+) -> int:
+    """
+    Pairs generated and expected items one-to-one, best scores first, and returns
+    the number of pairs scoring at least `threshold`.
+    """
+    pairs = sorted(
+        (
+            (scorer(item, target), g, e)
+            for g, item in enumerate(generated)
+            for e, target in enumerate(expected)
+        ),
+        reverse=True,
+    )
+
+    used_generated, used_expected = set(), set()
+    for score, g, e in pairs:
+        if score < threshold:
+            break
+        if g in used_generated or e in used_expected:
+            continue
+        used_generated.add(g)
+        used_expected.add(e)
+
+    return len(used_expected)
+
+
+class EvalResult:
+    """Aggregate quality and cost of one sweep configuration over all golden cases."""
+
+    def __init__(self, prompt_type: PromptType, model: str, chunk_chars: int):
+        self.prompt_type = prompt_type
+        self.model = model
+        self.chunk_chars = chunk_chars
+
+        self.expected = 0
+        self.generated = 0
+        self.matched = 0
+        self.failed_cases = 0
+
+        self.latency = 0.0
+        self.tokens = 0
+        self.gpu_seconds = 0.0
+
+        self.pareto = False
+
+    @property
+    def recall(self) -> float:
+        return self.matched / self.expected if self.expected else 0.0
+
+    @property
+    def precision(self) -> float:
+        return self.matched / self.generated if self.generated else 0.0
+
+    @property
+    def f1(self) -> float:
+        total = self.recall + self.precision
+        return 2 * self.recall * self.precision / total if total else 0.0
+
+    def dominates(self, other: "EvalResult") -> bool:
+        """True if this result is at least as good on every axis and better on one."""
+        mine = (
+            self.recall,
+            self.precision,
+            -self.latency,
+            -self.tokens,
+            -self.gpu_seconds,
+        )
+        theirs = (
+            other.recall,
+            other.precision,
+            -other.latency,
+            -other.tokens,
+            -other.gpu_seconds,
+        )
+        return all(a >= b for a, b in zip(mine, theirs)) and mine != theirs
+
+    def to_dict(self) -> dict:
+        return {
+            "prompt_type": self.prompt_type.value,
+            "model": self.model,
+            "chunk_chars": self.chunk_chars,
+            "expected": self.expected,
+            "generated": self.generated,
+            "matched": self.matched,
+            "failed_cases": self.failed_cases,
+            "recall": self.recall,
+            "precision": self.precision,
+            "f1": self.f1,
+            "latency": self.latency,
+            "tokens": self.tokens,
+            "gpu_seconds": self.gpu_seconds,
+            "pareto": self.pareto,
+        }
+
+
+def mark_pareto(results: List[EvalResult]) -> None:
+    """Flags the results no other result dominates on quality and cost."""
+    for result in results:
+        result.pareto = not any(other.dominates(result) for other in results)
+
+
+def format_table(results: List[EvalResult]) -> str:
+    """Renders results as a plain-text table, Pareto-optimal rows marked with `*`."""
+    header = (
+        f"{'':1} {'prompt':6} {'model':24} {'chunk':>6} {'recall':>7} "
+        f"{'prec':>6} {'f1':>6} {'latency':>9} {'tokens':>8} {'gpu s':>8}"
+    )
+    rows = [header, "-" * len(header)]
+
+    for r in sorted(results, key=lambda r: (-r.recall, r.latency)):
+        rows.append(
+            f"{'*' if r.pareto else '':1} {r.prompt_type.value:6} {r.model[:24]:24} "
+            f"{r.chunk_chars or '-':>6} {r.recall:7.1%} {r.precision:6.1%} "
+            f"{r.f1:6.2f} {r.latency:8.1f}s {r.tokens:8d} {r.gpu_seconds:8.1f}"
+        )
+
+    return "\n".join(rows)
+
+
+class _MeteredAgent(IAgent):
+    """Accumulates latency, tokens and GPU time over every call of a wrapped agent."""
+
+    def __init__(self, agent: IAgent) -> None:
+        self.agent = agent
+        self.model_name: str = agent.model_name
+        self.reset()
+
+    def reset(self) -> None:
+        self.latency = 0.0
+        self.tokens = 0
+        self.gpu_seconds = 0.0
+
+    def generate_work_items(
+        self,
+        prompt: str,
+        transcript: str,
+        prompt_type: Optional[PromptType] = None,
+    ) -> str:
+        start = time.monotonic()
+        response = self.agent.generate_work_items(prompt, transcript, prompt_type)
+        elapsed = time.monotonic() - start
+
+        stats = self.agent.last_stats()
+        # Replayed responses report the latency they were recorded with
+        if stats is not None and stats.total_seconds:
+            self.latency += stats.total_seconds
+        else:
+            self.latency += elapsed
+        if stats is not None:
+            self.tokens += stats.prompt_tokens + stats.output_tokens
+            self.gpu_seconds += stats.gpu_seconds
+
+        return response
+
+    def last_stats(self) -> Optional[GenerationStats]:
+        return self.agent.last_stats()
+
+
+class Evaluator:
+    """
+    Runs `WorkflowManager.generate_work_items` over golden transcripts for every
+    combination of prompt type, model and chunk size, and scores the generated
+    items against the annotations.
+
+    `agent_factory` builds the agent for a model name; pass one returning
+    ReplayAgents to evaluate offline against recorded responses.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        directory: str,
+        agent_factory: Callable[[str], IAgent],
+        scorer: str = "fuzzy",
+        threshold: Optional[float] = None,
+    ):
+        self.config = config
+        self.directory = directory
+        self.cases = load_golden(directory)
+        self.agent_factory = agent_factory
+        self.scorer = SCORERS[scorer]
+        self.threshold = (
+            threshold if threshold is not None else DEFAULT_THRESHOLDS[scorer]
+        )
+
+    def run(
+        self,
+        prompt_types: Sequence[PromptType],
+        models: Sequence[str],
+        chunk_sizes: Sequence[int] = (0,),
+    ) -> List[EvalResult]:
+        results = []
+
+        # Jobs and items written by the managers are scratch data
+        with tempfile.TemporaryDirectory(prefix="clarity-eval-") as scratch:
+            for model, chunk_chars in itertools.product(models, chunk_sizes):
+                agent = _MeteredAgent(self.agent_factory(model))
+                manager = self._manager(agent, chunk_chars, scratch)
+                for prompt_type in prompt_types:
+                    results.append(
+                        self._evaluate(manager, agent, prompt_type, chunk_chars)
+                    )
+
+        mark_pareto(results)
+        return results
+
+    def _manager(
+        self, agent: IAgent, chunk_chars: int, scratch: str
+    ) -> WorkflowManager:
+        config = copy.copy(self.config)
+        config.TRANSCRIPT_PATH = os.path.abspath(self.directory)
+        config.TRANSCRIPT_CHUNK_CHARS = chunk_chars
+        config.WORK_PACKAGE_PATH = os.path.join(scratch, "work")
+        config.JOB_DB_PATH = os.path.join(scratch, "jobs.db")
+        config.WORK_ITEM_DB_PATH = os.path.join(scratch, "work", "work_items.db")
+
+        return WorkflowManager(agent, StubClient(), config)
+
+    def _evaluate(
+        self,
+        manager: WorkflowManager,
+        agent: _MeteredAgent,
+        prompt_type: PromptType,
+        chunk_chars: int,
+    ) -> EvalResult:
+        model = agent.model_name
+        result = EvalResult(prompt_type, model, chunk_chars)
+        agent.reset()
+
+        for case in self.cases:
+            generated = manager.generate_work_items(case.transcript, prompt_type)
+            if not generated:
+                result.failed_cases += 1
+
+            result.expected += len(case.expected)
+            result.generated += len(generated)
+            result.matched += match_items(
+                generated, case.expected, self.scorer, self.threshold
+            )
+
+        result.latency = agent.latency
+        result.tokens = agent.tokens
+        result.gpu_seconds = agent.gpu_seconds
+
+        logger.info(
+            f"Evaluated prompt {prompt_type.value} / {model} / chunk {chunk_chars}: "
+            f"recall {result.recall:.1%}, precision {result.precision:.1%}."
+        )
+        return result
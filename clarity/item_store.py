@@ -0,0 +1,309 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+from clarity.log import logger
+from clarity.work_item import WorkItem
+
+
+class StoredWorkItem:
+    """A work item as recorded in the store, with the metadata of the run that produced it."""
+
+    def __init__(self, row: sqlite3.Row):
+        self.run_id: str = row["run_id"]
+        self.item_index: int = row["item_index"]
+        self.created_at: float = row["created_at"]
+        self.transcript: str = row["transcript"]
+        self.transcript_hash: str = row["transcript_hash"]
+        self.project: str = row["project"]
+        self.model: str = row["model"]
+        self.prompt_type: str = row["prompt_type"]
+        self.work_item: WorkItem = WorkItem.model_validate_json(row["data"])
+
+    def to_dict(self) -> dict:
+        return {
+            "run_id": self.run_id,
+            "item_index": self.item_index,
+            "created_at": self.created_at,
+            "transcript": self.transcript,
+            "transcript_hash": self.transcript_hash,
+            "project": self.project,
+            "model": self.model,
+            "prompt_type": self.prompt_type,
+            "work_item": self.work_item.model_dump(),
+        }
+
+
+class RemoteLink:
+    """The remote ticket a generated work item was published as, with the fields last sent."""
+
+    def __init__(self, row: sqlite3.Row):
+        self.client: str = row["client"]
+        self.project: str = row["project"]
+        self.fingerprint: str = row["fingerprint"]
+        self.transcript: str = row["transcript"]
+        self.title: str = row["title"]
+        self.remote_id: str = row["remote_id"]
+        self.fields: Dict[str, Any] = json.loads(row["fields"])
+        self.updated_at: float = row["updated_at"]
+
+
+class WorkItemStore:
+    """
+    An append-only SQLite store of every generated work item.
+
+    Each item is written once, as compact JSON, together with the run ID, source
+    transcript (name and content hash), project, model and prompt type. Secondary
+    indexes on transcript hash, project and creation time keep history lookups
+    fast regardless of how many runs have been recorded. `compact` prunes
+    superseded runs and reclaims their space.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS work_items (
+            run_id TEXT NOT NULL,
+            item_index INTEGER NOT NULL,
+            created_at REAL NOT NULL,
+            transcript TEXT NOT NULL,
+            transcript_hash TEXT NOT NULL,
+            project TEXT NOT NULL,
+            model TEXT NOT NULL,
+            prompt_type TEXT NOT NULL,
+            title TEXT NOT NULL,
+            data TEXT NOT NULL,
+            PRIMARY KEY (run_id, item_index)
+        );
+        CREATE INDEX IF NOT EXISTS work_items_transcript
+            ON work_items (transcript_hash, created_at);
+        CREATE INDEX IF NOT EXISTS work_items_project
+            ON work_items (project, created_at);
+        CREATE INDEX IF NOT EXISTS work_items_created
+            ON work_items (created_at);
+        CREATE TABLE IF NOT EXISTS remote_links (
+            client TEXT NOT NULL,
+            project TEXT NOT NULL,
+            fingerprint TEXT NOT NULL,
+            transcript TEXT NOT NULL,
+            title TEXT NOT NULL,
+            remote_id TEXT NOT NULL,
+            fields TEXT NOT NULL,
+            updated_at REAL NOT NULL,
+            PRIMARY KEY (client, project, fingerprint)
+        );
+        CREATE INDEX IF NOT EXISTS remote_links_transcript
+            ON remote_links (client, project, transcript);
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(self._SCHEMA)
+
+    def append(
+        self,
+        run_id: str,
+        work_items: List[WorkItem],
+        transcript: str,
+        transcript_hash: str,
+        project: str,
+        model: str,
+        prompt_type: str,
+    ) -> int:
+        """
+        Appends a run's work items. Items already recorded for the run are left
+        untouched, so re-saving a resumed run does not duplicate them.
+
+        Returns: The number of newly stored items.
+        """
+        now = time.time()
+        rows = [
+            (
+                run_id,
+                index,
+                now,
+                transcript,
+                transcript_hash,
+                project,
+                model,
+                prompt_type,
+                item.title,
+                item.model_dump_json(),
+            )
+            for index, item in enumerate(work_items)
+        ]
+
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO work_items VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            return self._conn.total_changes - before
+
+    def by_run(self, run_id: str) -> List[StoredWorkItem]:
+        return self._query(
+            "SELECT * FROM work_items WHERE run_id = ? ORDER BY item_index", (run_id,)
+        )
+
+    def by_transcript(self, transcript_hash: str) -> List[StoredWorkItem]:
+        return self._query(
+            "SELECT * FROM work_items WHERE transcript_hash = ? "
+            "ORDER BY created_at, item_index",
+            (transcript_hash,),
+        )
+
+    def by_project(
+        self,
+        project: str,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> List[StoredWorkItem]:
+        return self._query(
+            "SELECT * FROM work_items WHERE project = ? "
+            "AND created_at >= ? AND created_at < ? ORDER BY created_at, item_index",
+            (project, since or 0.0, until or float("inf")),
+        )
+
+    def history(
+        self,
+        project: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> Iterator[StoredWorkItem]:
+        """Yields stored items by creation time, optionally filtered by project and date range."""
+        query = "SELECT * FROM work_items WHERE created_at >= ? AND created_at < ?"
+        params: list = [since or 0.0, until or float("inf")]
+
+        if project is not None:
+            query += " AND project = ?"
+            params.append(project)
+
+        with self._lock:
+            rows = self._conn.execute(
+                query + " ORDER BY created_at, item_index", params
+            ).fetchall()
+
+        for row in rows:
+            yield StoredWorkItem(row)
+
+    def export_history(
+        self,
+        outpath: str,
+        project: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> int:
+        """Writes matching items to `outpath` as JSON lines. Returns the item count."""
+        count = 0
+        with open(outpath, "w", encoding="utf-8") as f:
+            for stored in self.history(project, since, until):
+                f.write(json.dumps(stored.to_dict()) + "\n")
+                count += 1
+
+        logger.success(f"Exported {count} stored work items to: {outpath}")
+        return count
+
+    def compact(
+        self, keep_runs: Optional[int] = None, older_than: Optional[float] = None
+    ) -> int:
+        """
+        Reclaims disk space and refreshes query planner statistics. History is only
+        deleted when `keep_runs` is given: then all but the newest `keep_runs` runs
+        for each combination of transcript, project, model and prompt type are
+        removed, limited to runs last written before `older_than` if set.
+
+        Returns: The number of removed items.
+        """
+        removed = 0
+
+        with self._lock:
+            if keep_runs is not None:
+                query = """
+                    DELETE FROM work_items WHERE run_id IN (
+                        SELECT run_id FROM (
+                            SELECT run_id, MAX(created_at) AS run_created, ROW_NUMBER() OVER (
+                                PARTITION BY transcript_hash, project, model, prompt_type
+                                ORDER BY MAX(created_at) DESC
+                            ) AS run_rank
+                            FROM work_items
+                            GROUP BY run_id, transcript_hash, project, model, prompt_type
+                        ) WHERE run_rank > ?{age}
+                    )
+                """
+                params: list = [keep_runs]
+                if older_than is not None:
+                    params.append(older_than)
+
+                with self._conn:
+                    removed = self._conn.execute(
+                        query.format(
+                            age=" AND run_created < ?" if older_than is not None else ""
+                        ),
+                        params,
+                    ).rowcount
+
+            self._conn.execute("ANALYZE")
+            self._conn.execute("VACUUM")
+
+        if keep_runs is None:
+            logger.info("Compacted work item store; no history was removed.")
+        else:
+            logger.warning(
+                f"Compacted work item store: permanently removed {removed} superseded items."
+            )
+        return removed
+
+    def links_for_transcript(
+        self, client: str, project: str, transcript: str
+    ) -> List[RemoteLink]:
+        """Returns every remote ticket previously published for a transcript."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM remote_links WHERE client = ? AND project = ? AND transcript = ?",
+                (client, project, transcript),
+            ).fetchall()
+        return [RemoteLink(row) for row in rows]
+
+    def save_link(
+        self,
+        client: str,
+        project: str,
+        fingerprint: str,
+        transcript: str,
+        title: str,
+        remote_id: str,
+        fields: Dict[str, Any],
+    ) -> None:
+        """Records (or re-points) the remote ticket for a fingerprint and the fields last sent."""
+        with self._lock, self._conn:
+            # A remote ticket belongs to exactly one fingerprint
+            self._conn.execute(
+                "DELETE FROM remote_links WHERE client = ? AND project = ? AND remote_id = ?",
+                (client, project, remote_id),
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO remote_links VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    client,
+                    project,
+                    fingerprint,
+                    transcript,
+                    title,
+                    remote_id,
+                    json.dumps(fields, sort_keys=True),
+                    time.time(),
+                ),
+            )
+
+    def _query(self, query: str, params: tuple) -> List[StoredWorkItem]:
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [StoredWorkItem(row) for row in rows]
@@ -0,0 +1,231 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from enum import Enum
+from typing import Dict, List, Optional
+
+from clarity.log import logger
+from clarity.work_item import WorkItem
+
+
+class JobStage(Enum):
+    """Checkpoints a transcript job passes through, in order."""
+
+    PENDING = "pending"
+    GENERATED = "generated"
+    PARSED = "parsed"
+    SAVED = "saved"
+    POSTED = "posted"
+    FAILED = "failed"
+
+
+class Job:
+    """A snapshot of one transcript job as recorded in the queue."""
+
+    def __init__(self, row: sqlite3.Row, posted: Dict[str, Dict[int, str]]):
+        self.id: str = row["id"]
+        self.transcript_filename: str = row["transcript_filename"]
+        self.prompt_type: str = row["prompt_type"]
+        self.iteration: str = row["iteration"]
+        self.stage: JobStage = JobStage(row["stage"])
+        self.response: Optional[str] = row["response"]
+        self.error: Optional[str] = row["error"]
+        # Failed attempts at the current stage
+        self.attempts: int = row["attempts"]
+        self.created_at: float = row["created_at"]
+        self.updated_at: float = row["updated_at"]
+
+        # Target key -> item index -> remote ID for every item already uploaded
+        self.posted: Dict[str, Dict[int, str]] = posted
+
+        self._work_items_json: Optional[str] = row["work_items"]
+
+    @property
+    def work_items(self) -> List[WorkItem]:
+        if not self._work_items_json:
+            return []
+        return [WorkItem(**data) for data in json.loads(self._work_items_json)]
+
+    def posted_to(self, target: str) -> Dict[int, str]:
+        """Item index -> remote ID of the items already uploaded to `target`."""
+        return dict(self.posted.get(target, {}))
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "transcript_filename": self.transcript_filename,
+            "prompt_type": self.prompt_type,
+            "iteration": self.iteration,
+            "stage": self.stage.value,
+            "error": self.error,
+            "attempts": self.attempts,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "posted": {
+                target: {str(index): remote for index, remote in items.items()}
+                for target, items in self.posted.items()
+            },
+        }
+
+
+class JobQueue:
+    """
+    A small persistent job queue backed by SQLite.
+
+    Every stage transition of a transcript job is committed before the next stage
+    starts, so a restarted process can resume each job from its last checkpoint
+    instead of repeating generation or uploads.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            id TEXT PRIMARY KEY,
+            transcript_filename TEXT NOT NULL,
+            prompt_type TEXT NOT NULL,
+            iteration TEXT NOT NULL,
+            stage TEXT NOT NULL,
+            response TEXT,
+            work_items TEXT,
+            error TEXT,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS jobs_stage ON jobs (stage);
+        CREATE TABLE IF NOT EXISTS job_items (
+            job_id TEXT NOT NULL,
+            target TEXT NOT NULL,
+            item_index INTEGER NOT NULL,
+            remote_id TEXT NOT NULL,
+            posted_at REAL NOT NULL,
+            PRIMARY KEY (job_id, target, item_index)
+        );
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(self._SCHEMA)
+
+    def enqueue(
+        self, transcript_filename: str, prompt_type: str, iteration: str
+    ) -> Job:
+        job_id = uuid.uuid4().hex
+        now = time.time()
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO jobs (id, transcript_filename, prompt_type, iteration, stage, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job_id,
+                    transcript_filename,
+                    prompt_type,
+                    iteration,
+                    JobStage.PENDING.value,
+                    now,
+                    now,
+                ),
+            )
+
+        logger.info(f"Queued job {job_id} for transcript '{transcript_filename}'.")
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            return Job(row, self._posted(job_id))
+
+    def incomplete(self) -> List[Job]:
+        """Returns every job that has not yet been fully posted or failed, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM jobs WHERE stage NOT IN (?, ?) ORDER BY created_at",
+                (JobStage.POSTED.value, JobStage.FAILED.value),
+            ).fetchall()
+            return [Job(row, self._posted(row["id"])) for row in rows]
+
+    def mark_generated(self, job_id: str, response: str) -> None:
+        self._update(job_id, JobStage.GENERATED, response=response)
+
+    def mark_parsed(self, job_id: str, work_items: List[WorkItem]) -> None:
+        work_items_json = json.dumps([wi.model_dump() for wi in work_items])
+        self._update(job_id, JobStage.PARSED, work_items=work_items_json)
+
+    def mark_saved(self, job_id: str) -> None:
+        self._update(job_id, JobStage.SAVED)
+
+    def mark_item_posted(
+        self, job_id: str, item_index: int, remote_id: str, target: str
+    ) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO job_items (job_id, target, item_index, remote_id, posted_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (job_id, target, item_index, remote_id, time.time()),
+            )
+
+    def mark_posted(self, job_id: str) -> None:
+        self._update(job_id, JobStage.POSTED)
+
+    def mark_failed(self, job_id: str, error: str) -> None:
+        self._update(job_id, JobStage.FAILED, error=error)
+
+    def record_error(self, job_id: str, error: str) -> int:
+        """
+        Records a recoverable error without moving the job off its checkpoint.
+        Returns the number of failed attempts at the current stage.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET error = ?, attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                (error, time.time(), job_id),
+            )
+            row = self._conn.execute(
+                "SELECT attempts FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return row["attempts"] if row else 0
+
+    def _update(self, job_id: str, stage: JobStage, **fields: Optional[str]) -> None:
+        assignments = ["stage = ?", "updated_at = ?"]
+        values: list = [stage.value, time.time()]
+
+        # Progressing to a new stage resets the attempt count; failing keeps it
+        if stage != JobStage.FAILED:
+            assignments.append("attempts = 0")
+
+        for column, value in fields.items():
+            assignments.append(f"{column} = ?")
+            values.append(value)
+
+        if "error" not in fields:
+            assignments.append("error = NULL")
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"UPDATE jobs SET {', '.join(assignments)} WHERE id = ?",
+                (*values, job_id),
+            )
+
+    def _posted(self, job_id: str) -> Dict[str, Dict[int, str]]:
+        rows = self._conn.execute(
+            "SELECT target, item_index, remote_id FROM job_items WHERE job_id = ?",
+            (job_id,),
+        ).fetchall()
+
+        posted: Dict[str, Dict[int, str]] = {}
+        for row in rows:
+            posted.setdefault(row["target"], {})[row["item_index"]] = row["remote_id"]
+        return posted
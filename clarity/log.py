@@ -1,10 +1,69 @@
+import atexit
+import contextlib
+import contextvars
+import json
 import logging
+import logging.handlers
+import queue
 import sys
-from typing import Any
+from typing import Any, Dict, Iterator, Optional
 
 # Define the custom log level once at the module level (standard practice)
 logging.addLevelName(25, "SUCCESS")
 
+# Fields attached to every record logged within a `log_context` block
+CONTEXT_FIELDS = ("run_id", "transcript", "stage", "target")
+
+_log_context: contextvars.ContextVar[Dict[str, Any]] = contextvars.ContextVar(
+    "clarity_log_context", default={}
+)
+
+
+@contextlib.contextmanager
+def log_context(**fields: Any) -> Iterator[None]:
+    """
+    Attaches structured fields (e.g. run_id, transcript, stage, target) to every
+    record logged by the current thread or task inside the block. Blocks can be
+    nested; inner fields override outer ones.
+    """
+    token = _log_context.set({**_log_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+
+class ContextFilter(logging.Filter):
+    """Copies the current log context onto each record in the logging thread."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = _log_context.get()
+        for field in CONTEXT_FIELDS:
+            setattr(record, field, context.get(field))
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as single-line JSON objects (JSON Lines)."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+
+        for field in CONTEXT_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+
+        return json.dumps(entry, default=str)
+
 
 class StandardLogger:
     """
@@ -12,16 +71,26 @@ class StandardLogger:
     and provide simple success/error methods.
     """
 
-    def __init__(self, name: str = "ApplicationLogger", level=logging.DEBUG):
+    def __init__(
+        self,
+        name: str = "ApplicationLogger",
+        level=logging.DEBUG,
+        json_format: bool = False,
+        queued: bool = False,
+    ):
         """
         Initializes the logger.
 
         Args:
             name (str): The name of the logger (will appear in log entries).
             level: The minimum logging level to process (e.g., logging.DEBUG, logging.INFO).
+            json_format (bool): Emit JSON lines instead of human-readable text.
+            queued (bool): Hand records to a background thread for formatting and I/O.
         """
         self.logger = logging.getLogger(name)
         self.logger.setLevel(level)
+        self.level = level
+        self._listener: Optional[logging.handlers.QueueListener] = None
 
         # Prevent log entries from propagating to the root logger handlers
         self.logger.propagate = False
@@ -32,20 +101,57 @@ class StandardLogger:
             lambda msg, *args, **kwargs: self.logger.log(25, msg, *args, **kwargs),
         )
 
+        # Context is captured by a logger-level filter so it is read in the
+        # calling thread, even when output is handled by the queue listener
+        if not any(isinstance(f, ContextFilter) for f in self.logger.filters):
+            self.logger.addFilter(ContextFilter())
+
         # Check if a handler is already attached to prevent duplicate messages
         if not self.logger.handlers:
-            # Create a StreamHandler to output to the console (stderr is standard for logs)
-            handler = logging.StreamHandler(sys.stderr)
-            handler.setLevel(level)
+            self.configure(json_format=json_format, queued=queued)
 
+    def configure(self, json_format: bool = False, queued: bool = False) -> None:
+        """
+        Replaces the output handlers.
+
+        Args:
+            json_format (bool): Emit JSON lines instead of human-readable text.
+            queued (bool): Hand records to a background thread for formatting and I/O.
+        """
+        self.shutdown()
+        for existing in list(self.logger.handlers):
+            self.logger.removeHandler(existing)
+
+        # Create a StreamHandler to output to the console (stderr is standard for logs)
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setLevel(self.level)
+
+        if json_format:
+            formatter: logging.Formatter = JsonFormatter()
+        else:
             # Define the standardized format
             formatter = logging.Formatter(
                 "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
                 datefmt="%Y-%m-%d %H:%M:%S",
             )
-            handler.setFormatter(formatter)
+        handler.setFormatter(formatter)
 
+        if not queued:
             self.logger.addHandler(handler)
+            return
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._listener = logging.handlers.QueueListener(
+            log_queue, handler, respect_handler_level=True
+        )
+        self._listener.start()
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    def shutdown(self) -> None:
+        """Flushes and stops the background listener, if one is running."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
 
     def info(self, message: str):
         """Logs an informational message."""
@@ -67,3 +173,6 @@ class StandardLogger:
 # Initialize the logger instance
 # You can give it a specific name relevant to the module or component
 logger = StandardLogger(name="WorkflowManagerLogger")
+
+# Drain any queued records before the interpreter exits
+atexit.register(logger.shutdown)
@@ -1,31 +1,62 @@
-from typing import List
+import contextlib
+import contextvars
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
 
 from clarity.agents.interface import IAgent
-from clarity.clients.azure import AzureClient
 from clarity.clients.interface import ClientEnum, IClient
-from clarity.log import logger
+from clarity.jobs import Job, JobQueue, JobStage
+from clarity.log import log_context, logger
 from clarity.parse import WorkflowManagerParser
-from clarity.clients.plane import PlaneClient
 from clarity.prompt import PromptType, SystemPrompt
 from clarity.storage import Storage
-from clarity.agents.ollama import OllamaAgent
+from clarity.sync import WorkItemSynchronizer, title_occurrences
+from clarity.targets import PublishTarget, TargetResult
 from clarity.work_item import WorkItem
 from clarity.config import Config
 
+if TYPE_CHECKING:
+    from clarity.profiling import RunProfiler
+
 
 class WorkflowManager:
     client: IClient
     agent: IAgent
 
     def __init__(self, agent: IAgent, client: IClient, config: Config):
+        # Configure output first so every start-up line uses the chosen format
+        logger.configure(
+            json_format=config.LOG_FORMAT == "json", queued=config.LOG_QUEUED
+        )
+
         self.agent = agent
         self.client = client
 
         self.store = Storage(config)
+        self.jobs = JobQueue(config.JOB_DB_PATH)
         self.config = config
 
+        # Optionally bounds how many jobs run the non-generation stages at once
+        self.stage_slots: Optional[threading.BoundedSemaphore] = None
+
+        # The client's own board is the primary target; add_target mirrors to more
+        self.targets: List[PublishTarget] = []
+        self.synchronizers: Dict[str, WorkItemSynchronizer] = {}
+        self.add_target(PublishTarget.for_client(client, config))
+
         logger.info("WorkflowManager initialized successfully.")
-        logger.info(f"Targeting model: {self.config.MODEL_NAME}")
+        logger.info(f"Targeting model: {self.agent.model_name}")
+
+    def add_target(self, target: PublishTarget) -> None:
+        """Publishes every job's work items to `target` as well."""
+        self.targets.append(target)
+        self.synchronizers[target.key] = WorkItemSynchronizer(
+            target.client, self.store.items
+        )
+        logger.info(f"Publishing to target: {target.key}")
 
     def load_transcript(self, filename: str) -> str:
         """Loads the transcript file content."""
@@ -37,35 +68,102 @@ class WorkflowManager:
         prompt = SystemPrompt(prompt_type)
         return prompt.content()
 
-    def save_work_items(self, work_items: List[WorkItem]) -> None:
-        """Saves the generated work items to a local JSON file."""
-        self.store.save_work_items(work_items)
+    def save_work_items(
+        self,
+        work_items: List[WorkItem],
+        run_id: str,
+        transcript_filename: str,
+        prompt_type: PromptType,
+    ) -> bool:
+        """Appends the generated work items to the local work item store."""
+        return self.store.save_work_items(
+            work_items,
+            run_id,
+            transcript_filename,
+            project=self.targets[0].project,
+            model=self.agent.model_name,
+            prompt_type=prompt_type.value,
+        )
 
-    def generate_work_items(
+    def generate_response(
         self, transcript_filename: str, prompt_type: PromptType = PromptType.A
-    ) -> List[WorkItem]:
+    ) -> str:
         """
-        Loads prompt and transcript, sends to Ollama, and parses the JSON response.
+        Loads prompt and transcript and sends them to the agent. Returns the raw response.
         """
         logger.info(f"Starting work item generation process.")
 
+        if self.config.TRANSCRIPT_CHUNK_CHARS > 0:
+            return self.generate_chunked_response(transcript_filename, prompt_type)
+
         # 1. Load Data
         transcript = self.load_transcript(transcript_filename)
         if not transcript:
             logger.error(
                 f"Transcript file '{transcript_filename}' could not be loaded. Aborting generation."
             )
-            return []
+            return ""
 
         prompt = self.load_prompt(prompt_type)
 
         # 2. Generate Response
-        response = self.agent.generate_work_items(prompt, transcript)
+        response = self.agent.generate_work_items(prompt, transcript, prompt_type)
 
         if not response:
             logger.error("Ollama returned an empty response. Cannot parse work items.")
-            return []
+            return ""
+
+        return response
+
+    def generate_chunked_response(
+        self, transcript_filename: str, prompt_type: PromptType = PromptType.A
+    ) -> str:
+        """
+        Streams the transcript in segments of TRANSCRIPT_CHUNK_CHARS, generates work
+        items for each segment, and merges them into a single response document.
+
+        Returns "" if any segment fails, so the job stays pending and a resume
+        regenerates it instead of checkpointing a response with items missing.
+        """
+        prompt = self.load_prompt(prompt_type)
+        segments = self.store.iter_transcript_segments(
+            transcript_filename, self.config.TRANSCRIPT_CHUNK_CHARS
+        )
+
+        merged: List[dict] = []
+        chunk_count = 0
+
+        for index, segment in enumerate(segments):
+            chunk_count += 1
+            logger.info(f"Generating work items for transcript segment {index + 1}.")
+
+            response = self.agent.generate_work_items(prompt, segment, prompt_type)
+
+            try:
+                merged.extend(json.loads(response)["work_items"])
+            except (json.JSONDecodeError, KeyError, TypeError) as e:
+                logger.error(
+                    f"Segment {index + 1} returned an unusable agent response ({e}). "
+                    "Aborting generation."
+                )
+                return ""
 
+        if chunk_count == 0:
+            logger.error(
+                f"Transcript file '{transcript_filename}' could not be loaded. Aborting generation."
+            )
+            return ""
+
+        if not merged:
+            logger.error(
+                "Ollama returned no usable responses. Cannot parse work items."
+            )
+            return ""
+
+        return json.dumps({"work_items": merged})
+
+    def parse_work_items(self, response: str) -> List[WorkItem]:
+        """Validates the raw agent response into WorkItem objects."""
         work_items = WorkflowManagerParser.parse_work_package_json_str(response)
 
         if not work_items:
@@ -77,83 +175,398 @@ class WorkflowManager:
         )
         return work_items
 
-    def create_tasks(self, work_items: List[WorkItem], iteration: str) -> None:
-        """Uploads the generated work items to the Plane project management tool."""
+    def generate_work_items(
+        self, transcript_filename: str, prompt_type: PromptType = PromptType.A
+    ) -> List[WorkItem]:
+        """
+        Loads prompt and transcript, sends to Ollama, and parses the JSON response.
+        """
+        response = self.generate_response(transcript_filename, prompt_type)
+
+        if not response:
+            return []
 
-        # workspace_project = self._get_workspace_project()
-        # workspace = workspace_project[0]
-        # project = workspace_project[1]
-        [workspace, project] = self._get_workspace_project()
+        return self.parse_work_items(response)
 
-        if not workspace or not project:
-            logger.error(
-                "Configuration (workspace/project) is missing. Skipping upload."
+    def post_work_items(self, job: Job) -> bool:
+        """
+        Uploads the job's work items to every target concurrently, so one generated
+        item set feeds all boards in about the time of the slowest upload.
+        """
+        if len(self.targets) == 1:
+            results = [self._post_to_target(job, self.targets[0])]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=len(self.targets), thread_name_prefix="publish"
+            ) as pool:
+                # Each worker runs in a copy of the caller's log context
+                futures = [
+                    pool.submit(
+                        contextvars.copy_context().run,
+                        self._post_to_target,
+                        job,
+                        target,
+                    )
+                    for target in self.targets
+                ]
+                results = [future.result() for future in futures]
+
+        for result in results:
+            if result.ok:
+                logger.success(f"Published to {result.summary()}.")
+            else:
+                logger.error(f"Publishing incomplete for {result.summary()}.")
+
+        return all(result.ok for result in results)
+
+    def _post_to_target(self, job: Job, target: PublishTarget) -> TargetResult:
+        """
+        Uploads the job's work items to one target one by one, checkpointing each
+        success so a resumed job only posts the items still missing on that board.
+        """
+        work_items = job.work_items
+        result = TargetResult(target.key, len(work_items))
+
+        with log_context(target=target.key):
+            if not target.workspace or not target.project:
+                logger.error(
+                    "Configuration (workspace/project) is missing. Skipping upload."
+                )
+                result.error = "workspace/project not configured"
+                return result
+
+            posted = job.posted_to(target.key)
+            pending = [i for i in range(len(work_items)) if i not in posted]
+            result.posted = len(work_items) - len(pending)
+            iteration = target.iteration_for(job.iteration)
+            synchronizer = self.synchronizers[target.key]
+            occurrences = title_occurrences(work_items)
+
+            logger.info(
+                f"Attempting to create {len(pending)} of {len(work_items)} items in "
+                f"{target.client.name().value} Project {target.project}..."
             )
-            return
 
-        logger.info(
-            f"Attempting to create {len(work_items)} items in Plane Project {project}..."
-        )
-
-        success = self.client.create_work_items(
-            workspace, project, work_items, iteration
-        )
+            try:
+                if self.config.SYNC_MODE:
+                    sync_result = synchronizer.sync(
+                        target.workspace,
+                        target.project,
+                        job.transcript_filename,
+                        {index: work_items[index] for index in pending},
+                        iteration,
+                        claimed=set(posted.values()),
+                        occurrences={index: occurrences[index] for index in pending},
+                    )
+                    for index, remote_id in sync_result.remote_ids.items():
+                        self.jobs.mark_item_posted(job.id, index, remote_id, target.key)
+                    result.posted += len(sync_result.remote_ids)
+                    result.failed = sync_result.failed
+                else:
+                    for index in pending:
+                        remote_id = target.client.create_work_item(
+                            target.workspace,
+                            target.project,
+                            work_items[index],
+                            iteration,
+                        )
+                        if not remote_id:
+                            result.failed += 1
+                            continue
+
+                        self.jobs.mark_item_posted(job.id, index, remote_id, target.key)
+                        synchronizer.record(
+                            target.workspace,
+                            target.project,
+                            job.transcript_filename,
+                            work_items[index],
+                            iteration,
+                            remote_id,
+                            occurrences[index],
+                        )
+                        result.posted += 1
+            except Exception as e:
+                # One failing board must not stop the others; resume retries it
+                logger.error(f"Publishing to {target.key} failed: {e}")
+                result.error = str(e)
+
+            if result.failed:
+                logger.error(
+                    f"{result.failed} work items failed to post. Resume the job to retry them."
+                )
+
+        return result
+
+    def process_job(self, job: Job) -> None:
+        """
+        Drives a job from its last checkpoint to completion, recording every stage
+        transition in the job queue before moving on.
+        """
+        with log_context(run_id=job.id, transcript=job.transcript_filename):
+            profiler = self._profiler(job) if self.config.PROFILE else None
+            try:
+                self._process_job(job, profiler)
+            finally:
+                if profiler is not None:
+                    profiler.finish()
+
+    def _profiler(self, job: Job) -> "RunProfiler":
+        # Profiling support is only imported when a run asks for it
+        from clarity.profiling import RunProfiler
+
+        output_dir = os.path.join(self.config.WORK_PACKAGE_PATH, "profiles", job.id)
+        return RunProfiler(job.id, output_dir, self.config.PROFILE_TOP)
+
+    @contextlib.contextmanager
+    def _stage(self, name: str, profiler: Optional["RunProfiler"]) -> Iterator[None]:
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(log_context(stage=name))
+            # Generation is bounded by the agent's own scheduling instead
+            if self.stage_slots is not None and name != "generate":
+                stack.enter_context(self.stage_slots)
+            if profiler is not None:
+                stack.enter_context(profiler.stage(name))
+            yield
+
+    def _process_job(self, job: Job, profiler: Optional["RunProfiler"] = None) -> None:
+        prompt_type = PromptType(job.prompt_type)
+
+        if job.stage == JobStage.PENDING:
+            with self._stage("generate", profiler):
+                if not self.store.transcript_exists(job.transcript_filename):
+                    # Retrying cannot help; fail the job instead of resuming it forever
+                    self.jobs.mark_failed(job.id, "Transcript file not found.")
+                    logger.error(
+                        f"Run aborted: Transcript '{job.transcript_filename}' not found."
+                    )
+                    return
+
+                response = self.generate_response(job.transcript_filename, prompt_type)
+                if not response:
+                    self._generation_failed(job)
+                    return
+                self.jobs.mark_generated(job.id, response)
+                job = self.jobs.get(job.id)
+
+        if job.stage == JobStage.GENERATED:
+            with self._stage("parse", profiler):
+                work_items = self.parse_work_items(job.response or "")
+                if not work_items:
+                    self.jobs.mark_failed(job.id, "No valid work items in response.")
+                    logger.error("Run aborted: No work items generated.")
+                    return
+                self.jobs.mark_parsed(job.id, work_items)
+                job = self.jobs.get(job.id)
+
+        if job.stage == JobStage.PARSED:
+            with self._stage("save", profiler):
+                if not self.save_work_items(
+                    job.work_items, job.id, job.transcript_filename, prompt_type
+                ):
+                    # Stay at the parsed checkpoint so a resume retries the save
+                    self.jobs.record_error(job.id, "Work items could not be saved.")
+                    logger.error("Run aborted: Work items could not be saved.")
+                    return
+                self.jobs.mark_saved(job.id)
+                job = self.jobs.get(job.id)
+
+        if job.stage == JobStage.SAVED:
+            with self._stage("post", profiler):
+                if self.post_work_items(job):
+                    self.jobs.mark_posted(job.id)
+                else:
+                    self.jobs.record_error(
+                        job.id, "One or more work items failed to post."
+                    )
+
+    def _generation_failed(self, job: Job) -> None:
+        """
+        Leaves the job pending so a later resume retries generation, until it has
+        failed JOB_MAX_ATTEMPTS times in a row.
+        """
+        error = "Generation returned no response."
+        attempts = self.jobs.record_error(job.id, error)
+        max_attempts = self.config.JOB_MAX_ATTEMPTS
 
-        if success:
-            logger.success("All work items successfully posted to Plane.")
+        if max_attempts > 0 and attempts >= max_attempts:
+            self.jobs.mark_failed(job.id, f"{error} Gave up after {attempts} attempts.")
+            logger.error(f"Run failed: No work items generated in {attempts} attempts.")
         else:
-            logger.error(
-                "One or more work items failed to post to Plane. Check previous error logs."
-            )
+            logger.error("Run aborted: No work items generated.")
 
     def run(
         self,
         transcript_filename: str = "meeting_transcript.txt",
         prompt_type: PromptType = PromptType.B,
         iteration: str = "Iteration 1",
-    ) -> None:
+    ) -> Job:
         """
         The main execution flow: loads transcript, generates tasks, saves locally, and posts to Plane.
         """
         logger.info("--- Starting WorkflowManager Run ---")
 
-        # 1. Generate Work Items
-        work_items = self.generate_work_items(transcript_filename, prompt_type)
+        job = self.jobs.enqueue(transcript_filename, prompt_type.value, iteration)
+        self.process_job(job)
 
-        if not work_items:
-            logger.error("Run aborted: No work items generated.")
-            return
+        logger.info("--- WorkflowManager Run Complete ---")
+        return self.jobs.get(job.id)
 
-        # 2. Save Locally
-        self.save_work_items(work_items)
+    def resume(self) -> List[Job]:
+        """Resumes every unfinished job from its last recorded checkpoint."""
+        jobs = self.jobs.incomplete()
+        logger.info(f"Resuming {len(jobs)} unfinished jobs.")
 
-        # 3. Create Plane Tasks
-        self.create_tasks(work_items, iteration)
+        for job in jobs:
+            logger.info(f"Resuming job {job.id} from stage '{job.stage.value}'.")
+            self.process_job(job)
 
-        logger.info("--- WorkflowManager Run Complete ---")
+        return [self.jobs.get(job.id) for job in jobs]
+
+    @staticmethod
+    def wrap_agent(agent: IAgent, config: Config) -> IAgent:
+        """Layers the configured request-shaping wrappers around a backend agent."""
+        # A routing agent already limits each of its models
+        if config.ADAPTIVE_CONCURRENCY and getattr(agent, "limiter", None) is None:
+            from clarity.agents.adaptive import AdaptiveAgent
 
-    def _get_workspace_project(self) -> List[str]:
-        if self.client.name() == ClientEnum.AZURE:
-            workspace = self.config.AZURE_WORKSPACE
-            project = self.config.AZURE_PROJECT
-            return [workspace, project]
-        elif self.client.name() == ClientEnum.PLANE:
-            workspace = self.config.PLANE_WORKSPACE_SLUG
-            project = self.config.PLANE_PROJECT_ID
-            return [workspace, project]
+            agent = AdaptiveAgent(agent, config)
 
-        return []
+        # Requests wait for a scheduler slot before reaching the limiter, so they
+        # are admitted in priority order
+        if config.PRIORITY_SCHEDULING:
+            from clarity.agents.scheduled import ScheduledAgent
+
+            agent = ScheduledAgent(agent, config)
+
+        # Coalescing sits outside the limiter so duplicates never take a slot
+        if config.COALESCE_REQUESTS:
+            from clarity.agents.coalesce import CoalescingAgent
+
+            agent = CoalescingAgent(agent)
+
+        return agent
+
+    # Backends are imported inside the factories so that only the SDKs of the
+    # agent and client actually constructed are loaded.
 
     @staticmethod
-    def ollama_plane():
-        config = Config()
-        agent = OllamaAgent(config)
-        client = PlaneClient(config)
-        return WorkflowManager(agent, client, config)
+    def _ollama_agent(config: Config) -> IAgent:
+        if config.MODEL_ROUTES:
+            from clarity.agents.router import RoutingAgent
+
+            return WorkflowManager._recorded_agent(
+                RoutingAgent.from_config(config), config
+            )
+
+        from clarity.agents.ollama import OllamaAgent
+
+        return WorkflowManager._recorded_agent(OllamaAgent(config), config)
+
+    @staticmethod
+    def _client(name: str, config: Config) -> IClient:
+        if name == "azure":
+            from clarity.clients.azure import AzureClient
+
+            return WorkflowManager._recorded_client(AzureClient(config), config)
+        elif name == "plane":
+            from clarity.clients.plane import PlaneClient
+
+            return WorkflowManager._recorded_client(PlaneClient(config), config)
+        elif name == "stub":
+            from clarity.clients.stub import StubClient
+
+            return StubClient()
+
+        raise ValueError(f"Unknown client '{name}' in MIRROR_CLIENTS.")
+
+    # With RECORD_CASSETTE set, backends are wrapped so their traffic is captured
+    # beneath the request-shaping wrappers, i.e. with backend-only latencies.
+
+    @staticmethod
+    def _recorded_agent(agent: IAgent, config: Config) -> IAgent:
+        if not config.RECORD_CASSETTE:
+            return agent
+
+        from clarity.agents.replay import RecordingAgent
+        from clarity.cassette import Cassette
+
+        return RecordingAgent(agent, Cassette.for_path(config.RECORD_CASSETTE))
+
+    @staticmethod
+    def _recorded_client(client: IClient, config: Config) -> IClient:
+        if not config.RECORD_CASSETTE:
+            return client
+
+        from clarity.clients.replay import RecordingClient
+        from clarity.cassette import Cassette
+
+        return RecordingClient(client, Cassette.for_path(config.RECORD_CASSETTE))
+
+    def _add_mirrors(self) -> "WorkflowManager":
+        """Adds a target for every client in MIRROR_CLIENTS besides the primary one."""
+        primary = self.client.name().value.lower()
+        for name in self.config.MIRROR_CLIENTS:
+            if name != primary:
+                client = WorkflowManager._client(name, self.config)
+                self.add_target(PublishTarget.for_client(client, self.config))
+        return self
 
     @staticmethod
-    def ollama_azure():
-        config = Config()
-        agent = OllamaAgent(config)
-        client = AzureClient(config)
+    def ollama_plane(config: Optional[Config] = None):
+        from clarity.clients.plane import PlaneClient
+
+        config = config or Config()
+        agent = WorkflowManager.wrap_agent(
+            WorkflowManager._ollama_agent(config), config
+        )
+        client = WorkflowManager._recorded_client(PlaneClient(config), config)
+        return WorkflowManager(agent, client, config)._add_mirrors()
+
+    @staticmethod
+    def ollama_azure(config: Optional[Config] = None):
+        from clarity.clients.azure import AzureClient
+
+        config = config or Config()
+        agent = WorkflowManager.wrap_agent(
+            WorkflowManager._ollama_agent(config), config
+        )
+        client = WorkflowManager._recorded_client(AzureClient(config), config)
+        return WorkflowManager(agent, client, config)._add_mirrors()
+
+    @staticmethod
+    def stub(config: Optional[Config] = None):
+        from clarity.agents.stub import StubAgent
+        from clarity.clients.stub import StubClient
+
+        config = config or Config()
+        agent = WorkflowManager.wrap_agent(StubAgent(), config)
+        client = StubClient()
         return WorkflowManager(agent, client, config)
+
+    @staticmethod
+    def replay(path: str, config: Optional[Config] = None):
+        """
+        Serves generations and uploads from a recorded cassette, so a run can be
+        reproduced without a model or a board. Uses the same .env as the recording
+        so workspaces, projects and mirrors match the recorded calls.
+        """
+        from clarity.agents.replay import ReplayAgent
+        from clarity.cassette import Cassette
+        from clarity.clients.replay import ReplayClient
+
+        config = config or Config()
+        cassette = Cassette.for_path(path)
+        speed = config.REPLAY_SPEED
+
+        agent = WorkflowManager.wrap_agent(ReplayAgent(cassette, speed=speed), config)
+        clients = []
+        for entry in cassette.entries("client"):
+            if entry["client"] not in clients:
+                clients.append(entry["client"])
+
+        primary = ClientEnum(clients[0]) if clients else None
+        manager = WorkflowManager(agent, ReplayClient(cassette, primary, speed), config)
+        for name in clients[1:]:
+            client = ReplayClient(cassette, ClientEnum(name), speed)
+            manager.add_target(PublishTarget.for_client(client, config))
+        return manager
@@ -0,0 +1,172 @@
+import contextlib
+import cProfile
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from typing import Iterator, List, Optional
+
+from clarity.log import logger
+
+_MIB = 1024 * 1024
+
+# Allocations made by the profiler itself are left out of the memory statistics
+_SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+# tracemalloc is process-wide; concurrent profiled runs share one tracing session
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+_tracing_owned = False
+
+
+def _start_tracing() -> None:
+    global _tracing_users, _tracing_owned
+    with _tracing_lock:
+        if _tracing_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracing_owned = True
+        _tracing_users += 1
+
+
+def _stop_tracing() -> None:
+    global _tracing_users, _tracing_owned
+    with _tracing_lock:
+        _tracing_users -= 1
+        if _tracing_users == 0 and _tracing_owned:
+            tracemalloc.stop()
+            _tracing_owned = False
+
+
+def _short_path(path: str) -> str:
+    parts = path.replace("\\", "/").split("/")
+    return "/".join(parts[-2:])
+
+
+class StageProfile:
+    """CPU and memory measurements of one pipeline stage."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.seconds = 0.0
+        self.peak_bytes = 0
+        self.cpu_lines: List[str] = []
+        self.memory_lines: List[str] = []
+
+    def summary(self) -> str:
+        lines = [
+            f"Stage {self.name}: {self.seconds:.2f}s, "
+            f"peak +{self.peak_bytes / _MIB:.1f} MiB"
+        ]
+        if self.cpu_lines:
+            lines.append("  CPU (cumulative time):")
+            lines.extend(f"    {line}" for line in self.cpu_lines)
+        if self.memory_lines:
+            lines.append("  Memory (allocation growth):")
+            lines.extend(f"    {line}" for line in self.memory_lines)
+        return "\n".join(lines)
+
+
+class RunProfiler:
+    """
+    Profiles each stage of one run with cProfile and tracemalloc.
+
+    For every stage the raw cProfile stats (`<stage>.prof`, readable with pstats
+    or snakeviz) and a tracemalloc snapshot (`<stage>.tracemalloc`, readable with
+    `tracemalloc.Snapshot.load`) are written to `output_dir`, and `finish` writes
+    and logs a report of the top `top` functions and allocation sites per stage.
+
+    cProfile only sees the thread a stage runs on, so time spent in worker
+    threads (e.g. concurrent uploads to several boards) shows up as waiting.
+    """
+
+    def __init__(self, run_id: str, output_dir: str, top: int = 10):
+        self.run_id = run_id
+        self.output_dir = output_dir
+        self.top = top
+        self.stages: List[StageProfile] = []
+
+        os.makedirs(output_dir, exist_ok=True)
+        _start_tracing()
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        result = StageProfile(name)
+        profile: Optional[cProfile.Profile] = cProfile.Profile()
+
+        before = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+        try:
+            profile.enable()
+        except ValueError as e:
+            # Only one cProfile can be active at a time on some Python versions
+            logger.warning(f"CPU profiling of stage '{name}' skipped: {e}")
+            profile = None
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+            result.seconds = time.perf_counter() - start
+            result.peak_bytes = max(0, tracemalloc.get_traced_memory()[1] - baseline)
+
+            after = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+            self._write(result, profile, before, after)
+            self.stages.append(result)
+
+    def finish(self) -> str:
+        """Writes the run report next to the profiles, logs it and returns it."""
+        _stop_tracing()
+
+        report = "\n".join(
+            [f"Profile of run {self.run_id}"]
+            + [stage.summary() for stage in self.stages]
+        )
+        report_path = os.path.join(self.output_dir, "report.txt")
+        with open(report_path, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
+
+        logger.info(report)
+        logger.success(f"Saved run profile to: {self.output_dir}")
+        return report
+
+    def _write(
+        self,
+        result: StageProfile,
+        profile: Optional[cProfile.Profile],
+        before: tracemalloc.Snapshot,
+        after: tracemalloc.Snapshot,
+    ) -> None:
+        if profile is not None:
+            profile.dump_stats(os.path.join(self.output_dir, f"{result.name}.prof"))
+
+            stats = pstats.Stats(profile).stats  # type: ignore[attr-defined]
+            # (file, line, function) -> (prim. calls, calls, tottime, cumtime, callers)
+            rows = sorted(stats.items(), key=lambda row: row[1][3], reverse=True)
+            for (path, line, function), timings in rows[: self.top]:
+                calls, cumulative = timings[1], timings[3]
+                location = (
+                    f"{_short_path(path)}:{line}({function})" if line else function
+                )
+                result.cpu_lines.append(
+                    f"{cumulative:8.3f}s {calls:7d} calls  {location}"
+                )
+
+        after.dump(os.path.join(self.output_dir, f"{result.name}.tracemalloc"))
+        for diff in after.compare_to(before, "lineno")[: self.top]:
+            if diff.size_diff <= 0:
+                continue
+            frame = diff.traceback[0]
+            result.memory_lines.append(
+                f"{diff.size_diff / 1024:+9.1f} KiB {diff.count_diff:+7d} blocks  "
+                f"{_short_path(frame.filename)}:{frame.lineno}"
+            )
@@ -0,0 +1,302 @@
+import contextlib
+import contextvars
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from enum import Enum
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from clarity.config import Config
+
+
+class PriorityClass(Enum):
+    """Scheduling classes, highest priority first."""
+
+    INTERACTIVE = "interactive"
+    BULK = "bulk"
+
+
+_request_class: contextvars.ContextVar[Tuple[PriorityClass, str]] = (
+    contextvars.ContextVar(
+        "clarity_request_class", default=(PriorityClass.INTERACTIVE, "")
+    )
+)
+
+
+@contextlib.contextmanager
+def request_class(priority: PriorityClass, tenant: str = "") -> Iterator[None]:
+    """
+    Schedules every generation made by the current thread inside the block as
+    `priority` work on behalf of `tenant`.
+    """
+    token = _request_class.set((priority, tenant))
+    try:
+        yield
+    finally:
+        _request_class.reset(token)
+
+
+def current_request_class() -> Tuple[PriorityClass, str]:
+    return _request_class.get()
+
+
+def _rank(priority: PriorityClass) -> int:
+    return list(PriorityClass).index(priority)
+
+
+class _Waiter:
+    def __init__(self, priority: PriorityClass, tenant: str):
+        self.priority = priority
+        self.tenant = tenant
+        self.enqueued = time.monotonic()
+        self.granted = False
+
+
+class SharedPriority:
+    """
+    The priority of one request whose result several callers share. Raising it
+    promotes the request wherever it waits for a scheduler slot, so a shared
+    generation runs at the priority of its most urgent caller.
+    """
+
+    def __init__(self, priority: PriorityClass):
+        self.priority = priority
+        self._waiting: List[Tuple["FairScheduler", _Waiter]] = []
+        self._lock = threading.Lock()
+
+    def raise_to(self, priority: PriorityClass) -> None:
+        with self._lock:
+            if _rank(priority) >= _rank(self.priority):
+                return
+            self.priority = priority
+            waiting = list(self._waiting)
+
+        for scheduler, waiter in waiting:
+            scheduler.promote(waiter, priority)
+
+    def _attach(self, scheduler: "FairScheduler", waiter: _Waiter) -> PriorityClass:
+        with self._lock:
+            self._waiting.append((scheduler, waiter))
+            return self.priority
+
+    def _detach(self, scheduler: "FairScheduler", waiter: _Waiter) -> None:
+        with self._lock:
+            self._waiting.remove((scheduler, waiter))
+
+
+_shared_priority: contextvars.ContextVar[Optional[SharedPriority]] = (
+    contextvars.ContextVar("clarity_shared_priority", default=None)
+)
+
+
+@contextlib.contextmanager
+def shared_priority(shared: SharedPriority) -> Iterator[None]:
+    """Schedules every generation made inside the block at `shared`'s priority."""
+    token = _shared_priority.set(shared)
+    try:
+        yield
+    finally:
+        _shared_priority.reset(token)
+
+
+class FairScheduler:
+    """
+    Grants a limited number of generation slots on one model host.
+
+    Waiting requests are served strictly by class (interactive before bulk) and,
+    within a class, round-robin across tenants, so one tenant's backlog cannot
+    monopolize the host. Slots are taken per agent call, i.e. per transcript
+    chunk, so a long bulk job yields to interactive work at every chunk boundary.
+    A bulk request waiting longer than `starvation_seconds` is served next
+    regardless of class.
+    """
+
+    _instances: Dict[str, "FairScheduler"] = {}
+    _instances_lock = threading.Lock()
+
+    # Recent waits kept per class for the wait-time metrics
+    WAIT_SAMPLES = 512
+
+    def __init__(
+        self,
+        host: str,
+        slots: int = 2,
+        capacity: Optional[Callable[[], int]] = None,
+        starvation_seconds: float = 300.0,
+    ):
+        self.host = host
+        self.slots = slots
+        self.starvation_seconds = starvation_seconds
+        self._capacity = capacity
+
+        self.in_flight = 0
+        self._queues: Dict[PriorityClass, "OrderedDict[str, Deque[_Waiter]]"] = {
+            priority: OrderedDict() for priority in PriorityClass
+        }
+        self._running = {priority: 0 for priority in PriorityClass}
+        self._admitted = {priority: 0 for priority in PriorityClass}
+        self._waits: Dict[PriorityClass, Deque[float]] = {
+            priority: deque(maxlen=self.WAIT_SAMPLES) for priority in PriorityClass
+        }
+
+        self._cond = threading.Condition()
+
+    @classmethod
+    def for_host(
+        cls,
+        host: str,
+        config: Config,
+        capacity: Optional[Callable[[], int]] = None,
+    ) -> "FairScheduler":
+        """Returns the shared scheduler for `host`, creating it on first use."""
+        with cls._instances_lock:
+            instance = cls._instances.get(host)
+            if instance is None:
+                instance = cls(
+                    host,
+                    slots=config.SCHEDULER_SLOTS,
+                    capacity=capacity,
+                    starvation_seconds=config.SCHEDULER_STARVATION_SECONDS,
+                )
+                cls._instances[host] = instance
+            return instance
+
+    @classmethod
+    def all_metrics(cls) -> Dict[str, dict]:
+        with cls._instances_lock:
+            schedulers = list(cls._instances.values())
+        return {scheduler.host: scheduler.metrics() for scheduler in schedulers}
+
+    @contextlib.contextmanager
+    def slot(self, priority: PriorityClass, tenant: str = "") -> Iterator[None]:
+        waiter = self.acquire(priority, tenant)
+        try:
+            yield
+        finally:
+            self.release(waiter.priority)
+
+    def acquire(self, priority: PriorityClass, tenant: str = "") -> _Waiter:
+        """
+        Blocks until the scheduler grants this request a slot. Inside a
+        `shared_priority` block the request can be promoted while it waits.
+        Returns the granted request; release it with its final priority.
+        """
+        shared = _shared_priority.get()
+        waiter = _Waiter(priority, tenant)
+
+        with self._cond:
+            self._queues[priority].setdefault(tenant, deque()).append(waiter)
+            if shared is not None:
+                self._promote(waiter, shared._attach(self, waiter))
+            self._dispatch()
+            while not waiter.granted:
+                self._cond.wait()
+
+        if shared is not None:
+            shared._detach(self, waiter)
+        return waiter
+
+    def promote(self, waiter: _Waiter, priority: PriorityClass) -> None:
+        """Moves a still-waiting request up to `priority`."""
+        with self._cond:
+            self._promote(waiter, priority)
+            self._dispatch()
+
+    def release(self, priority: PriorityClass) -> None:
+        with self._cond:
+            self.in_flight -= 1
+            self._running[priority] -= 1
+            self._dispatch()
+
+    def metrics(self) -> dict:
+        with self._cond:
+            classes = {}
+            for priority in PriorityClass:
+                waits = sorted(self._waits[priority])
+                tenants = self._queues[priority]
+                classes[priority.value] = {
+                    "queued": sum(len(queue) for queue in tenants.values()),
+                    "running": self._running[priority],
+                    "admitted": self._admitted[priority],
+                    "queued_by_tenant": {
+                        tenant: len(queue) for tenant, queue in tenants.items()
+                    },
+                    "wait_mean": sum(waits) / len(waits) if waits else 0.0,
+                    "wait_p95": (
+                        waits[math.ceil(0.95 * len(waits)) - 1] if waits else 0.0
+                    ),
+                    "wait_max": waits[-1] if waits else 0.0,
+                }
+
+            return {
+                "capacity": self._current_capacity(),
+                "in_flight": self.in_flight,
+                "classes": classes,
+            }
+
+    def _current_capacity(self) -> int:
+        if self._capacity is not None:
+            return max(1, self._capacity())
+        return self.slots
+
+    def _promote(self, waiter: _Waiter, priority: PriorityClass) -> None:
+        """Requeues a waiter in a higher class. Called with the lock held."""
+        if waiter.granted or _rank(priority) >= _rank(waiter.priority):
+            return
+
+        tenants = self._queues[waiter.priority]
+        queue = tenants[waiter.tenant]
+        queue.remove(waiter)
+        if not queue:
+            del tenants[waiter.tenant]
+
+        waiter.priority = priority
+        self._queues[priority].setdefault(waiter.tenant, deque()).append(waiter)
+
+    def _dispatch(self) -> None:
+        """Grants free slots to the next waiters. Called with the lock held."""
+        granted = False
+        now = time.monotonic()
+
+        while self.in_flight < self._current_capacity():
+            waiter = self._next(now)
+            if waiter is None:
+                break
+
+            waiter.granted = True
+            granted = True
+            self.in_flight += 1
+            self._running[waiter.priority] += 1
+            self._admitted[waiter.priority] += 1
+            self._waits[waiter.priority].append(now - waiter.enqueued)
+
+        if granted:
+            self._cond.notify_all()
+
+    def _next(self, now: float) -> Optional[_Waiter]:
+        for priority in self._order(now):
+            tenants = self._queues[priority]
+            if not tenants:
+                continue
+
+            # Serve the tenant at the front, then rotate it to the back
+            tenant, queue = tenants.popitem(last=False)
+            waiter = queue.popleft()
+            if queue:
+                tenants[tenant] = queue
+            return waiter
+
+        return None
+
+    def _order(self, now: float) -> List[PriorityClass]:
+        order = list(PriorityClass)
+
+        bulk = self._queues[PriorityClass.BULK]
+        if bulk:
+            oldest = min(queue[0].enqueued for queue in bulk.values())
+            if now - oldest > self.starvation_seconds:
+                order.remove(PriorityClass.BULK)
+                order.insert(0, PriorityClass.BULK)
+
+        return order
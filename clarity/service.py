@@ -0,0 +1,268 @@
+import json
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from clarity.agents.adaptive import AdaptiveLimiter
+from clarity.jobs import Job
+from clarity.log import logger
+from clarity.manager import WorkflowManager
+from clarity.prompt import PromptType
+from clarity.scheduler import FairScheduler, PriorityClass, request_class
+
+
+class ServiceError(Exception):
+    """Raised for a client-side problem with a service request."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class WorkflowService:
+    """
+    A long-lived service that runs transcript jobs through a bounded worker pool.
+
+    All workers share one WorkflowManager, so the agent, client and job queue stay
+    warm between submissions. Jobs are recorded in the manager's job queue, so the
+    status of every job survives restarts and unfinished jobs resume on start-up.
+
+    Each job carries a priority class and tenant. With priority scheduling on,
+    every queued job gets a worker and the scheduler decides which job's
+    generation runs next, while `stage_workers` still bounds the jobs parsing,
+    saving and posting at once. Resumed jobs run as bulk work.
+    """
+
+    def __init__(
+        self,
+        manager: WorkflowManager,
+        workers: int,
+        queue_size: int,
+        stage_workers: Optional[int] = None,
+    ):
+        self.manager = manager
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="clarity-worker"
+        )
+        if stage_workers is not None:
+            manager.stage_slots = threading.BoundedSemaphore(stage_workers)
+
+        # Bounds queued + running jobs so a burst of submissions cannot grow memory unbounded
+        self._slots = threading.BoundedSemaphore(queue_size)
+
+    def submit(
+        self,
+        filename: Optional[str] = None,
+        transcript: Optional[str] = None,
+        prompt_type: str = PromptType.B.value,
+        iteration: str = "Iteration 1",
+        priority: str = PriorityClass.INTERACTIVE.value,
+        tenant: str = "",
+    ) -> Job:
+        """Queues a transcript, given either as an existing filename or as raw text."""
+        for field, value in (
+            ("filename", filename),
+            ("transcript", transcript),
+            ("prompt_type", prompt_type),
+            ("iteration", iteration),
+            ("priority", priority),
+            ("tenant", tenant),
+        ):
+            if value is not None and not isinstance(value, str):
+                raise ServiceError(400, f"'{field}' must be a string.")
+
+        try:
+            PromptType(prompt_type)
+        except ValueError:
+            raise ServiceError(400, f"Unknown prompt_type '{prompt_type}'.")
+
+        try:
+            priority_class = PriorityClass(priority)
+        except ValueError:
+            raise ServiceError(400, f"Unknown priority '{priority}'.")
+
+        if transcript is None and (
+            not filename or os.path.basename(filename) != filename
+        ):
+            raise ServiceError(400, "Provide 'transcript' text or a plain 'filename'.")
+
+        if transcript is None and not self.manager.store.transcript_exists(filename):
+            raise ServiceError(404, f"Transcript file '{filename}' not found.")
+
+        if not self._slots.acquire(blocking=False):
+            raise ServiceError(503, "Job queue is full. Retry later.")
+
+        if transcript is not None:
+            filename = f"submitted_{uuid.uuid4().hex}.txt"
+            if not self.manager.store.write_transcript(filename, transcript):
+                self._slots.release()
+                raise ServiceError(500, "Could not store submitted transcript.")
+
+        job = self.manager.jobs.enqueue(filename, prompt_type, iteration)
+        self.executor.submit(self._process, job.id, priority_class, tenant or "")
+        return job
+
+    def resume(self) -> None:
+        """Schedules every unfinished job left over from a previous process."""
+        for job in self.manager.jobs.incomplete():
+            if not self._slots.acquire(blocking=False):
+                logger.warning(
+                    "Job queue is full; remaining jobs resume on next start."
+                )
+                return
+            logger.info(f"Resuming job {job.id} from stage '{job.stage.value}'.")
+            self.executor.submit(self._process, job.id, PriorityClass.BULK, "")
+
+    def serve(self, host: str, port: int) -> None:
+        """Serves the HTTP API until interrupted."""
+        server = ThreadingHTTPServer((host, port), ServiceRequestHandler)
+        server.service = self  # type: ignore[attr-defined]
+
+        self.resume()
+        logger.info(f"Clarity service listening on http://{host}:{port}")
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Shutting down Clarity service.")
+        finally:
+            server.server_close()
+            self.executor.shutdown(wait=True)
+
+    def metrics(self) -> dict:
+        return {
+            "concurrency": AdaptiveLimiter.all_metrics(),
+            "scheduler": FairScheduler.all_metrics(),
+        }
+
+    def _process(self, job_id: str, priority: PriorityClass, tenant: str) -> None:
+        try:
+            job = self.manager.jobs.get(job_id)
+            if job is not None:
+                with request_class(priority, tenant):
+                    self.manager.process_job(job)
+        except Exception as e:
+            logger.error(f"Job {job_id} crashed in worker. Exception details: {e}")
+        finally:
+            self._slots.release()
+
+    @staticmethod
+    def from_config(manager: WorkflowManager) -> "WorkflowService":
+        config = manager.config
+        if not config.PRIORITY_SCHEDULING:
+            return WorkflowService(
+                manager, config.SERVICE_WORKERS, config.SERVICE_QUEUE_SIZE
+            )
+
+        # Scheduled jobs need a worker each to wait in the scheduler, whose slots
+        # bound concurrent generations; SERVICE_WORKERS bounds the other stages
+        return WorkflowService(
+            manager,
+            config.SERVICE_QUEUE_SIZE,
+            config.SERVICE_QUEUE_SIZE,
+            stage_workers=config.SERVICE_WORKERS,
+        )
+
+
+class ServiceRequestHandler(BaseHTTPRequestHandler):
+    """
+    HTTP API:
+        GET  /health                 -> {"status": "ok"}
+        GET  /metrics                -> concurrency limits and scheduler queues per model host
+        POST /jobs                   -> submit {"transcript" | "filename", "prompt_type", "iteration",
+                                                "priority", "tenant"}
+        GET  /jobs/<id>              -> job status
+        GET  /jobs/<id>/work_items   -> generated work items
+    """
+
+    server_version = "ClarityService/1.0"
+
+    @property
+    def service(self) -> WorkflowService:
+        return self.server.service  # type: ignore[attr-defined]
+
+    def do_GET(self) -> None:
+        parts = [part for part in self.path.split("?")[0].split("/") if part]
+
+        try:
+            if parts == ["health"]:
+                return self._send(200, {"status": "ok"})
+
+            if parts == ["metrics"]:
+                return self._send(200, self.service.metrics())
+
+            if len(parts) in (2, 3) and parts[0] == "jobs":
+                job = self.service.manager.jobs.get(parts[1])
+                if job is None:
+                    raise ServiceError(404, f"Job '{parts[1]}' not found.")
+
+                if len(parts) == 2:
+                    return self._send(200, job.to_dict())
+                if parts[2] == "work_items":
+                    items = [wi.model_dump() for wi in job.work_items]
+                    return self._send(200, {"id": job.id, "work_items": items})
+
+            raise ServiceError(404, "Not found.")
+
+        except ServiceError as e:
+            self._send(e.status, {"error": str(e)})
+
+        except Exception as e:
+            logger.error(f"Unhandled error serving {self.path}. Exception details: {e}")
+            self._send(500, {"error": "Internal server error."})
+
+    def do_POST(self) -> None:
+        try:
+            if self.path.split("?")[0].rstrip("/") != "/jobs":
+                raise ServiceError(404, "Not found.")
+
+            body = self._read_json()
+            job = self.service.submit(
+                filename=body.get("filename"),
+                transcript=body.get("transcript"),
+                prompt_type=body.get("prompt_type", PromptType.B.value),
+                iteration=body.get("iteration", "Iteration 1"),
+                priority=body.get("priority", PriorityClass.INTERACTIVE.value),
+                tenant=body.get("tenant", ""),
+            )
+            self._send(202, job.to_dict())
+
+        except ServiceError as e:
+            self._send(e.status, {"error": str(e)})
+
+        except Exception as e:
+            logger.error(f"Unhandled error serving {self.path}. Exception details: {e}")
+            self._send(500, {"error": "Internal server error."})
+
+    def log_message(self, format: str, *args) -> None:
+        logger.info(f"{self.address_string()} - {format % args}")
+
+    def _read_json(self) -> dict:
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            raise ServiceError(400, "Invalid Content-Length header.")
+        if length < 0:
+            raise ServiceError(400, "Invalid Content-Length header.")
+
+        raw = self.rfile.read(length) if length else b""
+
+        try:
+            body = json.loads(raw or b"{}")
+        except json.JSONDecodeError as e:
+            raise ServiceError(400, f"Invalid JSON body: {e}")
+
+        if not isinstance(body, dict):
+            raise ServiceError(400, "Request body must be a JSON object.")
+        return body
+
+    def _send(self, status: int, payload: dict) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
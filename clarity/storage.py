@@ -1,9 +1,10 @@
-import json
+import hashlib
 import os
-import time
-from typing import List
+from typing import Iterator, List
 
 from clarity.config import Config
+from clarity.item_store import WorkItemStore
+from clarity.transcript import TranscriptReader
 from clarity.work_item import WorkItem
 from clarity.log import logger
 
@@ -26,9 +27,12 @@ class Storage:
         self.work_package_dir = work_package_dir
         self.ensure_data_directories_exist()
 
+        self.items = WorkItemStore(config.WORK_ITEM_DB_PATH)
+
     def read_transcript(self, filename: str) -> str:
         """
         Loads the entire transcript file from the configured directory.
+        `.gz` and `.zst` files are decompressed transparently.
         Returns the file content as a string, or an empty string on failure.
         """
 
@@ -36,8 +40,7 @@ class Storage:
         content = ""
 
         try:
-            with open(inpath, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = TranscriptReader(inpath).read()
 
             # 2. Use logger.success for successful read
             logger.success(f"Successfully read transcript file: {inpath}")
@@ -54,30 +57,102 @@ class Storage:
 
         return content
 
-    def save_work_items(self, work_items: List[WorkItem]):
-        timestamp = int(time.time())
-        filename = f"{timestamp}_work_items.json"
+    def iter_transcript_segments(self, filename: str, max_chars: int) -> Iterator[str]:
+        """
+        Streams the transcript in segments of at most `max_chars` characters without
+        loading the whole file. Yields nothing (and logs an error) on failure.
+        """
 
-        # 5. Use self.work_package_dir for the output path
-        outpath = os.path.join(self.base_path, self.work_package_dir, filename)
+        inpath = os.path.join(self.base_path, self.transcript_dir, filename)
 
         try:
-            # Ensure the directory exists before attempting to open the file
-            os.makedirs(os.path.dirname(outpath), exist_ok=True)
+            yield from TranscriptReader(inpath).iter_segments(max_chars)
+
+        except FileNotFoundError:
+            logger.error(f"Transcript file not found at: {inpath}")
+
+        except Exception as e:
+            logger.error(
+                f"Failed to read transcript file at {inpath}. Exception details: {e}"
+            )
+
+    def transcript_exists(self, filename: str) -> bool:
+        """Returns True if the transcript file exists in the configured directory."""
+        return os.path.isfile(
+            os.path.join(self.base_path, self.transcript_dir, filename)
+        )
+
+    def write_transcript(self, filename: str, content: str) -> bool:
+        """
+        Writes transcript content into the configured transcript directory.
+        Returns True on success, False on failure.
+        """
+        outpath = os.path.join(self.base_path, self.transcript_dir, filename)
 
+        try:
             with open(outpath, "w", encoding="utf-8") as f:
-                json.dump([wp.model_dump() for wp in work_items], f, indent=2)
+                f.write(content)
+
+            logger.success(f"Successfully wrote transcript file: {outpath}")
+            return True
+
+        except Exception as e:
+            logger.error(
+                f"Failed to write transcript file at {outpath}. Exception details: {e}"
+            )
+            return False
+
+    def transcript_hash(self, filename: str) -> str:
+        """Returns the SHA-256 of a transcript file's content, or an empty string on failure."""
+        inpath = os.path.join(self.base_path, self.transcript_dir, filename)
+        digest = hashlib.sha256()
+
+        try:
+            with open(inpath, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(block)
+        except OSError as e:
+            logger.warning(f"Could not hash transcript file at {inpath}: {e}")
+            return ""
+
+        return digest.hexdigest()
+
+    def save_work_items(
+        self,
+        work_items: List[WorkItem],
+        run_id: str,
+        transcript_filename: str,
+        project: str = "",
+        model: str = "",
+        prompt_type: str = "",
+    ) -> bool:
+        """
+        Appends the run's work items to the indexed work item store, together with
+        the run ID, source transcript, project, model and prompt type.
+
+        Returns: True if the items were stored, False otherwise.
+        """
+        try:
+            added = self.items.append(
+                run_id,
+                work_items,
+                transcript=transcript_filename,
+                transcript_hash=self.transcript_hash(transcript_filename),
+                project=project,
+                model=model,
+                prompt_type=prompt_type,
+            )
 
-            # 6. Use logger.success for successful save
             logger.success(
-                f"Successfully saved {len(work_items)} Work Packages to: {outpath}"
+                f"Successfully saved {added} Work Packages for run {run_id} to: {self.items.db_path}"
             )
+            return True
 
         except Exception as e:
-            # 7. Use logger.error for save failure
             logger.error(
-                f"Failed to save work packages to {outpath}. Exception details: {e}"
+                f"Failed to save work packages to {self.items.db_path}. Exception details: {e}"
             )
+            return False
 
     def ensure_data_directories_exist(self):
         """Checks for and creates necessary data directories."""
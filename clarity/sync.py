@@ -0,0 +1,212 @@
+import hashlib
+import re
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Set
+
+from clarity.clients.interface import IClient
+from clarity.item_store import RemoteLink, WorkItemStore
+from clarity.log import logger
+from clarity.work_item import WorkItem
+
+# Minimum title similarity for matching an item whose title was reworded
+FUZZY_MATCH_THRESHOLD = 0.85
+
+
+def normalize_title(title: str) -> str:
+    """Lower-cases a title and drops punctuation and repeated whitespace."""
+    return " ".join(re.sub(r"[^\w\s]", " ", title.lower()).split())
+
+
+def fingerprint(transcript: str, work_item: WorkItem, occurrence: int = 0) -> str:
+    """
+    A stable identity for a generated item: its source transcript, normalized title
+    and `occurrence`, the number of earlier items in the run with the same
+    normalized title. Items with repeated titles thus keep distinct identities.
+    """
+    key = f"{transcript}\n{normalize_title(work_item.title)}"
+    if occurrence:
+        key += f"\n{occurrence}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def title_occurrences(work_items: List[WorkItem]) -> List[int]:
+    """For each item, how many earlier items share its normalized title."""
+    seen: Dict[str, int] = {}
+    occurrences = []
+    for item in work_items:
+        title = normalize_title(item.title)
+        occurrences.append(seen.get(title, 0))
+        seen[title] = occurrences[-1] + 1
+    return occurrences
+
+
+class SyncResult:
+    """Outcome of syncing one batch of work items, indexed like the input list."""
+
+    def __init__(self) -> None:
+        self.remote_ids: Dict[int, str] = {}
+        self.created = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.failed = 0
+
+    def summary(self) -> str:
+        return (
+            f"{self.created} created, {self.updated} updated, "
+            f"{self.unchanged} unchanged, {self.failed} failed"
+        )
+
+
+class WorkItemSynchronizer:
+    """
+    Publishes regenerated work items by updating the tickets created for them on a
+    previous run instead of creating duplicates.
+
+    Items are matched to stored remote links by fingerprint, falling back to a
+    fuzzy title match within the same transcript. Matched items are diffed
+    field by field against what was last sent, and only changed fields are
+    patched; unchanged items cost no request at all.
+    """
+
+    def __init__(self, client: IClient, store: WorkItemStore):
+        self.client = client
+        self.store = store
+
+    def sync(
+        self,
+        workspace: str,
+        project: str,
+        transcript: str,
+        work_items: Dict[int, WorkItem],
+        iteration: str,
+        claimed: Optional[Set[str]] = None,
+        occurrences: Optional[Dict[int, int]] = None,
+    ) -> SyncResult:
+        """
+        Syncs `work_items` (keyed by their index in the run). Remote IDs in `claimed`
+        were already matched earlier in the same run and are not reused.
+
+        `occurrences` gives each item's `title_occurrences` within the whole run;
+        when omitted it is counted over `work_items` alone.
+        """
+        client_name = self.client.name().value
+        links = self.store.links_for_transcript(client_name, project, transcript)
+        claimed = set(claimed or ())
+        result = SyncResult()
+
+        if occurrences is None:
+            indices = sorted(work_items)
+            counts = title_occurrences([work_items[index] for index in indices])
+            occurrences = dict(zip(indices, counts))
+
+        fingerprints = {
+            index: fingerprint(transcript, item, occurrences[index])
+            for index, item in work_items.items()
+        }
+        matches = self._match(work_items, fingerprints, links, claimed)
+
+        for index, item in work_items.items():
+            item_fingerprint = fingerprints[index]
+            link = matches.get(index)
+            fields = self.client.sync_fields(workspace, project, item, iteration)
+
+            if link is None:
+                remote_id = self.client.create_work_item(
+                    workspace, project, item, iteration
+                )
+                if not remote_id:
+                    result.failed += 1
+                    continue
+                result.created += 1
+            else:
+                remote_id = link.remote_id
+                changes = {
+                    name: value
+                    for name, value in fields.items()
+                    if link.fields.get(name) != value
+                }
+
+                if not changes:
+                    result.unchanged += 1
+                elif self.client.update_work_item(
+                    workspace, project, remote_id, changes
+                ):
+                    result.updated += 1
+                else:
+                    result.failed += 1
+                    continue
+
+            claimed.add(remote_id)
+            result.remote_ids[index] = remote_id
+            self.store.save_link(
+                client_name,
+                project,
+                item_fingerprint,
+                transcript,
+                item.title,
+                remote_id,
+                fields,
+            )
+
+        logger.info(f"Sync of '{transcript}' complete: {result.summary()}.")
+        return result
+
+    def record(
+        self,
+        workspace: str,
+        project: str,
+        transcript: str,
+        work_item: WorkItem,
+        iteration: str,
+        remote_id: str,
+        occurrence: int = 0,
+    ) -> None:
+        """Records a ticket created outside of sync mode so later syncs can update it."""
+        self.store.save_link(
+            self.client.name().value,
+            project,
+            fingerprint(transcript, work_item, occurrence),
+            transcript,
+            work_item.title,
+            remote_id,
+            self.client.sync_fields(workspace, project, work_item, iteration),
+        )
+
+    def _match(
+        self,
+        work_items: Dict[int, WorkItem],
+        fingerprints: Dict[int, str],
+        links: List[RemoteLink],
+        claimed: Set[str],
+    ) -> Dict[int, RemoteLink]:
+        """
+        Pairs items with stored links: exact fingerprints first across the whole
+        batch, then the most similar remaining title above the fuzzy threshold.
+        """
+        available = {
+            link.fingerprint: link for link in links if link.remote_id not in claimed
+        }
+        matches: Dict[int, RemoteLink] = {}
+
+        for index in work_items:
+            link = available.pop(fingerprints[index], None)
+            if link is not None:
+                matches[index] = link
+
+        for index, item in work_items.items():
+            if index in matches:
+                continue
+
+            title = normalize_title(item.title)
+            best, best_score = None, FUZZY_MATCH_THRESHOLD
+            for link in available.values():
+                score = SequenceMatcher(
+                    None, title, normalize_title(link.title)
+                ).ratio()
+                if score >= best_score:
+                    best, best_score = link, score
+
+            if best is not None:
+                matches[index] = available.pop(best.fingerprint)
+
+        return matches
@@ -0,0 +1,90 @@
+from typing import Dict, Optional
+
+from clarity.clients.interface import ClientEnum, IClient
+from clarity.config import Config
+
+
+def parse_iteration_map(spec: str) -> Dict[str, str]:
+    """
+    Parses an iteration mapping such as "Iteration 1=Sprint 12; Iteration 2=Sprint 13",
+    which renames the run's iteration for one target.
+    """
+    mapping = {}
+    for entry in spec.split(";"):
+        source, sep, target = entry.partition("=")
+        if sep and source.strip() and target.strip():
+            mapping[source.strip()] = target.strip()
+    return mapping
+
+
+class PublishTarget:
+    """A board to publish generated work items to: a client, its workspace and project."""
+
+    def __init__(
+        self,
+        client: IClient,
+        workspace: str,
+        project: str,
+        iterations: Optional[Dict[str, str]] = None,
+    ):
+        self.client = client
+        self.workspace = workspace
+        self.project = project
+        self.iterations = iterations or {}
+
+    @property
+    def key(self) -> str:
+        """Identifies the target in job checkpoints and run reports."""
+        return f"{self.client.name().value}/{self.project}"
+
+    def iteration_for(self, iteration: str) -> str:
+        return self.iterations.get(iteration, iteration)
+
+    @staticmethod
+    def for_client(client: IClient, config: Config) -> "PublishTarget":
+        """Builds the target configured in .env for a client."""
+        if client.name() == ClientEnum.AZURE:
+            return PublishTarget(
+                client,
+                config.AZURE_WORKSPACE,
+                config.AZURE_PROJECT,
+                parse_iteration_map(config.AZURE_ITERATION_MAP),
+            )
+        elif client.name() == ClientEnum.PLANE:
+            # Plane items are not assigned to cycles, so no iteration mapping applies
+            return PublishTarget(
+                client, config.PLANE_WORKSPACE_SLUG, config.PLANE_PROJECT_ID
+            )
+
+        return PublishTarget(client, "stub", "stub")
+
+
+class TargetResult:
+    """Outcome of publishing one job's work items to one target."""
+
+    def __init__(self, target: str, total: int):
+        self.target = target
+        self.total = total
+        self.posted = 0
+        self.failed = 0
+        self.error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.failed == 0
+
+    def summary(self) -> str:
+        if self.error:
+            return f"{self.target}: {self.error}"
+        return (
+            f"{self.target}: {self.posted} of {self.total} posted, {self.failed} failed"
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "target": self.target,
+            "total": self.total,
+            "posted": self.posted,
+            "failed": self.failed,
+            "error": self.error,
+        }
@@ -0,0 +1,201 @@
+import contextlib
+import gzip
+import io
+import itertools
+import mmap
+import os
+import re
+from typing import Iterable, Iterator, List
+
+# Plain files at least this large are memory-mapped instead of read through a buffer
+MMAP_THRESHOLD = 8 * 1024 * 1024
+
+# Caption cue timing lines, e.g. "00:00:01.000 --> 00:00:04.000" (WebVTT) or "00:00:01,000 --> ..." (SRT)
+_CUE_TIMING = re.compile(r"^\s*(\d{1,2}:)?\d{1,2}:\d{2}[.,]\d{3}\s+-->\s+")
+_CUE_INDEX = re.compile(r"^\s*\d+\s*$")
+
+# A line with its ending, as split by text-mode universal newlines
+_LINE = re.compile(r"[^\n]*\n|[^\n]+")
+
+CAPTION_EXTENSIONS = (".vtt", ".srt")
+
+
+class TranscriptReader:
+    """
+    Streams a transcript file line by line, whatever its encoding on disk.
+
+    `.gz` and `.zst` files are decompressed on the fly, and large plain files are
+    memory-mapped, so no temporary copy is made and memory use stays flat
+    regardless of file size. In caption files (`.vtt`/`.srt`, or content starting
+    with a WEBVTT header or an SRT cue) the metadata - WebVTT headers and notes,
+    cue timings and SRT cue numbers - is dropped, leaving only the spoken text.
+    Line endings are normalized to "\n" whatever the reader.
+    """
+
+    def __init__(self, path: str, mmap_threshold: int = MMAP_THRESHOLD):
+        self.path = path
+        self.mmap_threshold = mmap_threshold
+
+    def read(self) -> str:
+        """Returns the whole transcript as one string."""
+        return "".join(self.iter_lines())
+
+    def iter_lines(self) -> Iterator[str]:
+        """Yields transcript lines (with line endings), minus any caption metadata."""
+        raw = self._iter_raw_lines()
+        head = self._head(raw)
+        lines = itertools.chain(head, raw)
+
+        if self._is_captions(head):
+            yield from self._strip_captions(lines)
+        else:
+            yield from lines
+
+    def iter_segments(self, max_chars: int) -> Iterator[str]:
+        """
+        Yields consecutive segments of at most `max_chars` characters, split on line
+        boundaries (a single longer line is split on its own).
+        """
+        buffer = []
+        size = 0
+
+        for line in self.iter_lines():
+            while len(line) > max_chars:
+                if buffer:
+                    yield "".join(buffer)
+                    buffer, size = [], 0
+                yield line[:max_chars]
+                line = line[max_chars:]
+
+            if size + len(line) > max_chars and buffer:
+                yield "".join(buffer)
+                buffer, size = [], 0
+
+            buffer.append(line)
+            size += len(line)
+
+        if buffer:
+            yield "".join(buffer)
+
+    def _is_captions(self, head: List[str]) -> bool:
+        name = self.path.lower()
+        for suffix in (".gz", ".zst"):
+            name = name.removesuffix(suffix)
+        if name.endswith(CAPTION_EXTENSIONS):
+            return True
+
+        content = [line for line in head if line.strip()]
+        if not content:
+            return False
+
+        first = content[0].strip()
+        if first == "WEBVTT" or first.startswith("WEBVTT "):
+            return True
+        if _CUE_TIMING.match(first):
+            return True
+        return (
+            len(content) > 1
+            and bool(_CUE_INDEX.match(first))
+            and bool(_CUE_TIMING.match(content[1]))
+        )
+
+    @staticmethod
+    def _head(lines: Iterator[str]) -> List[str]:
+        """Reads up to the second non-blank line, enough to recognize a caption file."""
+        head = []
+        content = 0
+        for line in lines:
+            head.append(line)
+            if line.strip():
+                content += 1
+                if content == 2:
+                    break
+        return head
+
+    @staticmethod
+    def _strip_captions(lines: Iterable[str]) -> Iterator[str]:
+        pending_index = None
+        in_note = False
+
+        for line in lines:
+            stripped = line.strip()
+
+            if in_note:
+                in_note = bool(stripped)
+                continue
+            if stripped == "WEBVTT" or stripped.startswith("WEBVTT "):
+                continue
+            if stripped == "NOTE" or stripped.startswith("NOTE "):
+                in_note = True
+                continue
+
+            # An SRT cue number is only metadata when a cue timing line follows it
+            if pending_index is not None:
+                if _CUE_TIMING.match(line):
+                    pending_index = None
+                    continue
+                yield pending_index
+                pending_index = None
+
+            if _CUE_TIMING.match(line):
+                continue
+            if _CUE_INDEX.match(line):
+                pending_index = line
+                continue
+
+            yield line
+
+        if pending_index is not None:
+            yield pending_index
+
+    def _iter_raw_lines(self) -> Iterator[str]:
+        with self._open() as stream:
+            yield from stream
+
+    @contextlib.contextmanager
+    def _open(self) -> Iterator[Iterable[str]]:
+        if self.path.endswith(".gz"):
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                yield f
+
+        elif self.path.endswith(".zst"):
+            try:
+                import zstandard
+            except ImportError:
+                raise RuntimeError(
+                    "Reading .zst transcripts requires the 'zstandard' package "
+                    "(pip install zstandard)."
+                )
+
+            with open(self.path, "rb") as raw:
+                reader = zstandard.ZstdDecompressor().stream_reader(raw)
+                with io.TextIOWrapper(reader, encoding="utf-8") as f:
+                    yield f
+
+        elif os.path.getsize(self.path) >= self.mmap_threshold:
+            with open(self.path, "rb") as raw:
+                with mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    yield _MappedLines(mapped)
+
+        else:
+            with open(self.path, "r", encoding="utf-8") as f:
+                yield f
+
+
+class _MappedLines:
+    """
+    Iterates decoded lines straight out of a memory map, with "\r\n" and "\r"
+    line endings normalized to "\n" as text-mode files do.
+    """
+
+    def __init__(self, mapped: mmap.mmap):
+        self._mapped = mapped
+
+    def __iter__(self) -> Iterator[str]:
+        for raw_line in iter(self._mapped.readline, b""):
+            line = raw_line.decode("utf-8")
+            if "\r" not in line:
+                yield line
+                continue
+
+            yield from _LINE.findall(line.replace("\r\n", "\n").replace("\r", "\n"))
@@ -1,6 +1,11 @@
-from typing import Literal, List, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Literal, List, Optional, Tuple, Type
+import pydantic
 from pydantic import BaseModel, Field
-from azure.devops.v7_1.work_item_tracking.models import JsonPatchOperation
+
+if TYPE_CHECKING:
+    # Only needed for annotations; the Azure SDK is imported lazily below
+    from azure.devops.v7_1.work_item_tracking.models import JsonPatchOperation
 
 
 class WorkItem(BaseModel):
@@ -53,93 +58,48 @@ class WorkItem(BaseModel):
 
         html_desc = self.build_html_desc()
 
-        plane_type = {
-            "Task": "Task",
-            "Fix": "Bug",
-            "Chore": "Chore",
-            "Docs": "Documentation",
-        }.get(
-            self.task_type, "Task"
-        )  # Default to 'Task' if mapping fails
-
         payload = {
             "name": self.title,
             "description_html": html_desc,
-            # CRITICAL: These placeholders must be replaced with actual Project-specific IDs (UUIDs)
-            # "state": "Backlog",  # State name (e.g., 'Backlog', 'To Do') or UUID
-            # "assignees": [],  # List of User IDs (UUIDs)
-            # "priority": "Low",  # Priority name (e.g., 'Low', 'Medium', 'High') or UUID
-            # "labels": (
-            #     [self.component] if self.component else []
-            # ),  # Uses component as a label
+            # Project-specific fields (state, assignees, priority, labels, type, module)
+            # need UUIDs and are filled in by PlaneResolver.enrich in PlaneClient.
             # "parent": None,  # Used for sub-tasks; typically null/None for a top-level task
             # "estimate_point": None,  # Points estimate (number or string representation)
-            # "type": plane_type,
-            # "module": None,  # Module ID (UUID)
             # "start_date": None,  # YYYY-MM-DD
             # "target_date": None,  # YYYY-MM-DD
         }
 
-        # Clean up lists that might contain None/null values
-        # if not payload["assignees"]:
-        #     del payload["assignees"]
-        # if not payload["labels"]:
-        #     del payload["labels"]
-
         return payload
 
-    def to_azure_json_payload(self, iteration) -> List[JsonPatchOperation]:
+    def plane_type(self) -> str:
+        """Maps the task type to the name of the corresponding Plane work item type."""
+        return {
+            "Task": "Task",
+            "Fix": "Bug",
+            "Chore": "Chore",
+            "Docs": "Documentation",
+        }.get(
+            self.task_type, "Task"
+        )  # Default to 'Task' if mapping fails
+
+    def to_azure_json_payload(self, iteration) -> List["JsonPatchOperation"]:
         """
         Generates the required JSON Patch document for Azure DevOps API creation.
 
         Azure DevOps requires a list of operations describing changes to fields
         using 'add', 'replace', or 'remove' operations.
         """
-        patch_document = [
-            # 1. Add Title
-            JsonPatchOperation(op="add", path="/fields/System.Title", value=self.title),
-            # 2. Add Description
-            JsonPatchOperation(
-                op="add", path="/fields/System.Description", value=self.description
-            ),
-        ]
-
-        patch_document.append(
-            JsonPatchOperation(
-                op="add", path="/fields/System.IterationPath", value=iteration
-            )
-        )
-
-        # 3. Optionally add Assignee
-        # if self.assigned_to_email:
-        #     # Assignee is set via the email address in the 'System.AssignedTo' path
-        #     patch_document.append(
-        #         JsonPatchOperation(
-        #             op="add",
-        #             path="/fields/System.AssignedTo",
-        #             value=self.assigned_to_email,
-        #         )
-        #     )
-
-        return patch_document
+        # The operations are built once per (title, description, iteration) and shared;
+        # only the list is copied so callers can append to it safely.
+        return list(_render_azure_patch(self.title, self.description, iteration))
 
     def build_html_desc(self) -> str:
-        # --- 1. Construct the Rich HTML Description ---
-
-        # Start with the main description
-        html_desc = f"<h3>Description / Context</h3>\n<p>{self.description}</p>\n"
-
-        # Add Acceptance Criteria as an unordered HTML list
-        html_desc += "<h3>Acceptance Criteria</h3>\n<ul>\n"
-        html_desc += "".join(f"<li>{item}</li>\n" for item in self.acceptance_criteria)
-        html_desc += "</ul>\n"
-
-        # Add Technical Task Breakdown as an ordered HTML list
-        html_desc += "<h3>Technical Breakdown</h3>\n<ol>\n"
-        html_desc += "".join(f"<li>{item}</li>\n" for item in self.task_breakdown)
-        html_desc += "</ol>\n"
-
-        return html_desc
+        # Rendering is cached on the content, so re-uploading an unchanged item is free
+        return _render_html_desc(
+            self.description,
+            tuple(self.acceptance_criteria),
+            tuple(self.task_breakdown),
+        )
 
     @staticmethod
     def create_dummy_item() -> "WorkItem":
@@ -174,3 +134,74 @@ class WorkItemList(BaseModel):
     """The root structure required to hold the array of work packages."""
 
     work_items: List[WorkItem]
+
+
+def cached_json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Returns the JSON schema of a Pydantic model, generated once per model class and
+    Pydantic version. The returned dict is shared and must not be mutated.
+    """
+    return _json_schema(model, pydantic.VERSION)
+
+
+@lru_cache(maxsize=None)
+def _json_schema(model: Type[BaseModel], _pydantic_version: str) -> Dict[str, Any]:
+    return model.model_json_schema()
+
+
+@lru_cache(maxsize=4096)
+def _render_html_desc(
+    description: str,
+    acceptance_criteria: Tuple[str, ...],
+    task_breakdown: Tuple[str, ...],
+) -> str:
+    # --- 1. Construct the Rich HTML Description ---
+    parts = [
+        # Start with the main description
+        f"<h3>Description / Context</h3>\n<p>{description}</p>\n",
+        # Add Acceptance Criteria as an unordered HTML list
+        "<h3>Acceptance Criteria</h3>\n<ul>\n",
+        *(f"<li>{item}</li>\n" for item in acceptance_criteria),
+        "</ul>\n",
+        # Add Technical Task Breakdown as an ordered HTML list
+        "<h3>Technical Breakdown</h3>\n<ol>\n",
+        *(f"<li>{item}</li>\n" for item in task_breakdown),
+        "</ol>\n",
+    ]
+    return "".join(parts)
+
+
+@lru_cache(maxsize=4096)
+def _render_azure_patch(
+    title: str, description: str, iteration: str
+) -> Tuple["JsonPatchOperation", ...]:
+    # Imported lazily so Plane-only runs never load the Azure SDK
+    from azure.devops.v7_1.work_item_tracking.models import JsonPatchOperation
+
+    patch_document = [
+        # 1. Add Title
+        JsonPatchOperation(op="add", path="/fields/System.Title", value=title),
+        # 2. Add Description
+        JsonPatchOperation(
+            op="add", path="/fields/System.Description", value=description
+        ),
+    ]
+
+    patch_document.append(
+        JsonPatchOperation(
+            op="add", path="/fields/System.IterationPath", value=iteration
+        )
+    )
+
+    # 3. Optionally add Assignee
+    # if self.assigned_to_email:
+    #     # Assignee is set via the email address in the 'System.AssignedTo' path
+    #     patch_document.append(
+    #         JsonPatchOperation(
+    #             op="add",
+    #             path="/fields/System.AssignedTo",
+    #             value=self.assigned_to_email,
+    #         )
+    #     )
+
+    return tuple(patch_document)
@@ -1,21 +1,139 @@
-import sys
-from clarity.clients.azure import AzureClient
+import argparse
+from datetime import datetime
+
 from clarity.config import Config
+from clarity.item_store import WorkItemStore
 from clarity.manager import WorkflowManager
-from clarity.work_item import WorkItem
 
-if __name__ == "__main__":
-    filename = sys.argv[1]
-    pm = WorkflowManager.ollama_azure()
 
-    iteration = "Iteration 1"
+def parse_date(value: str) -> float:
+    """Parses a YYYY-MM-DD argument into a timestamp at the start of that day."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").timestamp()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date '{value}', expected YYYY-MM-DD")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Clarity PMA")
+    parser.add_argument("filename", nargs="?", help="Transcript file to process.")
+    parser.add_argument(
+        "--resume", action="store_true", help="Resume unfinished jobs and exit."
+    )
+    parser.add_argument(
+        "--serve", action="store_true", help="Run the local HTTP service."
+    )
+    parser.add_argument(
+        "--stub",
+        action="store_true",
+        help="Use offline stub agent and client instead of Ollama and Azure DevOps.",
+    )
+    parser.add_argument(
+        "--export-history",
+        metavar="PATH",
+        help="Export stored work items as JSON lines (filter with --project/--since).",
+    )
+    parser.add_argument("--project", help="Project filter for --export-history.")
+    parser.add_argument(
+        "--since",
+        type=parse_date,
+        metavar="YYYY-MM-DD",
+        help="Only export items created on or after this date.",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Vacuum the work item store. Deletes history only with --keep-runs.",
+    )
+    parser.add_argument(
+        "--keep-runs",
+        type=int,
+        metavar="N",
+        help="With --compact, permanently delete all but the newest N runs per transcript.",
+    )
+    parser.add_argument(
+        "--older-than",
+        type=parse_date,
+        metavar="YYYY-MM-DD",
+        help="With --keep-runs, only delete runs last written before this date.",
+    )
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="Update tickets from earlier runs of the transcript instead of recreating them.",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="CASSETTE",
+        help="Record agent and client traffic to a cassette (.jsonl or .jsonl.gz).",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="CASSETTE",
+        help="Serve agent and client traffic from a recorded cassette.",
+    )
+    parser.add_argument(
+        "--replay-speed",
+        type=float,
+        help="1 replays at the recorded timing, 10 ten times faster, 0 instantly.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile CPU and memory of each stage; reports go to data/work/profiles/.",
+    )
+    parser.add_argument("--iteration", default="Iteration 1")
 
-    pm.run(filename, iteration=iteration)
+    args = parser.parse_args()
+    if args.keep_runs is not None and args.keep_runs < 1:
+        parser.error("--keep-runs must be at least 1.")
+    if (args.keep_runs is not None or args.older_than is not None) and not args.compact:
+        parser.error("--keep-runs and --older-than require --compact.")
+    if args.older_than is not None and args.keep_runs is None:
+        parser.error("--older-than requires --keep-runs.")
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    config = Config()
+    if args.record:
+        config.RECORD_CASSETTE = args.record
+    if args.profile:
+        config.PROFILE = True
+    if args.replay_speed is not None:
+        config.REPLAY_SPEED = args.replay_speed
 
-    # config = Config()
+    # History commands only need the work item store, not the agent and clients
+    if args.export_history:
+        WorkItemStore(config.WORK_ITEM_DB_PATH).export_history(
+            args.export_history, project=args.project, since=args.since
+        )
+    elif args.compact:
+        WorkItemStore(config.WORK_ITEM_DB_PATH).compact(
+            keep_runs=args.keep_runs, older_than=args.older_than
+        )
+    else:
+        if args.replay:
+            pm = WorkflowManager.replay(args.replay, config)
+        elif args.stub:
+            pm = WorkflowManager.stub(config)
+        else:
+            pm = WorkflowManager.ollama_azure(config)
+        if args.sync:
+            pm.config.SYNC_MODE = True
 
-    # az = AzureClient(config)
-    # # az.list_work_items(config.AZURE_WORKSPACE, config.AZURE_PROJECT)
+        if args.serve:
+            from clarity.service import WorkflowService
 
-    # wi = WorkItem.create_dummy_item()
-    # az.create_work_item(config.AZURE_WORKSPACE, config.AZURE_PROJECT, wi, iteration)
+            service = WorkflowService.from_config(pm)
+            service.serve(pm.config.SERVICE_HOST, pm.config.SERVICE_PORT)
+        elif args.resume:
+            # Continue any jobs interrupted by a crash or restart
+            pm.resume()
+        elif args.filename:
+            pm.run(args.filename, iteration=args.iteration)
+        else:
+            print(
+                "Provide a transcript filename, --resume, --serve, --export-history or --compact."
+            )
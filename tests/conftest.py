@@ -0,0 +1,30 @@
+from typing import Callable
+
+import pytest
+
+from clarity.config import Config
+
+
+@pytest.fixture
+def make_config(tmp_path) -> Callable[..., Config]:
+    """
+    Builds a Config from the given settings instead of the project's .env, with
+    every data path inside the test's temporary directory.
+    """
+
+    def make(**settings) -> Config:
+        env_path = tmp_path / "test.env"
+        env_path.write_text(
+            "".join(f"{name}={value}\n" for name, value in settings.items()),
+            encoding="utf-8",
+        )
+        config = Config(str(env_path))
+
+        config.BASE_PATH = str(tmp_path)
+        config.TRANSCRIPT_PATH = str(tmp_path / config.TRANSCRIPT_REL_PATH)
+        config.WORK_PACKAGE_PATH = str(tmp_path / config.WORK_PACKAGE_REL_PATH)
+        config.JOB_DB_PATH = str(tmp_path / config.JOB_DB_REL_PATH)
+        config.WORK_ITEM_DB_PATH = str(tmp_path / config.WORK_ITEM_DB_REL_PATH)
+        return config
+
+    return make
@@ -0,0 +1,93 @@
+import threading
+import time
+
+from clarity.agents.adaptive import AdaptiveLimiter
+from clarity.agents.interface import GenerationStats
+
+
+def make_limiter(**kwargs) -> AdaptiveLimiter:
+    options = dict(initial=2, minimum=1, maximum=4, tolerance=2.0, backoff=0.5)
+    options.update(kwargs)
+    return AdaptiveLimiter("test-host", **options)
+
+
+def complete(limiter: AdaptiveLimiter, latency: float, ok: bool = True, **kwargs):
+    limiter.acquire()
+    limiter.release(latency, ok, **kwargs)
+
+
+def test_limit_grows_while_latency_stays_within_tolerance():
+    limiter = make_limiter()
+
+    for _ in range(10):
+        complete(limiter, 1.0, model="llama")
+
+    assert limiter.metrics()["limit"] == 4
+
+
+def test_failure_cuts_the_limit():
+    limiter = make_limiter(initial=4)
+
+    complete(limiter, 1.0, ok=False, model="llama")
+
+    assert limiter.metrics()["limit"] == 2
+
+
+def test_latency_above_tolerance_cuts_the_limit():
+    limiter = make_limiter(initial=4)
+
+    complete(limiter, 1.0, model="llama")
+    complete(limiter, 5.0, model="llama")
+
+    assert limiter.metrics()["limit"] == 2
+
+
+def test_limit_stays_within_bounds():
+    limiter = make_limiter(initial=1)
+
+    for _ in range(3):
+        complete(limiter, 1.0, ok=False, model="llama")
+
+    assert limiter.metrics()["limit"] == 1
+
+
+def test_baselines_are_kept_per_model():
+    limiter = make_limiter(initial=4)
+
+    complete(limiter, 1.0, model="small")
+    # A slower model on the same host is not a latency regression
+    complete(limiter, 5.0, model="large")
+
+    assert limiter.metrics()["limit"] == 4
+    assert limiter.metrics()["baselines"] == {"small": 1.0, "large": 5.0}
+
+
+def test_baseline_is_per_output_token_when_stats_are_reported():
+    limiter = make_limiter(initial=4)
+
+    complete(limiter, 1.0, stats=GenerationStats("llama", output_tokens=100))
+    # A ten times longer answer at the same speed per token
+    complete(limiter, 10.0, stats=GenerationStats("llama", output_tokens=1000))
+
+    assert limiter.metrics()["limit"] == 4
+    assert limiter.metrics()["baselines"] == {"llama": 0.01}
+
+
+def test_acquire_blocks_at_the_limit():
+    limiter = make_limiter(initial=1, maximum=1)
+    limiter.acquire()
+    acquired = threading.Event()
+
+    def acquire() -> None:
+        limiter.acquire()
+        acquired.set()
+
+    thread = threading.Thread(target=acquire)
+    thread.start()
+    time.sleep(0.05)
+    assert not acquired.is_set()
+
+    limiter.release(1.0, True, model="llama")
+    assert acquired.wait(5)
+    thread.join(5)
+    assert limiter.metrics()["in_flight"] == 1
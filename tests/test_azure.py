@@ -0,0 +1,66 @@
+import http.server
+import json
+import threading
+
+import pytest
+from azure.devops.client import Client
+from azure.devops.exceptions import AzureDevOpsServiceError
+
+from clarity.clients.azure import AzureClient
+from clarity.clients.resilience import RetryableError
+
+
+class ErrorHandler(http.server.BaseHTTPRequestHandler):
+    """Answers every request with the server's status and a WrappedException body."""
+
+    def do_GET(self) -> None:
+        body = json.dumps({"message": "Request failed", "typeKey": "Error"}).encode()
+        self.send_response(self.server.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Retry-After", "7")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), ErrorHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def call(make_config, server):
+    """Sends one GET through a configured SDK client via AzureClient._call_sdk."""
+    azure = AzureClient(make_config())
+    url = f"http://127.0.0.1:{server.server_port}"
+    sdk_client = Client(url, None)
+    azure._configure_sdk_client(sdk_client)
+
+    def send(status: int):
+        server.status = status
+        request = sdk_client._client.get(f"{url}/_apis/wit/workitems")
+        return azure._call_sdk(sdk_client._send_request, request)
+
+    return send
+
+
+@pytest.mark.parametrize("status", [429, 500, 503])
+def test_transient_service_errors_are_retryable(call, status):
+    with pytest.raises(RetryableError) as error:
+        call(status)
+
+    assert error.value.retry_after == 7.0
+    assert error.value.unprocessed == (status in (429, 503))
+
+
+def test_client_errors_are_not_retried(call):
+    with pytest.raises(AzureDevOpsServiceError):
+        call(400)
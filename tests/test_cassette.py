@@ -0,0 +1,101 @@
+import gzip
+import zlib
+
+import pytest
+
+from clarity.agents.replay import RecordingAgent, ReplayAgent
+from clarity.agents.stub import StubAgent
+from clarity.cassette import Cassette
+
+
+@pytest.fixture(params=["cassette.jsonl", "cassette.jsonl.gz"])
+def path(request, tmp_path) -> str:
+    return str(tmp_path / request.param)
+
+
+def gzip_members(path: str) -> int:
+    """Counts the concatenated gzip members in a file."""
+    with open(path, "rb") as f:
+        data = f.read()
+
+    members = 0
+    while data:
+        decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+        decompressor.decompress(data)
+        assert decompressor.eof, "unterminated gzip member"
+        data = decompressor.unused_data
+        members += 1
+    return members
+
+
+def test_entries_survive_a_reload(path):
+    cassette = Cassette(path)
+    cassette.record("a", {"kind": "agent", "response": "first"})
+    cassette.record("b", {"kind": "client", "response": "second"})
+    cassette.close()
+
+    reloaded = Cassette(path)
+    assert len(reloaded) == 2
+    assert [entry["response"] for entry in reloaded.entries()] == ["first", "second"]
+    assert [entry["key"] for entry in reloaded.entries("client")] == ["b"]
+
+
+def test_repeated_key_replays_in_recording_order(path):
+    cassette = Cassette(path)
+    for response in ("first", "second"):
+        cassette.record("key", {"response": response})
+
+    replayed = [cassette.get("key")["response"] for _ in range(3)]
+
+    assert replayed == ["first", "second", "second"]
+    assert cassette.get("missing") is None
+
+
+def test_later_sessions_keep_one_gzip_stream(tmp_path):
+    path = str(tmp_path / "cassette.jsonl.gz")
+
+    for session in range(3):
+        cassette = Cassette(path)
+        cassette.record(f"key-{session}", {"response": session})
+        cassette.record(f"key-{session}-b", {"response": session})
+        cassette.close()
+
+    assert gzip_members(path) == 1
+    assert len(Cassette(path)) == 6
+
+
+def test_unterminated_gzip_recording_is_recovered(tmp_path):
+    recording = Cassette(str(tmp_path / "recording.jsonl.gz"))
+    recording.record("a", {"response": "first"})
+    recording.record("b", {"response": "second"})
+
+    # A copy taken before close looks like a recording cut off by a crash:
+    # every entry is flushed but the gzip trailer is missing
+    path = str(tmp_path / "cassette.jsonl.gz")
+    with open(recording.path, "rb") as src, open(path, "wb") as dst:
+        dst.write(src.read())
+    recording.close()
+
+    with pytest.raises(EOFError):
+        with gzip.open(path, "rt") as f:
+            f.read()
+
+    recovered = Cassette(path)
+    assert len(recovered) == 2
+
+    recovered.record("c", {"response": "third"})
+    recovered.close()
+    assert gzip_members(path) == 1
+    assert [entry["key"] for entry in Cassette(path).entries()] == ["a", "b", "c"]
+
+
+def test_recorded_generations_replay_without_the_backend(path):
+    recorder = RecordingAgent(StubAgent(item_count=2), Cassette(path))
+    response = recorder.generate_work_items("prompt", "transcript")
+    recorder.cassette.close()
+
+    replay = ReplayAgent(Cassette(path))
+    assert replay.model_name == "stub"
+    assert replay.generate_work_items("prompt", "transcript") == response
+    assert replay.last_stats() is not None
+    assert replay.generate_work_items("prompt", "other transcript") == ""
@@ -0,0 +1,97 @@
+import threading
+import time
+
+import pytest
+
+from clarity.agents.coalesce import SingleFlight
+
+
+def run_concurrently(flight: SingleFlight, key: str, fn, callers: int):
+    results: list = [None] * callers
+
+    def call(index: int) -> None:
+        try:
+            results[index] = flight.do(key, fn)
+        except Exception as e:
+            results[index] = e
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(callers)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def test_concurrent_calls_share_one_execution():
+    flight: SingleFlight[str] = SingleFlight()
+    started = threading.Event()
+    finish = threading.Event()
+    runs = []
+
+    def generate() -> str:
+        runs.append(1)
+        started.set()
+        finish.wait(5)
+        return "response"
+
+    leader, leader_results = run_concurrently(flight, "key", generate, 1)
+    assert started.wait(5)
+    followers, follower_results = run_concurrently(flight, "key", generate, 3)
+
+    # Give the followers time to join the leader's call before it completes
+    time.sleep(0.1)
+    assert flight.in_flight() == 1
+    finish.set()
+    for thread in leader + followers:
+        thread.join(5)
+
+    assert runs == [1]
+    assert leader_results == [("response", False)]
+    assert follower_results == [("response", True)] * 3
+    assert flight.in_flight() == 0
+
+
+def test_error_is_raised_to_every_caller():
+    flight: SingleFlight[str] = SingleFlight()
+    started = threading.Event()
+    finish = threading.Event()
+
+    def fail() -> str:
+        started.set()
+        finish.wait(5)
+        raise RuntimeError("backend down")
+
+    leader, leader_results = run_concurrently(flight, "key", fail, 1)
+    assert started.wait(5)
+    followers, follower_results = run_concurrently(flight, "key", fail, 2)
+    time.sleep(0.1)
+    finish.set()
+    for thread in leader + followers:
+        thread.join(5)
+
+    for result in leader_results + follower_results:
+        assert isinstance(result, RuntimeError)
+
+
+def test_completed_calls_are_not_cached():
+    flight: SingleFlight[int] = SingleFlight()
+    runs = []
+
+    def count() -> int:
+        runs.append(1)
+        return len(runs)
+
+    assert flight.do("key", count) == (1, False)
+    assert flight.do("key", count) == (2, False)
+
+
+def test_failed_call_is_cleared():
+    flight: SingleFlight[str] = SingleFlight()
+
+    def fail() -> str:
+        raise ValueError("bad response")
+
+    with pytest.raises(ValueError):
+        flight.do("key", fail)
+
+    assert flight.in_flight() == 0
+    assert flight.do("key", lambda: "ok") == ("ok", False)
@@ -0,0 +1,89 @@
+from clarity.evaluation import (
+    EvalResult,
+    ExpectedItem,
+    content_similarity,
+    mark_pareto,
+    match_items,
+    title_similarity,
+)
+from clarity.prompt import PromptType
+from clarity.work_item import WorkItem
+
+
+def make_item(title: str, description: str = "") -> WorkItem:
+    return WorkItem(
+        title=title,
+        description=description,
+        acceptance_criteria=[],
+        task_breakdown=[],
+    )
+
+
+def make_result(recall: float, latency: float, tokens: int = 100) -> EvalResult:
+    result = EvalResult(PromptType.A, "model", 0)
+    result.expected = result.generated = 10
+    result.matched = int(recall * 10)
+    result.latency = latency
+    result.tokens = tokens
+    return result
+
+
+def test_items_are_matched_one_to_one():
+    generated = [make_item("Fix login"), make_item("Fix login")]
+    expected = [ExpectedItem("Fix login")]
+
+    assert match_items(generated, expected, title_similarity, 0.9) == 1
+
+
+def test_best_pairs_are_matched_first():
+    scores = {("A", "a"): 0.9, ("A", "b"): 0.95, ("B", "a"): 0.2, ("B", "b"): 0.7}
+
+    def scorer(item: WorkItem, target: ExpectedItem) -> float:
+        return scores[(item.title, target.title)]
+
+    generated = [make_item("A"), make_item("B")]
+    expected = [ExpectedItem("a"), ExpectedItem("b")]
+
+    # A takes b, its best pair, which leaves B without a partner above 0.6
+    assert match_items(generated, expected, scorer, 0.6) == 1
+    assert match_items(generated, expected, scorer, 0.1) == 2
+
+
+def test_pairs_below_the_threshold_do_not_match():
+    generated = [make_item("Update documentation")]
+    expected = [ExpectedItem("Fix login redirect")]
+
+    assert match_items(generated, expected, title_similarity, 0.6) == 0
+    assert match_items([], expected, title_similarity, 0.0) == 0
+
+
+def test_content_scorer_tolerates_reworded_titles():
+    generated = [
+        make_item("Support OIDC sign in", "Integrate the backend with Okta login.")
+    ]
+    expected = [ExpectedItem("Okta login for backend", "Use OIDC sign in.")]
+
+    assert match_items(generated, expected, content_similarity, 0.35) == 1
+    assert match_items(generated, expected, title_similarity, 0.6) == 0
+
+
+def test_mark_pareto_flags_only_undominated_results():
+    accurate = make_result(recall=0.9, latency=10.0)
+    fast = make_result(recall=0.5, latency=2.0)
+    dominated = make_result(recall=0.5, latency=5.0)
+    duplicate = make_result(recall=0.9, latency=10.0)
+
+    mark_pareto([accurate, fast, dominated, duplicate])
+
+    assert accurate.pareto and fast.pareto and duplicate.pareto
+    assert not dominated.pareto
+
+
+def test_lower_cost_breaks_a_quality_tie():
+    cheap = make_result(recall=0.8, latency=3.0, tokens=50)
+    costly = make_result(recall=0.8, latency=3.0, tokens=500)
+
+    mark_pareto([cheap, costly])
+
+    assert cheap.pareto
+    assert not costly.pareto
@@ -0,0 +1,94 @@
+import pytest
+
+from clarity.item_store import WorkItemStore
+from clarity.work_item import WorkItem
+
+DAY = 24 * 3600.0
+
+
+@pytest.fixture
+def store(tmp_path) -> WorkItemStore:
+    return WorkItemStore(str(tmp_path / "work_items.db"))
+
+
+def make_item(title: str) -> WorkItem:
+    return WorkItem(
+        title=title,
+        description="Why",
+        acceptance_criteria=["1. It works."],
+        task_breakdown=["1. Do it."],
+    )
+
+
+def add_run(
+    store: WorkItemStore,
+    run_id: str,
+    created_at: float,
+    transcript: str = "meeting.txt",
+    model: str = "llama3",
+    items: int = 2,
+) -> None:
+    store.append(
+        run_id,
+        [make_item(f"{run_id} item {i}") for i in range(items)],
+        transcript=transcript,
+        transcript_hash=f"hash-{transcript}",
+        project="project",
+        model=model,
+        prompt_type="default",
+    )
+    with store._conn:
+        store._conn.execute(
+            "UPDATE work_items SET created_at = ? WHERE run_id = ?",
+            (created_at, run_id),
+        )
+
+
+def runs(store: WorkItemStore) -> list:
+    return sorted({stored.run_id for stored in store.history()})
+
+
+def test_append_is_idempotent_per_run(store):
+    items = [make_item("Add login"), make_item("Fix crash")]
+
+    assert store.append("run-1", items, "meeting.txt", "hash", "p", "m", "t") == 2
+    assert store.append("run-1", items, "meeting.txt", "hash", "p", "m", "t") == 0
+    assert [stored.work_item.title for stored in store.by_run("run-1")] == [
+        "Add login",
+        "Fix crash",
+    ]
+
+
+def test_compact_keeps_history_by_default(store):
+    for day in range(3):
+        add_run(store, f"run-{day}", day * DAY)
+
+    assert store.compact() == 0
+    assert runs(store) == ["run-0", "run-1", "run-2"]
+
+
+def test_compact_keeps_the_newest_runs_per_transcript_and_model(store):
+    for day in range(3):
+        add_run(store, f"a-{day}", day * DAY)
+    add_run(store, "b-0", 0.0, transcript="other.txt")
+    add_run(store, "m-0", 0.0, model="mistral")
+
+    assert store.compact(keep_runs=2) == 2
+    assert runs(store) == ["a-1", "a-2", "b-0", "m-0"]
+
+
+def test_compact_only_removes_runs_older_than_the_cutoff(store):
+    for day in range(4):
+        add_run(store, f"run-{day}", day * DAY)
+
+    assert store.compact(keep_runs=1, older_than=1.5 * DAY) == 4
+    assert runs(store) == ["run-2", "run-3"]
+
+
+def test_export_history_filters_by_date(store, tmp_path):
+    add_run(store, "old", 0.0)
+    add_run(store, "new", 10 * DAY)
+
+    path = tmp_path / "history.jsonl"
+    assert store.export_history(str(path), since=5 * DAY) == 2
+    assert all('"run_id": "new"' in line for line in path.read_text().splitlines())
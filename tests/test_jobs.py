@@ -0,0 +1,66 @@
+import pytest
+
+from clarity.jobs import JobQueue, JobStage
+from clarity.work_item import WorkItem
+
+
+@pytest.fixture
+def db_path(tmp_path) -> str:
+    return str(tmp_path / "jobs.db")
+
+
+def test_job_advances_through_its_checkpoints(db_path):
+    queue = JobQueue(db_path)
+    job = queue.enqueue("meeting.txt", "default", "Sprint 1")
+    item = WorkItem(
+        title="Add login",
+        description="Why",
+        acceptance_criteria=["1. It works."],
+        task_breakdown=["1. Do it."],
+    )
+
+    queue.mark_generated(job.id, "response")
+    queue.mark_parsed(job.id, [item])
+    queue.mark_saved(job.id)
+    queue.mark_item_posted(job.id, 0, "STUB-1", "stub:project")
+    queue.mark_posted(job.id)
+
+    job = queue.get(job.id)
+    assert job.stage == JobStage.POSTED
+    assert job.response == "response"
+    assert job.work_items == [item]
+    assert job.posted_to("stub:project") == {0: "STUB-1"}
+    assert queue.incomplete() == []
+
+
+def test_attempts_count_errors_at_the_current_stage(db_path):
+    queue = JobQueue(db_path)
+    job = queue.enqueue("meeting.txt", "default", "Sprint 1")
+
+    assert queue.record_error(job.id, "timeout") == 1
+    assert queue.record_error(job.id, "timeout") == 2
+    assert queue.get(job.id).stage == JobStage.PENDING
+    assert queue.get(job.id).error == "timeout"
+
+    queue.mark_generated(job.id, "response")
+    job = queue.get(job.id)
+    assert (job.attempts, job.error) == (0, None)
+
+    queue.record_error(job.id, "parse error")
+    queue.mark_failed(job.id, "parse error")
+    job = queue.get(job.id)
+    assert (job.stage, job.attempts) == (JobStage.FAILED, 1)
+
+
+def test_posted_items_are_tracked_per_target(db_path):
+    queue = JobQueue(db_path)
+    job = queue.enqueue("meeting.txt", "default", "Sprint 1")
+
+    queue.mark_item_posted(job.id, 0, "PLANE-1", "plane/project")
+    queue.mark_item_posted(job.id, 1, "PLANE-2", "plane/project")
+    queue.mark_item_posted(job.id, 0, "AZURE-1", "azure/project")
+
+    job = queue.get(job.id)
+    assert job.posted_to("plane/project") == {0: "PLANE-1", 1: "PLANE-2"}
+    assert job.posted_to("azure/project") == {0: "AZURE-1"}
+    assert job.posted_to("stub/stub") == {}
@@ -0,0 +1,80 @@
+import os
+
+import pytest
+
+from clarity.clients.stub import StubClient
+from clarity.jobs import JobStage
+from clarity.manager import WorkflowManager
+from clarity.targets import PublishTarget
+
+
+@pytest.fixture
+def manager(make_config) -> WorkflowManager:
+    pm = WorkflowManager.stub(make_config())
+    path = os.path.join(pm.config.TRANSCRIPT_PATH, "meeting.txt")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("Alice: we need a login page.\n")
+    return pm
+
+
+def test_run_reaches_posted(manager):
+    job = manager.run("meeting.txt")
+
+    assert job.stage == JobStage.POSTED
+    assert len(manager.store.items.by_run(job.id)) == 3
+    assert len(manager.client.items) == 3
+
+
+def test_missing_transcript_fails_the_job(manager):
+    job = manager.run("missing.txt")
+
+    assert job.stage == JobStage.FAILED
+    assert manager.jobs.incomplete() == []
+
+
+def test_failed_save_stays_parsed_until_resumed(manager, monkeypatch):
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(manager.store.items, "append", fail)
+        job = manager.run("meeting.txt")
+
+    assert job.stage == JobStage.PARSED
+    assert job.attempts == 1
+    assert manager.client.items == {}
+
+    (job,) = manager.resume()
+    assert job.stage == JobStage.POSTED
+    assert len(manager.store.items.by_run(job.id)) == 3
+
+
+class FlakyClient(StubClient):
+    """A stub board that rejects the given create calls (counted from 1)."""
+
+    def __init__(self, failing: set):
+        super().__init__()
+        self.failing = failing
+        self.calls = 0
+
+    def create_work_item(self, workspace, project, work_item, iteration):
+        self.calls += 1
+        if self.calls in self.failing:
+            return None
+        return super().create_work_item(workspace, project, work_item, iteration)
+
+
+def test_resume_only_posts_items_missing_on_each_target(manager):
+    mirror = FlakyClient(failing={2})
+    manager.add_target(PublishTarget(mirror, "stub", "mirror"))
+
+    job = manager.run("meeting.txt")
+    assert job.stage == JobStage.SAVED
+    assert len(job.posted_to("Stub/stub")) == 3
+    assert len(job.posted_to("Stub/mirror")) == 2
+
+    (job,) = manager.resume()
+    assert job.stage == JobStage.POSTED
+    assert len(manager.client.items) == 3
+    assert len(mirror.items) == 3
+    assert mirror.calls == 4
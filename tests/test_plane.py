@@ -0,0 +1,52 @@
+import pytest
+
+from clarity.clients.plane import PlaneClient
+from clarity.work_item import WorkItem
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, data: dict):
+        self.status_code = status_code
+        self._data = data
+        self.text = str(data)
+
+    def json(self) -> dict:
+        return self._data
+
+
+@pytest.fixture
+def client(make_config) -> PlaneClient:
+    return PlaneClient(make_config(PLANE_RESOLVE_FIELDS="false"))
+
+
+def respond(client: PlaneClient, monkeypatch, response: FakeResponse) -> None:
+    monkeypatch.setattr(
+        client.resilience, "request", lambda method, url, **kwargs: response
+    )
+
+
+def make_item() -> WorkItem:
+    return WorkItem(
+        title="Add login",
+        description="Why",
+        acceptance_criteria=["1. It works."],
+        task_breakdown=["1. Do it."],
+    )
+
+
+def test_create_returns_the_remote_id(client, monkeypatch):
+    respond(client, monkeypatch, FakeResponse(201, {"id": "uuid-1", "name": "PRJ-1"}))
+
+    assert client.create_work_item("ws", "project", make_item()) == "uuid-1"
+
+
+def test_create_without_an_id_fails(client, monkeypatch):
+    respond(client, monkeypatch, FakeResponse(201, {"name": "PRJ-1"}))
+
+    assert client.create_work_item("ws", "project", make_item()) is None
+
+
+def test_rejected_create_fails(client, monkeypatch):
+    respond(client, monkeypatch, FakeResponse(400, {"detail": "bad request"}))
+
+    assert client.create_work_item("ws", "project", make_item()) is None
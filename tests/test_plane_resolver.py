@@ -0,0 +1,148 @@
+from collections import Counter
+from typing import Optional
+
+import pytest
+
+from clarity.clients.plane import PlaneClient
+from clarity.clients.plane_resolver import PlaneResolver
+from clarity.work_item import WorkItem
+
+LISTS = {
+    "states": [{"id": "state-1", "name": "Backlog"}],
+    "labels": [{"id": "label-1", "name": "API"}],
+    "modules": [{"id": "module-1", "name": "Core"}],
+    "members": [{"member": {"id": "member-1", "display_name": "alice"}}],
+    "issue-types": [{"id": "type-1", "name": "Bug"}],
+}
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, data=None):
+        self.status_code = status_code
+        self._data = data
+        self.text = str(data)
+
+    def json(self):
+        return self._data
+
+
+class FakePlane:
+    """Serves the project lists a resolver fetches and counts every request."""
+
+    def __init__(self, missing: Optional[str] = None):
+        self.host_url = "http://plane"
+        self.headers: dict = {}
+        self.resilience = self
+        self.missing = missing
+        self.requests: Counter = Counter()
+
+    def request(self, method: str, url: str, **kwargs) -> FakeResponse:
+        resource = url.rstrip("/").rsplit("/", 1)[-1]
+        self.requests[(method, resource)] += 1
+
+        if method == "POST":
+            return FakeResponse(201, {"id": f"new-{kwargs['json']['name']}"})
+        if resource == self.missing:
+            return FakeResponse(404, {"detail": "Not found."})
+        return FakeResponse(200, {"results": LISTS[resource]})
+
+
+def make_item(component: Optional[str] = None, task_type: str = "Task") -> WorkItem:
+    return WorkItem(
+        title="Add login",
+        description="Why",
+        acceptance_criteria=["1. It works."],
+        task_breakdown=["1. Do it."],
+        task_type=task_type,
+        component=component,
+    )
+
+
+@pytest.fixture
+def config(make_config):
+    return make_config(
+        PLANE_DEFAULT_STATE="backlog",
+        PLANE_DEFAULT_PRIORITY="High",
+        PLANE_DEFAULT_MODULE="Core",
+        PLANE_DEFAULT_ASSIGNEES="Alice, bob",
+    )
+
+
+def test_enrich_resolves_names_to_ids(config):
+    resolver = PlaneResolver(FakePlane(), config)
+
+    payload = resolver.enrich(
+        "ws", "project", {"name": "Add login"}, make_item("api", "Fix")
+    )
+
+    assert payload == {
+        "name": "Add login",
+        "priority": "high",
+        "state": "state-1",
+        "labels": ["label-1"],
+        "assignees": ["member-1"],
+        "module": "module-1",
+        "type": "type-1",
+    }
+
+
+def test_catalog_is_fetched_once_per_ttl(config):
+    plane = FakePlane()
+    resolver = PlaneResolver(plane, config)
+
+    for _ in range(5):
+        resolver.enrich("ws", "project", {}, make_item("API"))
+
+    assert set(plane.requests.values()) == {1}
+    assert len(plane.requests) == len(LISTS)
+
+
+def test_unavailable_list_is_not_refetched_on_every_lookup(config):
+    plane = FakePlane(missing="issue-types")
+    resolver = PlaneResolver(plane, config)
+
+    for _ in range(5):
+        payload = resolver.enrich("ws", "project", {}, make_item("API"))
+
+    assert "type" not in payload
+    assert payload["state"] == "state-1"
+    assert sum(plane.requests.values()) == len(LISTS)
+
+
+def test_failed_list_is_retried_after_the_failed_fetch_ttl(config, monkeypatch):
+    plane = FakePlane(missing="issue-types")
+    resolver = PlaneResolver(plane, config)
+    monkeypatch.setattr(PlaneResolver, "FAILED_FETCH_TTL", 0.0)
+
+    resolver.enrich("ws", "project", {}, make_item())
+    plane.missing = None
+    payload = resolver.enrich("ws", "project", {}, make_item(task_type="Fix"))
+
+    assert payload["type"] == "type-1"
+    assert plane.requests[("GET", "issue-types")] == 2
+    assert plane.requests[("GET", "states")] == 1
+
+
+def test_missing_label_is_created_once(config):
+    plane = FakePlane()
+    resolver = PlaneResolver(plane, config)
+
+    first = resolver.label_id("ws", "project", "Frontend")
+    second = resolver.label_id("ws", "project", "frontend")
+
+    assert first == second == "new-Frontend"
+    assert plane.requests[("POST", "labels")] == 1
+
+
+def test_sync_fields_fall_back_when_resolution_fails(config, monkeypatch):
+    client = PlaneClient(config)
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("unexpected catalog")
+
+    monkeypatch.setattr(client.resolver, "enrich", fail)
+    item = make_item()
+
+    assert client.sync_fields("ws", "project", item, "") == (
+        item.to_plane_json_payload()
+    )
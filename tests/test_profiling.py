@@ -0,0 +1,86 @@
+import os
+import pstats
+import tracemalloc
+
+import pytest
+
+from clarity.profiling import RunProfiler, StageProfile
+
+
+def allocate() -> list:
+    return [str(i) * 10 for i in range(20000)]
+
+
+def test_each_stage_writes_cpu_and_memory_profiles(tmp_path):
+    profiler = RunProfiler("run-1", str(tmp_path))
+
+    with profiler.stage("parse"):
+        data = allocate()
+    profiler.finish()
+
+    assert data
+    stats = pstats.Stats(str(tmp_path / "parse.prof"))
+    assert any(function == "allocate" for _, _, function in stats.stats)
+    assert tracemalloc.Snapshot.load(str(tmp_path / "parse.tracemalloc")).traces
+
+    stage = profiler.stages[0]
+    assert stage.name == "parse"
+    assert stage.seconds > 0
+    assert stage.peak_bytes > 0
+    assert stage.cpu_lines and stage.memory_lines
+
+
+def test_finish_writes_and_returns_the_report(tmp_path):
+    profiler = RunProfiler("run-2", str(tmp_path))
+
+    with profiler.stage("generate"):
+        allocate()
+    with profiler.stage("post"):
+        pass
+    report = profiler.finish()
+
+    assert report.startswith("Profile of run run-2")
+    assert "Stage generate:" in report and "Stage post:" in report
+    with open(tmp_path / "report.txt", encoding="utf-8") as f:
+        assert f.read() == report + "\n"
+
+
+def test_stage_is_recorded_when_it_raises(tmp_path):
+    profiler = RunProfiler("run-3", str(tmp_path))
+
+    with pytest.raises(RuntimeError):
+        with profiler.stage("post"):
+            raise RuntimeError("upload failed")
+    profiler.finish()
+
+    assert [stage.name for stage in profiler.stages] == ["post"]
+    assert os.path.exists(tmp_path / "post.tracemalloc")
+
+
+def test_tracing_stops_once_every_profiler_finished(tmp_path):
+    assert not tracemalloc.is_tracing()
+
+    first = RunProfiler("a", str(tmp_path / "a"))
+    second = RunProfiler("b", str(tmp_path / "b"))
+    first.finish()
+    assert tracemalloc.is_tracing()
+
+    second.finish()
+    assert not tracemalloc.is_tracing()
+
+
+def test_summary_lists_cpu_and_memory_lines():
+    stage = StageProfile("parse")
+    stage.seconds = 1.5
+    stage.peak_bytes = 3 * 1024 * 1024
+    stage.cpu_lines = ["cpu line"]
+    stage.memory_lines = ["memory line"]
+
+    assert stage.summary().splitlines() == [
+        "Stage parse: 1.50s, peak +3.0 MiB",
+        "  CPU (cumulative time):",
+        "    cpu line",
+        "  Memory (allocation growth):",
+        "    memory line",
+    ]
+    assert StageProfile("idle").summary() == "Stage idle: 0.00s, peak +0.0 MiB"
@@ -0,0 +1,179 @@
+import socket
+import time
+
+import pytest
+import requests
+
+from clarity.clients.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    Resilience,
+    RetryableError,
+    TokenBucket,
+)
+
+
+def make_resilience(**kwargs) -> Resilience:
+    options = dict(rate=0, max_retries=2, backoff_base=0, failure_threshold=2)
+    options.update(kwargs)
+    return Resilience("test-host", **options)
+
+
+def fail_with(error: BaseException):
+    calls = []
+
+    def fn():
+        calls.append(1)
+        raise error
+
+    return fn, calls
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold_consecutive_failures(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_lets_a_single_trial_through(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+
+        assert breaker.allow()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert not breaker.allow()
+
+    def test_half_open_trial_outcome_closes_or_reopens(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+
+        breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+        breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_release_frees_the_half_open_trial(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+
+        assert breaker.allow()
+        breaker.release()
+
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow()
+
+
+class TestResilience:
+    def test_retries_then_succeeds(self):
+        resilience = make_resilience()
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise RetryableError("HTTP 503")
+            return "ok"
+
+        assert resilience.call(flaky) == "ok"
+        assert len(attempts) == 3
+        assert resilience.breaker.state == CircuitBreaker.CLOSED
+
+    def test_counts_one_breaker_failure_per_call(self):
+        resilience = make_resilience(failure_threshold=2)
+        fn, calls = fail_with(RetryableError("HTTP 500"))
+
+        with pytest.raises(RetryableError):
+            resilience.call(fn)
+
+        # Three attempts, but only one failed call
+        assert len(calls) == 3
+        assert resilience.breaker.state == CircuitBreaker.CLOSED
+
+        with pytest.raises(RetryableError):
+            resilience.call(fn)
+        assert resilience.breaker.state == CircuitBreaker.OPEN
+
+        with pytest.raises(CircuitOpenError):
+            resilience.call(fn)
+
+    def test_non_retryable_error_does_not_wedge_half_open_breaker(self):
+        resilience = make_resilience(failure_threshold=1, reset_timeout=0)
+        resilience.breaker.record_failure()
+
+        with pytest.raises(ValueError):
+            resilience.call(fail_with(ValueError("bad payload"))[0])
+
+        assert resilience.call(lambda: "ok") == "ok"
+        assert resilience.breaker.state == CircuitBreaker.CLOSED
+
+    def test_non_idempotent_call_is_not_resent_after_processing_error(self):
+        resilience = make_resilience()
+        fn, calls = fail_with(RetryableError("HTTP 500"))
+
+        with pytest.raises(RetryableError):
+            resilience.call(fn, idempotent=False)
+
+        assert len(calls) == 1
+
+    def test_non_idempotent_call_is_resent_when_unprocessed(self):
+        resilience = make_resilience()
+        fn, calls = fail_with(RetryableError("HTTP 429", unprocessed=True))
+
+        with pytest.raises(RetryableError):
+            resilience.call(fn, idempotent=False)
+
+        assert len(calls) == 3
+
+    def test_hung_host_times_out_into_retry_and_breaker(self):
+        resilience = make_resilience(max_retries=1, failure_threshold=1, timeout=0.1)
+
+        # Accepts connections but never answers
+        with socket.socket() as server:
+            server.bind(("127.0.0.1", 0))
+            server.listen(8)
+            url = f"http://127.0.0.1:{server.getsockname()[1]}/"
+
+            start = time.monotonic()
+            with pytest.raises(requests.ConnectionError):
+                resilience.request("GET", url)
+
+        assert time.monotonic() - start < 5
+        assert resilience.breaker.state == CircuitBreaker.OPEN
+
+
+class TestTokenBucket:
+    def test_burst_is_immediate_then_rate_limited(self):
+        bucket = TokenBucket(rate=20, capacity=3)
+
+        start = time.monotonic()
+        for _ in range(3):
+            bucket.acquire()
+        assert time.monotonic() - start < 0.04
+
+        bucket.acquire()
+        assert time.monotonic() - start >= 0.04
+
+    def test_zero_rate_disables_limiting(self):
+        bucket = TokenBucket(rate=0, capacity=1)
+
+        start = time.monotonic()
+        for _ in range(100):
+            bucket.acquire()
+        assert time.monotonic() - start < 0.05
@@ -0,0 +1,105 @@
+from typing import Dict, List, Optional
+
+import pytest
+
+from clarity.agents.interface import IAgent
+from clarity.agents.router import RoutingAgent, parse_routes
+from clarity.prompt import PromptType
+from clarity.work_item import WorkItem, WorkItemList
+
+VALID = WorkItemList(work_items=[WorkItem.create_dummy_item()]).model_dump_json()
+EMPTY = WorkItemList(work_items=[]).model_dump_json()
+
+
+class ScriptedAgent(IAgent):
+    """Returns a fixed response and records the transcripts it was asked about."""
+
+    def __init__(self, model: str, response: str) -> None:
+        self.model_name = model
+        self.response = response
+        self.calls: List[str] = []
+
+    def generate_work_items(
+        self,
+        prompt: str,
+        transcript: str,
+        prompt_type: Optional[PromptType] = None,
+    ) -> str:
+        self.calls.append(transcript)
+        return self.response
+
+
+def make_router(responses: Dict[str, str], spec: str, escalate: bool = True):
+    agents = {model: ScriptedAgent(model, text) for model, text in responses.items()}
+    router = RoutingAgent(parse_routes(spec), agents.__getitem__, escalate=escalate)
+    return router, agents
+
+
+def test_parse_routes_reads_limits_models_and_prompt_types():
+    routes = parse_routes("A|B/2000=small:3b; 8000=medium:latest ;*=large:70b;")
+
+    assert [r.model for r in routes] == ["small:3b", "medium:latest", "large:70b"]
+    assert [r.max_tokens for r in routes] == [2000, 8000, None]
+    assert routes[0].prompt_types == frozenset({PromptType.A, PromptType.B})
+    assert routes[1].prompt_types is None
+
+
+@pytest.mark.parametrize("spec", ["2000", "2000=", "many=small", "D/100=small"])
+def test_parse_routes_rejects_invalid_entries(spec):
+    with pytest.raises(ValueError):
+        parse_routes(spec)
+
+
+def test_requests_route_by_token_count_and_prompt_type():
+    router, agents = make_router(
+        {"small": VALID, "large": VALID}, "A/100=small; *=large"
+    )
+
+    router.generate_work_items("prompt", "short", PromptType.A)
+    router.generate_work_items("prompt", "short", PromptType.C)
+    router.generate_work_items("prompt", "x" * 1000, PromptType.A)
+
+    assert agents["small"].calls == ["short"]
+    assert len(agents["large"].calls) == 2
+
+
+def test_unusable_response_escalates_to_the_next_larger_model():
+    router, agents = make_router(
+        {"small": "not json", "medium": EMPTY, "large": VALID},
+        "100=small; 200=medium; *=large",
+    )
+
+    assert router.generate_work_items("prompt", "short") == VALID
+    assert [len(a.calls) for a in agents.values()] == [1, 1, 1]
+    assert router.last_stats() is None
+
+
+def test_escalation_skips_larger_routes_that_do_not_accept_the_request():
+    router, agents = make_router(
+        {"small": EMPTY, "medium": VALID, "large": VALID},
+        "100=small; B/*=medium; *=large",
+    )
+
+    assert router.generate_work_items("prompt", "short", PromptType.A) == VALID
+    assert agents["medium"].calls == []
+    assert agents["large"].calls == ["short"]
+
+
+def test_without_escalation_the_first_response_is_returned():
+    router, agents = make_router(
+        {"small": EMPTY, "large": VALID}, "100=small; *=large", escalate=False
+    )
+
+    assert router.generate_work_items("prompt", "short") == EMPTY
+    assert agents["large"].calls == []
+
+
+def test_oversized_request_falls_back_to_the_largest_model():
+    router, agents = make_router(
+        {"small": VALID, "medium": VALID}, "10=small; 20=medium"
+    )
+
+    router.generate_work_items("prompt", "x" * 1000)
+
+    assert agents["small"].calls == []
+    assert len(agents["medium"].calls) == 1
@@ -0,0 +1,136 @@
+import threading
+import time
+from typing import List
+
+from clarity.scheduler import (
+    FairScheduler,
+    PriorityClass,
+    SharedPriority,
+    shared_priority,
+)
+
+INTERACTIVE = PriorityClass.INTERACTIVE
+BULK = PriorityClass.BULK
+
+
+class Recorder:
+    """Queues requests behind a held slot and records the order they are granted."""
+
+    def __init__(self, scheduler: FairScheduler):
+        self.scheduler = scheduler
+        self.order: List[str] = []
+        self.threads: List[threading.Thread] = []
+        self.held = scheduler.acquire(INTERACTIVE)
+
+    def submit(self, name: str, priority: PriorityClass, tenant: str = "", shared=None):
+        def run() -> None:
+            if shared is None:
+                waiter = self.scheduler.acquire(priority, tenant)
+            else:
+                with shared_priority(shared):
+                    waiter = self.scheduler.acquire(priority, tenant)
+            self.order.append(name)
+            self.scheduler.release(waiter.priority)
+
+        queued = self.queued()
+        thread = threading.Thread(target=run)
+        self.threads.append(thread)
+        thread.start()
+        wait_until(lambda: self.queued() == queued + 1)
+
+    def queued(self) -> int:
+        classes = self.scheduler.metrics()["classes"]
+        return sum(c["queued"] for c in classes.values())
+
+    def run(self) -> List[str]:
+        self.scheduler.release(self.held.priority)
+        for thread in self.threads:
+            thread.join(5)
+        return self.order
+
+
+def wait_until(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.001)
+
+
+def test_interactive_is_served_before_bulk():
+    recorder = Recorder(FairScheduler("test-host", slots=1))
+
+    recorder.submit("bulk-1", BULK)
+    recorder.submit("bulk-2", BULK)
+    recorder.submit("interactive", INTERACTIVE)
+
+    assert recorder.run() == ["interactive", "bulk-1", "bulk-2"]
+
+
+def test_tenants_are_served_round_robin():
+    recorder = Recorder(FairScheduler("test-host", slots=1))
+
+    recorder.submit("a-1", BULK, "a")
+    recorder.submit("a-2", BULK, "a")
+    recorder.submit("a-3", BULK, "a")
+    recorder.submit("b-1", BULK, "b")
+
+    assert recorder.run() == ["a-1", "b-1", "a-2", "a-3"]
+
+
+def test_starved_bulk_request_is_served_first():
+    recorder = Recorder(FairScheduler("test-host", slots=1, starvation_seconds=0))
+
+    recorder.submit("bulk", BULK)
+    time.sleep(0.01)
+    recorder.submit("interactive", INTERACTIVE)
+
+    assert recorder.run() == ["bulk", "interactive"]
+
+
+def test_shared_priority_promotes_a_waiting_request():
+    recorder = Recorder(FairScheduler("test-host", slots=1))
+    shared = SharedPriority(BULK)
+
+    recorder.submit("shared", BULK, "a", shared=shared)
+    recorder.submit("other-bulk", BULK, "b")
+    recorder.submit("interactive", INTERACTIVE)
+    shared.raise_to(INTERACTIVE)
+
+    assert recorder.run() == ["interactive", "shared", "other-bulk"]
+
+
+def test_shared_priority_never_lowers():
+    shared = SharedPriority(INTERACTIVE)
+
+    shared.raise_to(BULK)
+
+    assert shared.priority == INTERACTIVE
+
+
+def test_slots_limit_concurrent_requests():
+    scheduler = FairScheduler("test-host", slots=2)
+    first = scheduler.acquire(BULK)
+    second = scheduler.acquire(BULK)
+
+    thread = threading.Thread(target=lambda: scheduler.acquire(BULK))
+    thread.start()
+    wait_until(lambda: scheduler.metrics()["classes"]["bulk"]["queued"] == 1)
+    assert scheduler.metrics()["in_flight"] == 2
+
+    scheduler.release(first.priority)
+    thread.join(5)
+    scheduler.release(second.priority)
+    assert scheduler.metrics()["in_flight"] == 1
+
+
+def test_metrics_report_waits_per_class():
+    recorder = Recorder(FairScheduler("test-host", slots=1))
+    recorder.submit("bulk", BULK)
+    time.sleep(0.02)
+    recorder.run()
+
+    bulk = recorder.scheduler.metrics()["classes"]["bulk"]
+    assert bulk["admitted"] == 1
+    assert bulk["running"] == 0
+    assert bulk["wait_max"] >= 0.02
+    assert bulk["wait_p95"] == bulk["wait_max"]
@@ -0,0 +1,137 @@
+import http.client
+import json
+import os
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from clarity.jobs import JobStage
+from clarity.manager import WorkflowManager
+from clarity.service import ServiceRequestHandler, WorkflowService
+
+
+@pytest.fixture
+def manager(make_config) -> WorkflowManager:
+    pm = WorkflowManager.stub(make_config())
+    path = os.path.join(pm.config.TRANSCRIPT_PATH, "meeting.txt")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("Alice: we need a login page.\n")
+    return pm
+
+
+@pytest.fixture
+def serve(manager):
+    """Starts the HTTP API for a service with the given pool sizes."""
+    servers = []
+
+    def start(workers: int = 2, queue_size: int = 4) -> int:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), ServiceRequestHandler)
+        server.service = WorkflowService(manager, workers, queue_size)
+        threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True).start()
+        servers.append(server)
+        return server.server_port
+
+    yield start
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+        server.service.executor.shutdown(wait=True)
+
+
+def request(port: int, method: str, path: str, body=None, headers=None):
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    data = json.dumps(body).encode() if body is not None else None
+    connection.request(method, path, body=data, headers=headers or {})
+    response = connection.getresponse()
+    payload = json.loads(response.read() or b"{}")
+    connection.close()
+    return response.status, payload
+
+
+def wait_for_stage(port: int, job_id: str, stage: JobStage) -> dict:
+    deadline = time.monotonic() + 5
+    while True:
+        _, job = request(port, "GET", f"/jobs/{job_id}")
+        if job["stage"] == stage.value or time.monotonic() > deadline:
+            return job
+        time.sleep(0.01)
+
+
+def test_submitted_transcript_is_processed(serve):
+    port = serve()
+
+    status, job = request(
+        port, "POST", "/jobs", {"transcript": "Bob: fix the crash.", "tenant": "a"}
+    )
+    assert status == 202
+
+    assert wait_for_stage(port, job["id"], JobStage.POSTED)["stage"] == "posted"
+    status, items = request(port, "GET", f"/jobs/{job['id']}/work_items")
+    assert status == 200
+    assert len(items["work_items"]) == 3
+
+
+def test_existing_file_can_be_submitted(serve):
+    port = serve()
+
+    status, job = request(port, "POST", "/jobs", {"filename": "meeting.txt"})
+
+    assert status == 202
+    assert job["transcript_filename"] == "meeting.txt"
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"transcript": ["not", "text"]},
+        {"transcript": "text", "iteration": 3},
+        {"transcript": "text", "tenant": {"name": "a"}},
+        {"transcript": "text", "priority": "urgent"},
+        {"transcript": "text", "prompt_type": "unknown"},
+        {"filename": "../secrets.txt"},
+        {},
+    ],
+)
+def test_invalid_submissions_are_rejected(serve, body):
+    status, payload = request(serve(), "POST", "/jobs", body)
+
+    assert status == 400
+    assert "error" in payload
+
+
+def test_invalid_content_length_is_rejected(serve):
+    status, _ = request(
+        serve(), "POST", "/jobs", {"filename": "meeting.txt"}, {"Content-Length": "abc"}
+    )
+
+    assert status == 400
+
+
+def test_missing_file_and_unknown_job_are_not_found(serve):
+    port = serve()
+
+    assert request(port, "POST", "/jobs", {"filename": "missing.txt"})[0] == 404
+    assert request(port, "GET", "/jobs/unknown")[0] == 404
+    assert request(port, "GET", "/unknown")[0] == 404
+
+
+def test_full_queue_is_rejected(serve, manager, monkeypatch):
+    release = threading.Event()
+    process_job = manager.process_job
+
+    def blocked(job):
+        release.wait(5)
+        process_job(job)
+
+    monkeypatch.setattr(manager, "process_job", blocked)
+    port = serve(workers=1, queue_size=1)
+
+    first, job = request(port, "POST", "/jobs", {"filename": "meeting.txt"})
+    second, _ = request(port, "POST", "/jobs", {"filename": "meeting.txt"})
+    release.set()
+
+    assert (first, second) == (202, 503)
+    assert wait_for_stage(port, job["id"], JobStage.POSTED)["stage"] == "posted"
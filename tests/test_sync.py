@@ -0,0 +1,92 @@
+import pytest
+
+from clarity.clients.stub import StubClient
+from clarity.item_store import WorkItemStore
+from clarity.sync import (
+    WorkItemSynchronizer,
+    fingerprint,
+    normalize_title,
+    title_occurrences,
+)
+from clarity.work_item import WorkItem
+
+
+def make_item(title: str, description: str = "Why it matters") -> WorkItem:
+    return WorkItem(
+        title=title,
+        description=description,
+        acceptance_criteria=["1. It works."],
+        task_breakdown=["1. Do it."],
+    )
+
+
+@pytest.fixture
+def synchronizer(tmp_path) -> WorkItemSynchronizer:
+    store = WorkItemStore(str(tmp_path / "work_items.db"))
+    return WorkItemSynchronizer(StubClient(), store)
+
+
+def sync(synchronizer: WorkItemSynchronizer, items):
+    return synchronizer.sync(
+        "workspace", "project", "meeting.txt", dict(enumerate(items)), "Sprint 1"
+    )
+
+
+def test_normalize_title_ignores_case_and_punctuation():
+    assert normalize_title("Fix: Enable  dark-mode!") == "fix enable dark mode"
+
+
+def test_title_occurrences_count_earlier_duplicates():
+    items = [make_item("Add login"), make_item("Fix bug"), make_item("add LOGIN")]
+
+    assert title_occurrences(items) == [0, 0, 1]
+
+
+def test_fingerprint_distinguishes_repeated_titles():
+    item = make_item("Add login")
+
+    assert fingerprint("meeting.txt", item) == fingerprint(
+        "meeting.txt", make_item("add login!")
+    )
+    assert fingerprint("meeting.txt", item) != fingerprint("meeting.txt", item, 1)
+    assert fingerprint("meeting.txt", item) != fingerprint("other.txt", item)
+
+
+def test_first_sync_creates_then_resync_is_unchanged(synchronizer):
+    items = [make_item("Add login"), make_item("Fix crash")]
+
+    first = sync(synchronizer, items)
+    second = sync(synchronizer, items)
+
+    assert (first.created, first.updated, first.unchanged) == (2, 0, 0)
+    assert (second.created, second.updated, second.unchanged) == (0, 0, 2)
+    assert second.remote_ids == first.remote_ids
+
+
+def test_changed_fields_are_patched(synchronizer):
+    first = sync(synchronizer, [make_item("Add login")])
+    second = sync(synchronizer, [make_item("Add login", "A clearer reason")])
+
+    assert (second.created, second.updated) == (0, 1)
+    remote_id = first.remote_ids[0]
+    assert synchronizer.client.items[remote_id].description == "A clearer reason"
+
+
+def test_reworded_title_matches_fuzzily(synchronizer):
+    first = sync(synchronizer, [make_item("Add login page for users")])
+    second = sync(synchronizer, [make_item("Add a login page for users")])
+
+    assert (second.created, second.updated) == (0, 1)
+    assert second.remote_ids == first.remote_ids
+
+
+def test_duplicate_titles_are_not_recreated(synchronizer):
+    items = [make_item("Follow up"), make_item("Follow up"), make_item("Follow up")]
+
+    first = sync(synchronizer, items)
+    second = sync(synchronizer, items)
+
+    assert first.created == 3
+    assert (second.created, second.unchanged) == (0, 3)
+    assert len(synchronizer.client.items) == 3
+    assert len(set(second.remote_ids.values())) == 3
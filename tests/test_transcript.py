@@ -0,0 +1,60 @@
+import gzip
+
+from clarity.transcript import TranscriptReader
+
+CAPTIONS = (
+    "WEBVTT\n"
+    "\n"
+    "NOTE recorded by the meeting bot\n"
+    "\n"
+    "00:00:01.000 --> 00:00:04.000\n"
+    "We need a login page.\n"
+    "\n"
+    "00:00:05.000 --> 00:00:08.000\n"
+    "And a fix for the crash.\n"
+)
+
+
+def write(path, text: str) -> str:
+    path.write_bytes(text.encode("utf-8"))
+    return str(path)
+
+
+def test_plain_transcript_is_kept_verbatim(tmp_path):
+    text = "NOTE: ship before Friday\n1\nAlice: agreed\n"
+
+    assert TranscriptReader(write(tmp_path / "meeting.txt", text)).read() == text
+
+
+def test_caption_metadata_is_stripped(tmp_path):
+    text = TranscriptReader(write(tmp_path / "meeting.vtt", CAPTIONS)).read()
+
+    assert "We need a login page." in text
+    assert "And a fix for the crash." in text
+    assert "-->" not in text
+    assert "NOTE" not in text
+
+
+def test_captions_are_detected_by_content(tmp_path):
+    path = tmp_path / "meeting.txt.gz"
+    path.write_bytes(gzip.compress(CAPTIONS.encode("utf-8")))
+
+    assert "-->" not in TranscriptReader(str(path)).read()
+
+
+def test_memory_mapped_lines_normalize_line_endings(tmp_path):
+    path = write(tmp_path / "meeting.txt", "first\r\nsecond\rthird\nlast")
+
+    mapped = TranscriptReader(path, mmap_threshold=0).read()
+    streamed = TranscriptReader(path, mmap_threshold=1 << 30).read()
+
+    assert mapped == streamed == "first\nsecond\nthird\nlast"
+
+
+def test_segments_split_on_line_boundaries(tmp_path):
+    path = write(tmp_path / "meeting.txt", "aaaa\nbbbb\ncccccccccc\n")
+
+    segments = list(TranscriptReader(path).iter_segments(10))
+
+    assert segments == ["aaaa\nbbbb\n", "cccccccccc", "\n"]
+    assert "".join(segments) == "aaaa\nbbbb\ncccccccccc\n"